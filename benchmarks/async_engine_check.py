@@ -0,0 +1,237 @@
+"""
+End-to-end check of the asyncssh collection engine against local SSH servers
+Starts in-process asyncssh servers on 127.0.0.1 that answer the platform's
+telemetry commands with the recorded outputs in benchmarks/fixtures, then runs
+AsyncCollectionEngine (collect_many) and AsyncConnectionManager against them and
+checks every table comes back parsed and normalized to the same row count as the
+in-process parse/normalize path.
+
+Runs fully offline and exits non-zero if any check fails:
+
+    python benchmarks/async_engine_check.py
+    python benchmarks/async_engine_check.py --devices 20 --rows 500 --platform arista_eos
+"""
+
+import argparse
+import asyncio
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from telemetry_bench import BENCH_TABLES, load_fixture  # noqa: E402
+
+try:
+    import asyncssh
+    ASYNCSSH_AVAILABLE = True
+except ImportError:
+    ASYNCSSH_AVAILABLE = False
+
+USERNAME = 'telemetry'
+PASSWORD = 'check'
+
+
+class _NullWriter(io.TextIOBase):
+    """stdout sink for the engine's per-row logging"""
+
+    def write(self, text):
+        return len(text)
+
+
+def build_responses(platform_config, platform: str, rows: int) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """
+    Command outputs the fake device answers with
+
+    Returns:
+        (command -> output, command_type -> normalized row count of the in-process
+        parse/normalize path) for every benchmarked table of the platform with a fixture
+    """
+    from termtel.termtelwidgets.netmiko_controller import ConfigDrivenFieldNormalizer, shared_template_parser
+
+    normalizer = ConfigDrivenFieldNormalizer(platform_config)
+    responses = {}
+    expected = {}
+    for table, (normalizer_method, _, _) in BENCH_TABLES.items():
+        template_entry = platform_config.get_template_entry(platform, table)
+        if not template_entry:
+            continue
+        fixture = load_fixture(template_entry.template_file.replace('.textfsm', ''))
+        if fixture is None:
+            continue
+        command = platform_config.format_command(platform, table)
+        responses[command] = fixture.render(rows)
+
+        # Reference result: the same output through the in-process pipeline
+        with redirect_stdout(_NullWriter()):
+            parsed = shared_template_parser.parse(
+                template_entry.template_platform, template_entry.template_command, responses[command])
+            if table == 'cdp_neighbors':
+                normalized = normalizer.normalize_neighbors(parsed, platform, command)
+            else:
+                normalized = getattr(normalizer, normalizer_method)(parsed, platform)
+        expected[table] = len(normalized or [])
+    return responses, expected
+
+
+class _FakeDeviceServer(asyncssh.SSHServer if ASYNCSSH_AVAILABLE else object):
+    """Password-only SSH server"""
+
+    def begin_auth(self, username):
+        return True
+
+    def password_auth_supported(self):
+        return True
+
+    def validate_password(self, username, password):
+        return username == USERNAME and password == PASSWORD
+
+
+async def start_servers(count: int, responses: Dict[str, str]) -> List:
+    """Start count SSH servers on ephemeral ports, each answering exec commands from responses"""
+
+    async def handle_exec(process):
+        output = responses.get((process.command or '').strip())
+        if output is None:
+            process.stderr.write(f"% Invalid input: {process.command}\n")
+            process.exit(1)
+        else:
+            process.stdout.write(output)
+            process.exit(0)
+
+    host_key = asyncssh.generate_private_key('ssh-ed25519')
+    servers = []
+    for _ in range(count):
+        servers.append(await asyncssh.create_server(
+            _FakeDeviceServer, '127.0.0.1', 0,
+            server_host_keys=[host_key], process_factory=handle_exec
+        ))
+    return servers
+
+
+async def stop_servers(servers: List):
+    """Close the servers on the loop that owns them"""
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+
+def server_port(server) -> int:
+    return server.sockets[0].getsockname()[1]
+
+
+class Checker:
+    """Collects check results, printing one line per check"""
+
+    def __init__(self):
+        self.failures = 0
+
+    def check(self, condition: bool, message: str):
+        print(f"  {'ok  ' if condition else 'FAIL'} {message}")
+        if not condition:
+            self.failures += 1
+
+
+def check_result(checker: Checker, result, expected: Dict[str, int]):
+    """Every expected table was collected, parsed and normalized to the reference row count"""
+    label = f"{result.device_ip}:{result.port}"
+    checker.check(not result.error_message, f"{label} collected without error {result.error_message!r}")
+    for table, rows in expected.items():
+        raw = result.outputs.get(table)
+        checker.check(raw is not None and raw.parsed_successfully, f"{label} {table} parsed")
+        normalized = result.normalized.get(table) or []
+        checker.check(len(normalized) == rows, f"{label} {table} normalized {len(normalized)}/{rows} rows")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check the asyncssh collection engine against local SSH servers")
+    parser.add_argument('--platform', default='cisco_ios', help="Platform whose commands and fixtures to serve")
+    parser.add_argument('--devices', type=int, default=5, help="Simulated devices (one server each)")
+    parser.add_argument('--rows', type=int, default=50, help="Rows per table")
+    args = parser.parse_args(argv)
+
+    if not ASYNCSSH_AVAILABLE:
+        print("asyncssh is not installed, nothing to check")
+        return 1
+
+    from termtel.termtelwidgets.async_collector import AsyncCollectionEngine, AsyncConnectionManager
+    from termtel.termtelwidgets.netmiko_controller import ConnectionCredentials, DeviceInfo
+    from termtel.termtelwidgets.platform_config_manager import PlatformConfigManager
+
+    with redirect_stdout(_NullWriter()):
+        platform_config = PlatformConfigManager()
+    responses, expected = build_responses(platform_config, args.platform, args.rows)
+    if not expected:
+        print(f"No fixtures for {args.platform}, nothing to check")
+        return 1
+
+    engine = AsyncCollectionEngine(platform_config)
+    engine.start()
+    checker = Checker()
+    try:
+        servers = engine.run(start_servers(args.devices, responses))
+        ports = [server_port(server) for server in servers]
+        credentials = [ConnectionCredentials(username=USERNAME, password=PASSWORD, port=port) for port in ports]
+        print(f"Serving {', '.join(expected)} for {args.platform} on {len(ports)} local servers")
+
+        # Engine API: connect every device, then one concurrent collection cycle
+        print("AsyncCollectionEngine")
+        for index, creds in enumerate(credentials):
+            device = DeviceInfo(hostname=f"device-{index}", ip_address='127.0.0.1', platform=args.platform)
+            with redirect_stdout(_NullWriter()):
+                connected = engine.run(engine.connect(device, creds))
+            checker.check(connected, f"connect 127.0.0.1:{creds.port}")
+
+        start = time.perf_counter()
+        with redirect_stdout(_NullWriter()):
+            results = engine.run(engine.collect_many(
+                [('127.0.0.1', port, args.platform) for port in ports], list(expected)))
+        elapsed = time.perf_counter() - start
+        for result in results:
+            check_result(checker, result, expected)
+        print(f"  collect_many: {len(results)} devices in {elapsed:.2f}s")
+
+        bad_creds = ConnectionCredentials(username=USERNAME, password='wrong', port=ports[0])
+        bad_device = DeviceInfo(hostname="bad-password", ip_address='127.0.0.1', platform=args.platform)
+        with redirect_stdout(_NullWriter()):
+            rejected = not engine.run(engine.connect(bad_device, bad_creds))
+        checker.check(rejected, "wrong password is rejected")
+
+        with redirect_stdout(_NullWriter()):
+            engine.run(engine.disconnect_all())
+        checker.check(not engine.connections, "disconnect_all closes every session")
+
+        # Blocking manager API, as the controllers use it
+        print("AsyncConnectionManager")
+        manager = AsyncConnectionManager(engine)
+        device = DeviceInfo(hostname="device-0", ip_address='127.0.0.1', platform=args.platform)
+        with redirect_stdout(_NullWriter()):
+            connected = manager.create_connection(device, credentials[0])
+        checker.check(connected, "create_connection")
+        command, output = next(iter(responses.items()))
+        with redirect_stdout(_NullWriter()):
+            success, received = manager.execute_command('127.0.0.1', ports[0], command)
+        checker.check(success and received == output, f"execute_command '{command}' returns the full output")
+        with redirect_stdout(_NullWriter()):
+            success, received = manager.execute_command('127.0.0.1', ports[0], 'show bogus')
+            manager.disconnect_all()
+        checker.check(not success and 'Invalid input' in received, "failing command reports its error")
+        checker.check(not manager.connections, "disconnect_all releases the manager's sessions")
+
+        engine.run(stop_servers(servers))
+    finally:
+        with redirect_stdout(_NullWriter()):
+            engine.stop()
+
+    print(f"{'FAILED' if checker.failures else 'PASSED'} ({checker.failures} failed checks)")
+    return 1 if checker.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
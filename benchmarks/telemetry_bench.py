@@ -0,0 +1,388 @@
+"""
+Telemetry pipeline benchmark: parse -> normalize -> render
+Replays the recorded command outputs in benchmarks/fixtures for every platform in
+config/platforms/platforms.json, scaled from a handful of rows to a full Internet
+routing table, and times each stage:
+
+    parse      LocalTemplateParser.parse (the controller's template resolution)
+    normalize  ConfigDrivenFieldNormalizer.normalize_routes / _arp / _neighbors
+    render     widget update_with_normalized_data + one Qt event pass (offscreen)
+
+Runs fully offline. Results are written as JSON so runs can be compared:
+
+    python benchmarks/telemetry_bench.py -o before.json
+    python benchmarks/telemetry_bench.py -o after.json --compare before.json
+    python benchmarks/telemetry_bench.py --sizes internet --tables route_table --platforms cisco_ios
+
+Fixture format (benchmarks/fixtures/<template name>.txt): free-text description lines,
+then "@@ header", "@@ record" and optional "@@ footer" sections. The header and footer
+are used verbatim; the record block is repeated once per generated row with
+str.format placeholders filled in by fixture_values().
+"""
+
+import argparse
+import io
+import json
+import os
+import platform as host_platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+# Headless Qt, must be set before PyQt6 creates the application
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURE_DIR = Path(__file__).resolve().parent / 'fixtures'
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# Rows generated for each named size
+SIZE_PRESETS = {
+    'tiny': 10,
+    'small': 100,
+    'medium': 1_000,
+    'large': 10_000,
+    'xlarge': 100_000,
+    'internet': 1_000_000,  # Full IPv4 Internet table (~950k prefixes) plus headroom
+}
+DEFAULT_SIZES = ['tiny', 'small', 'medium', 'large']
+
+# Table -> (normalizer method, widget class name, largest size that makes sense)
+BENCH_TABLES = {
+    'route_table': ('normalize_routes', 'FixedRouteWidget', None),
+    'arp_table': ('normalize_arp', 'EnhancedArpWidget', 200_000),
+    'cdp_neighbors': ('normalize_neighbors', 'EnhancedNeighborWidget', 10_000),
+}
+
+
+class _NullWriter(io.TextIOBase):
+    """stdout sink: the pipeline logs every row, which would dominate the timings"""
+
+    def write(self, text):
+        return len(text)
+
+
+# ===== FIXTURES =====
+
+@dataclass
+class Fixture:
+    """Recorded command output split into header, repeatable record block and footer"""
+    name: str
+    description: str
+    header: str
+    record: str
+    footer: str = ""
+
+    def render(self, rows: int) -> str:
+        """Build an output with the record block repeated rows times"""
+        record = self.record
+        return ''.join([self.header] + [record.format(**fixture_values(i)) for i in range(rows)] + [self.footer])
+
+
+def fixture_values(i: int) -> Dict[str, Any]:
+    """Placeholder values for generated row i (unique networks, hosts and MACs up to ~14M rows)"""
+    b2, b1, b0 = (i >> 16) & 255, (i >> 8) & 255, i & 255
+    return {
+        'n': i,
+        'net': f"{1 + (i >> 16) % 223}.{b1}.{b0}.0",
+        'plen': 24,
+        'host': f"10.{b2}.{b1}.{b0}",
+        'nh': f"172.16.0.{1 + i % 16}",
+        'metric': i % 100,
+        'age': i % 60,
+        'port': 1 + i % 48,
+        'uplink': 1 + i % 4,
+        'vlan': 10 + i % 20,
+        'peer': f"sw-{i:06d}",
+        'mac_dot': f"0050.56{b2:02x}.{b1:02x}{b0:02x}",
+        'mac_colon': f"00:50:56:{b2:02x}:{b1:02x}:{b0:02x}",
+        'mac_hp': f"005056-{b2:02x}{b1:02x}{b0:02x}",
+    }
+
+
+def load_fixture(name: str) -> Optional[Fixture]:
+    """Load benchmarks/fixtures/<name>.txt, or None if there is no fixture for that template"""
+    path = FIXTURE_DIR / f"{name}.txt"
+    if not path.exists():
+        return None
+
+    sections = {'description': []}
+    current = 'description'
+    for line in path.read_text(encoding='utf-8').splitlines(keepends=True):
+        if line.startswith('@@ '):
+            current = line[3:].strip()
+            sections[current] = []
+        else:
+            sections[current].append(line)
+
+    return Fixture(
+        name=name,
+        description=''.join(sections['description']).strip(),
+        header=''.join(sections.get('header', [])),
+        record=''.join(sections.get('record', [])),
+        footer=''.join(sections.get('footer', []))
+    )
+
+
+# ===== TIMING =====
+
+def time_stage(func, repeat: int) -> Dict[str, Any]:
+    """Run func repeat times with logging silenced, returning timings and the last result"""
+    runs = []
+    result = None
+    for _ in range(repeat):
+        with redirect_stdout(_NullWriter()):
+            start = time.perf_counter()
+            result = func()
+            runs.append(time.perf_counter() - start)
+    return {
+        'min_s': round(min(runs), 6),
+        'median_s': round(statistics.median(runs), 6),
+        'runs_s': [round(run, 6) for run in runs],
+        'result': result
+    }
+
+
+def _stage_summary(stage: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in stage.items() if key != 'result'}
+
+
+class PipelineBenchmark:
+    """Times the telemetry pipeline stages for one platform/table/size at a time"""
+
+    def __init__(self, repeat: int = 3, render: bool = True):
+        from termtel.termtelwidgets.netmiko_controller import (
+            EnhancedPlatformAwareTelemetryController, LocalTemplateParser
+        )
+
+        self.repeat = repeat
+        self.app = None
+        self.widgets = {}
+
+        if render:
+            from PyQt6.QtWidgets import QApplication
+            self.app = QApplication.instance() or QApplication([])
+
+        with redirect_stdout(_NullWriter()):
+            self.controller = EnhancedPlatformAwareTelemetryController()
+        self.platform_config = self.controller.platform_config
+        self.normalizer = self.controller.field_normalizer
+        self.parser = LocalTemplateParser()
+
+    def _get_widget(self, table: str):
+        """Create (once) and show the widget that displays a table"""
+        if table not in self.widgets:
+            from termtel.termtelwidgets import normalized_widgets
+
+            widget_class = getattr(normalized_widgets, BENCH_TABLES[table][1])
+            with redirect_stdout(_NullWriter()):
+                widget = widget_class(self.controller)
+                widget.resize(1200, 800)
+                widget.show()
+                self.app.processEvents()
+            self.widgets[table] = widget
+        return self.widgets[table]
+
+    def run_case(self, platform: str, table: str, size_name: str) -> Dict[str, Any]:
+        """Benchmark one platform/table/size combination"""
+        rows = SIZE_PRESETS[size_name]
+        normalizer_method, widget_class, max_rows = BENCH_TABLES[table]
+        case = {'platform': platform, 'table': table, 'size': size_name, 'rows_requested': rows}
+
+        with redirect_stdout(_NullWriter()):
+            template_info = self.platform_config.get_template_info(platform, table)
+        if not template_info:
+            return dict(case, status='skipped', reason='no command/template for this platform')
+        if max_rows is not None and rows > max_rows:
+            return dict(case, status='skipped', reason=f'above {max_rows} row cap for {table}')
+
+        template_file = template_info[1]
+        fixture = load_fixture(template_file.replace('.textfsm', ''))
+        case['template'] = template_file
+        if fixture is None:
+            return dict(case, status='skipped', reason=f'no fixture for {template_file}')
+
+        output = fixture.render(rows)
+        command = self.platform_config.format_command(platform, table)
+        case['output_bytes'] = len(output.encode('utf-8'))
+
+        # Same template resolution as the controller
+        template_platform, template_command = self.platform_config.get_parser_key(platform, table)
+
+        # Warm the compiled template cache so every timed run is steady-state
+        with redirect_stdout(_NullWriter()):
+            self.parser.parse(template_platform, template_command, fixture.render(1))
+
+        parse = time_stage(lambda: self.parser.parse(template_platform, template_command, output), self.repeat)
+        parsed = parse['result'] or []
+        case['parsed_rows'] = len(parsed)
+        case['parse'] = _stage_summary(parse)
+        if not parsed:
+            return dict(case, status='failed', reason='template produced no rows')
+
+        normalize_func = getattr(self.normalizer, normalizer_method)
+        if table == 'cdp_neighbors':
+            normalize = time_stage(lambda: normalize_func(parsed, platform, command), self.repeat)
+        else:
+            normalize = time_stage(lambda: normalize_func(parsed, platform), self.repeat)
+        normalized = normalize['result'] or []
+        case['normalized_rows'] = len(normalized)
+        case['normalize'] = _stage_summary(normalize)
+
+        if self.app is not None and normalized:
+            widget = self._get_widget(table)
+
+            def render():
+                widget.update_with_normalized_data(normalized)
+                self.app.processEvents()
+
+            case['render'] = _stage_summary(time_stage(render, self.repeat))
+
+        case['status'] = 'ok'
+        return case
+
+    def close(self):
+        """Release widgets and stop any parse worker processes"""
+        from termtel.termtelwidgets.parse_pool import process_parse_pool
+
+        for widget in self.widgets.values():
+            widget.close()
+        process_parse_pool.shutdown()
+
+
+# ===== REPORTING =====
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def build_report(results: List[Dict[str, Any]], args) -> Dict[str, Any]:
+    """Wrap case results with run metadata"""
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'python': sys.version.split()[0],
+            'host': host_platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': args.repeat,
+            'sizes': {name: SIZE_PRESETS[name] for name in args.sizes},
+            'process_pool': not args.no_process_pool,
+            'render': not args.no_render,
+        },
+        'results': results
+    }
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Median ratios (current / baseline) per stage for cases present in both runs"""
+    def index(report):
+        return {(r['platform'], r['table'], r['size']): r for r in report['results'] if r.get('status') == 'ok'}
+
+    old_cases = index(baseline)
+    lines = [f"{'platform':<14} {'table':<14} {'size':<9} {'parse':>8} {'normalize':>10} {'render':>8}"]
+    for key, case in index(current).items():
+        old = old_cases.get(key)
+        if not old:
+            continue
+        ratios = []
+        for stage in ('parse', 'normalize', 'render'):
+            if stage in case and stage in old and old[stage]['median_s'] > 0:
+                ratios.append(f"{case[stage]['median_s'] / old[stage]['median_s']:.2f}x")
+            else:
+                ratios.append('-')
+        lines.append(f"{key[0]:<14} {key[1]:<14} {key[2]:<9} {ratios[0]:>8} {ratios[1]:>10} {ratios[2]:>8}")
+    return lines
+
+
+def _log(message: str):
+    """Progress goes to stderr so stdout can carry the JSON report"""
+    print(message, file=sys.stderr, flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the telemetry parse -> normalize -> render pipeline")
+    parser.add_argument('--sizes', default=','.join(DEFAULT_SIZES),
+                        help=f"Comma-separated sizes from {', '.join(SIZE_PRESETS)}")
+    parser.add_argument('--platforms', default='', help="Comma-separated platforms (default: all in platforms.json)")
+    parser.add_argument('--tables', default=','.join(BENCH_TABLES), help="Comma-separated command types")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per stage")
+    parser.add_argument('--no-render', action='store_true', help="Skip the Qt widget stage")
+    parser.add_argument('--no-process-pool', action='store_true', help="Parse/normalize everything in-process")
+    parser.add_argument('-o', '--output', default='-', help="JSON output file ('-' for stdout)")
+    parser.add_argument('--compare', help="Previous JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    args.sizes = [s for s in args.sizes.split(',') if s]
+    unknown = [s for s in args.sizes if s not in SIZE_PRESETS]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)}")
+    tables = [t for t in args.tables.split(',') if t]
+    unknown = [t for t in tables if t not in BENCH_TABLES]
+    if unknown:
+        parser.error(f"unknown tables: {', '.join(unknown)}")
+
+    # Keep stdout clean for the JSON report: anything written to fd 1 while running
+    # (including by parse worker processes, which inherit it) goes to stderr instead
+    report_fd = None
+    if args.output == '-':
+        sys.stdout.flush()
+        report_fd = os.dup(1)
+        os.dup2(2, 1)
+
+    from termtel.termtelwidgets.parse_pool import process_parse_pool
+    process_parse_pool.enabled = not args.no_process_pool
+
+    bench = PipelineBenchmark(repeat=args.repeat, render=not args.no_render)
+    platforms = [p for p in args.platforms.split(',') if p] or bench.platform_config.get_available_platforms()
+
+    results = []
+    try:
+        for platform in platforms:
+            for table in tables:
+                for size_name in args.sizes:
+                    case = bench.run_case(platform, table, size_name)
+                    results.append(case)
+                    if case['status'] == 'ok':
+                        stages = '  '.join(f"{stage} {case[stage]['median_s']:.4f}s"
+                                           for stage in ('parse', 'normalize', 'render') if stage in case)
+                        _log(f" {platform:<14} {table:<14} {size_name:<9} {case['normalized_rows']:>8} rows  {stages}")
+                    else:
+                        _log(f" {platform:<14} {table:<14} {size_name:<9} {case['status']}: {case['reason']}")
+    finally:
+        bench.close()
+        if report_fd is not None:
+            sys.stdout.flush()
+            os.dup2(report_fd, 1)
+            os.close(report_fd)
+
+    report = build_report(results, args)
+    text = json.dumps(report, indent=2)
+    if args.output == '-':
+        print(text)
+    else:
+        Path(args.output).write_text(text, encoding='utf-8')
+        _log(f" Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        for line in compare_reports(report, baseline):
+            _log(line)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
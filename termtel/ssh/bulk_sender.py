@@ -0,0 +1,165 @@
+"""
+Paced bulk sending for large pastes
+A paste (e.g. a 20k-line ACL) is sent from a worker thread in chunks that fit the SSH
+channel window, optionally one line at a time waiting for the device prompt, so the UI
+thread never blocks and the device input buffer is not overrun.
+"""
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+@dataclass
+class BulkSendOptions:
+    """Pacing options for a bulk send"""
+    chunk_size: int = 1024           # bytes per channel.send()
+    chunk_delay: float = 0.0         # seconds between chunks (stream mode)
+    line_sync: bool = False          # send line by line, waiting for the prompt after each
+    prompt_pattern: str = r'[>#$%\]]\s*$'
+    line_timeout: float = 5.0        # seconds to wait for the prompt before sending on
+    stall_timeout: float = 30.0      # give up when the channel window stays full this long
+    progress_interval: float = 0.1   # seconds between progress signals
+
+
+class BulkSendCancelled(Exception):
+    pass
+
+
+class BulkSender(QObject):
+    """
+    Sends one payload to a channel from a worker thread
+
+    Signals are emitted from the worker thread (queued to UI receivers).
+    feed_output() must be given the session output when line_sync is on.
+    """
+    progress = pyqtSignal(int, int)  # bytes sent, total bytes
+    finished = pyqtSignal(bool, str)  # completed, message
+
+    OUTPUT_TAIL = 4096  # bytes of recent output kept for prompt matching
+
+    def __init__(self, channel, payload: bytes, options: BulkSendOptions = None, parent=None):
+        super().__init__(parent)
+        self.channel = channel
+        self.payload = payload
+        self.options = options or BulkSendOptions()
+        self.sent = 0
+        self.prompt_timeouts = 0
+
+        self._prompt = re.compile(self.options.prompt_pattern.encode())
+        self._cancel = threading.Event()
+        self._output = bytearray()
+        self._output_cond = threading.Condition()
+        self._last_progress = 0.0
+        self._thread = None
+
+    @property
+    def total(self) -> int:
+        return len(self.payload)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="ssh-bulk-send", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Stop after the chunk in flight (thread-safe)"""
+        self._cancel.set()
+        with self._output_cond:
+            self._output_cond.notify_all()
+
+    def wait(self, timeout=None) -> bool:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.running
+
+    def feed_output(self, data: bytes):
+        """Session output seen since the last line was sent (for prompt sync)"""
+        if not self.options.line_sync:
+            return
+        with self._output_cond:
+            self._output += data
+            if len(self._output) > self.OUTPUT_TAIL:
+                del self._output[:-self.OUTPUT_TAIL]
+            self._output_cond.notify_all()
+
+    # ===== WORKER THREAD =====
+
+    def _run(self):
+        try:
+            if self.options.line_sync:
+                self._send_lines()
+            else:
+                self._send(self.payload)
+            message = f"Sent {self.sent} bytes"
+            if self.prompt_timeouts:
+                message += f" ({self.prompt_timeouts} lines without prompt)"
+            self._emit_progress(force=True)
+            self.finished.emit(True, message)
+        except BulkSendCancelled:
+            self._emit_progress(force=True)
+            self.finished.emit(False, f"Cancelled after {self.sent} of {self.total} bytes")
+        except Exception as e:
+            self._emit_progress(force=True)
+            self.finished.emit(False, f"Send failed after {self.sent} of {self.total} bytes: {e}")
+
+    def _send_lines(self):
+        for line in self.payload.splitlines(keepends=True):
+            with self._output_cond:
+                self._output.clear()
+            self._send(line)
+            if line.strip():
+                self._wait_for_prompt()
+
+    def _wait_for_prompt(self):
+        deadline = time.monotonic() + self.options.line_timeout
+        with self._output_cond:
+            while not self._prompt.search(self._output):
+                if self._cancel.is_set():
+                    raise BulkSendCancelled()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.prompt_timeouts += 1
+                    return
+                self._output_cond.wait(remaining)
+
+    def _send(self, data: bytes):
+        """Send data in window-sized chunks without ever blocking on a full window"""
+        view = memoryview(data)
+        offset = 0
+        stalled_since = None
+        while offset < len(view):
+            if self._cancel.is_set():
+                raise BulkSendCancelled()
+            if self.channel.closed:
+                raise ConnectionError("channel closed")
+
+            if not self.channel.send_ready():
+                # Window full: the device has not consumed what we sent yet
+                now = time.monotonic()
+                if stalled_since is None:
+                    stalled_since = now
+                elif now - stalled_since > self.options.stall_timeout:
+                    raise TimeoutError(f"channel window full for {self.options.stall_timeout:.0f}s")
+                self._cancel.wait(0.01)
+                continue
+            stalled_since = None
+
+            count = self.channel.send(bytes(view[offset:offset + self.options.chunk_size]))
+            offset += count
+            self.sent += count
+            self._emit_progress()
+            if self.options.chunk_delay and not self.options.line_sync:
+                self._cancel.wait(self.options.chunk_delay)
+
+    def _emit_progress(self, force=False):
+        now = time.monotonic()
+        if force or now - self._last_progress >= self.options.progress_interval:
+            self._last_progress = now
+            self.progress.emit(self.sent, self.total)
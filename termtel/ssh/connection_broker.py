@@ -0,0 +1,228 @@
+"""
+SSH connection broker
+Authenticated paramiko transports are shared per host/port/username: a terminal tab
+and a telemetry session to the same device open their own channels on one transport
+instead of logging in twice. Transports are reference counted and closed after
+staying unused for the idle timeout.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import paramiko
+
+
+@dataclass
+class _BrokeredTransport:
+    transport: paramiko.Transport
+    refs: int = 0
+    idle_since: Optional[float] = None
+    opened_at: float = field(default_factory=time.time)
+    leases_granted: int = 0  # how many sessions reused this login
+
+
+class TransportLease:
+    """One session's hold on a brokered transport (release exactly once)"""
+
+    def __init__(self, broker: 'SSHConnectionBroker', key: tuple, transport: paramiko.Transport):
+        self.broker = broker
+        self.key = key
+        self.transport = transport
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.broker._release(self)
+
+
+class SharedSSHClient(paramiko.SSHClient):
+    """
+    SSHClient on a brokered transport: connect() authenticates nothing and close()
+    closes only the channels opened through this client, then releases the lease.
+    Drop-in wherever an SSHClient is expected (Backend, netmiko).
+    """
+
+    def __init__(self, lease: TransportLease):
+        super().__init__()
+        self.lease = lease
+        self._transport = lease.transport
+        self._channels: List[paramiko.Channel] = []
+
+    def connect(self, *args, **kwargs):
+        if not self._transport.is_active():
+            raise paramiko.SSHException("Shared SSH transport is no longer active")
+
+    def invoke_shell(self, *args, **kwargs):
+        channel = super().invoke_shell(*args, **kwargs)
+        self._channels.append(channel)
+        return channel
+
+    def exec_command(self, *args, **kwargs):
+        stdin, stdout, stderr = super().exec_command(*args, **kwargs)
+        self._channels.append(stdout.channel)
+        return stdin, stdout, stderr
+
+    def close(self):
+        for channel in self._channels:
+            try:
+                channel.close()
+            except Exception:
+                pass
+        self._channels = []
+        self.lease.release()
+
+
+class SSHConnectionBroker:
+    """Per host/port/username registry of authenticated transports"""
+
+    IDLE_TIMEOUT = 120.0  # seconds an unused transport stays open for reuse
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._transports: Dict[tuple, _BrokeredTransport] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Timer] = None
+        self.reuses = 0
+
+    @staticmethod
+    def _key(host, port, username) -> tuple:
+        return (str(host).strip().lower(), int(port), str(username).strip())
+
+    def acquire(self, host, port, username) -> Optional[TransportLease]:
+        """
+        Lease an existing authenticated transport for a host
+
+        Args:
+            host: Hostname/IP
+            port: SSH port
+            username: SSH username
+
+        Returns:
+            TransportLease, or None if there is no live transport to share
+        """
+        key = self._key(host, port, username)
+        with self._lock:
+            entry = self._transports.get(key)
+            if entry is None:
+                return None
+            if not (entry.transport.is_active() and entry.transport.is_authenticated()):
+                del self._transports[key]
+                return None
+            entry.refs += 1
+            entry.idle_since = None
+            entry.leases_granted += 1
+            self.reuses += 1
+        print(f" Reusing SSH transport to {key[2]}@{key[0]}:{key[1]} ({entry.refs} sessions)")
+        return TransportLease(self, key, entry.transport)
+
+    def register(self, host, port, username, transport: paramiko.Transport) -> TransportLease:
+        """
+        Offer a freshly authenticated transport for sharing (the caller holds the first lease)
+
+        Returns:
+            TransportLease for the caller; release it instead of closing the transport
+        """
+        key = self._key(host, port, username)
+        with self._lock:
+            existing = self._transports.get(key)
+            if existing is not None and existing.transport is not transport and existing.transport.is_active():
+                # Raced with another login to the same host: keep the caller's transport
+                # private, it is closed when its lease is released
+                return TransportLease(self, None, transport)
+            entry = existing if existing is not None and existing.transport is transport else _BrokeredTransport(transport)
+            entry.refs += 1
+            entry.idle_since = None
+            self._transports[key] = entry
+        return TransportLease(self, key, transport)
+
+    def _release(self, lease: TransportLease):
+        if lease.key is None:
+            _close_transport(lease.transport)
+            return
+        with self._lock:
+            entry = self._transports.get(lease.key)
+            if entry is None or entry.transport is not lease.transport:
+                close_now = True
+            else:
+                entry.refs -= 1
+                close_now = False
+                if entry.refs <= 0:
+                    entry.refs = 0
+                    entry.idle_since = time.monotonic()
+                    if self.idle_timeout <= 0:
+                        del self._transports[lease.key]
+                        close_now = True
+                    else:
+                        self._schedule_reap(self.idle_timeout)
+        if close_now and not self._is_shared(lease.transport):
+            _close_transport(lease.transport)
+
+    def _is_shared(self, transport) -> bool:
+        with self._lock:
+            return any(entry.transport is transport for entry in self._transports.values())
+
+    def _schedule_reap(self, delay: float):
+        # Called with the lock held
+        if self._reaper is not None:
+            return
+        self._reaper = threading.Timer(delay, self._reap)
+        self._reaper.daemon = True
+        self._reaper.start()
+
+    def _reap(self):
+        """Close transports idle for longer than the idle timeout"""
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            self._reaper = None
+            next_due = None
+            for key, entry in list(self._transports.items()):
+                if entry.idle_since is None:
+                    if not entry.transport.is_active():
+                        del self._transports[key]
+                    continue
+                idle = now - entry.idle_since
+                if idle >= self.idle_timeout or not entry.transport.is_active():
+                    expired.append(entry.transport)
+                    del self._transports[key]
+                else:
+                    remaining = self.idle_timeout - idle
+                    next_due = remaining if next_due is None else min(next_due, remaining)
+            if next_due is not None:
+                self._schedule_reap(next_due)
+        for transport in expired:
+            _close_transport(transport)
+
+    def close_all(self):
+        """Close every brokered transport (application exit)"""
+        with self._lock:
+            entries = list(self._transports.values())
+            self._transports.clear()
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+        for entry in entries:
+            _close_transport(entry.transport)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'transports': len(self._transports),
+                'sessions': sum(entry.refs for entry in self._transports.values()),
+                'idle': sum(1 for entry in self._transports.values() if entry.idle_since is not None),
+                'reuses': self.reuses,
+            }
+
+
+def _close_transport(transport):
+    try:
+        transport.close()
+    except Exception as e:
+        print(f"Error closing SSH transport: {e}")
+
+
+# Global instance
+ssh_connection_broker = SSHConnectionBroker()
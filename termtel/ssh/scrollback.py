@@ -0,0 +1,351 @@
+"""
+Searchable scrollback for terminal sessions
+Each session keeps its recent output lines (escape sequences stripped) in a ring of
+packed blocks: a sealed block is one UTF-8 bytes object plus an offsets array, so a
+line costs its text plus 4 bytes instead of a Python str each. A trigram inverted
+index over blocks narrows a search to the few blocks that can match; those are then
+scanned with bytes.find. Closed tabs stay searchable until evicted.
+"""
+
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# CSI / OSC / two-character escape sequences
+_ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]')
+_BACKSPACE_RE = re.compile(r'[^\x08]\x08')
+
+
+def clean_line(line: str) -> str:
+    """Terminal line as displayed: no escape sequences, CR overwrites, backspaces applied"""
+    if '\x1b' in line:
+        line = _ANSI_RE.sub('', line)
+    if '\r' in line:
+        parts = [part for part in line.split('\r') if part]
+        line = parts[-1] if parts else ''
+    while '\x08' in line:
+        stripped = _BACKSPACE_RE.sub('', line)
+        if stripped == line:
+            line = line.replace('\x08', '')
+            break
+        line = stripped
+    return line
+
+
+def _trigrams(data: bytes) -> set:
+    """Trigrams within whitespace-separated words (device output repeats words a lot,
+    so deduplicating them first keeps indexing cheap)"""
+    return {word[i:i + 3] for word in set(data.split()) for i in range(len(word) - 2)}
+
+
+class _Block:
+    """Sealed run of lines: one bytes object, line start offsets, and its first line number"""
+    __slots__ = ('first_line', 'data', 'offsets')
+
+    def __init__(self, first_line: int, lines: List[str]):
+        self.first_line = first_line
+        encoded = [line.encode('utf-8', 'replace') for line in lines]
+        self.offsets = array('I', [0])
+        position = 0
+        for line in encoded:
+            position += len(line) + 1
+            self.offsets.append(position)
+        self.data = b'\n'.join(encoded) + b'\n'
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def line(self, index: int) -> str:
+        return self.data[self.offsets[index]:self.offsets[index + 1] - 1].decode('utf-8', 'replace')
+
+    def find(self, needle: bytes, limit: int) -> List[int]:
+        """Indexes of lines containing needle (ASCII case-insensitive, needle lowercased)"""
+        haystack = self.data.lower()
+        found = []
+        position = haystack.find(needle)
+        while position != -1 and len(found) < limit:
+            index = bisect_right(self.offsets, position) - 1
+            found.append(index)
+            # Continue after this line
+            position = haystack.find(needle, self.offsets[index + 1])
+        return found
+
+
+class ScrollbackBuffer:
+    """Ring buffer of one session's output lines with a trigram block index"""
+
+    BLOCK_LINES = 1024
+    MAX_LINE_CHARS = 4096  # longer lines are split (binary dumps, no newlines)
+
+    def __init__(self, label: str, max_lines: int = 100_000):
+        """
+        Args:
+            label: Session name shown in search results
+            max_lines: Lines kept (rounded up to whole blocks); oldest blocks are dropped
+        """
+        self.label = label
+        self.max_lines = max_lines
+        self.is_open = True
+
+        self._blocks: deque = deque()
+        self._active: List[str] = []  # lines of the block being filled
+        self._partial = ''  # text after the last newline
+        self._next_line = 0  # number of the next line to be completed
+        self._lock = threading.Lock()
+
+        self._first_block = 0  # block number of self._blocks[0]
+
+        # trigram -> block numbers (ascending; numbers below _first_block are stale).
+        # Guarded by its own lock: searches index and scan sealed blocks, which never
+        # change, without holding _lock, so feed() is not blocked behind them.
+        self._index: Dict[bytes, array] = {}
+        self._index_lock = threading.Lock()
+        self._indexed_blocks = 0  # blocks numbered below this are in the index
+        self._index_floor = 0  # _first_block at the last compaction
+
+    # ===== WRITER SIDE =====
+
+    def feed(self, text: str):
+        """Add decoded terminal output (any chunking)"""
+        if not text:
+            return
+        with self._lock:
+            text = self._partial + text
+            lines = text.split('\n')
+            self._partial = lines.pop()
+            if len(self._partial) > self.MAX_LINE_CHARS:
+                lines.append(self._partial)
+                self._partial = ''
+            for line in lines:
+                line = clean_line(line)
+                while len(line) > self.MAX_LINE_CHARS:
+                    self._append(line[:self.MAX_LINE_CHARS])
+                    line = line[self.MAX_LINE_CHARS:]
+                self._append(line)
+
+    def _append(self, line: str):
+        self._active.append(line)
+        self._next_line += 1
+        if len(self._active) >= self.BLOCK_LINES:
+            first_line = self._next_line - len(self._active)
+            self._blocks.append(_Block(first_line, self._active))
+            self._active = []
+            # Drop the oldest blocks once past the cap
+            while len(self._blocks) > 1 and (len(self._blocks) - 1) * self.BLOCK_LINES >= self.max_lines:
+                self._blocks.popleft()
+                self._first_block += 1
+
+    # ===== READER SIDE =====
+
+    @property
+    def first_line(self) -> int:
+        """Number of the oldest line still held"""
+        with self._lock:
+            return self._blocks[0].first_line if self._blocks else self._next_line - len(self._active)
+
+    @property
+    def line_count(self) -> int:
+        with self._lock:
+            return sum(len(block) for block in self._blocks) + len(self._active) + (1 if self._partial else 0)
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by text and index"""
+        with self._lock:
+            text = sum(len(block.data) + block.offsets.itemsize * len(block.offsets) for block in self._blocks)
+            text += sum(len(line) for line in self._active)
+        with self._index_lock:
+            index = sum(48 + postings.itemsize * len(postings) for postings in self._index.values())
+        return text + index
+
+    def get_lines(self, start: int, count: int) -> List[str]:
+        """Lines start .. start+count-1 (line numbers as returned by search)"""
+        with self._lock:
+            return [line for _, line in self._iter_lines(start, start + count)]
+
+    def _iter_lines(self, start: int, stop: int):
+        for block in self._blocks:
+            if block.first_line + len(block) <= start or block.first_line >= stop:
+                continue
+            for index in range(max(0, start - block.first_line), min(len(block), stop - block.first_line)):
+                yield block.first_line + index, block.line(index)
+        active_first = self._next_line - len(self._active)
+        for number, line in enumerate(self._active, active_first):
+            if start <= number < stop:
+                yield number, line
+        if self._partial and start <= self._next_line < stop:
+            yield self._next_line, clean_line(self._partial)
+
+    def search(self, query: str, limit: int = 100) -> List[Tuple[int, str]]:
+        """
+        Case-insensitive substring search
+
+        Args:
+            query: Text to find (e.g. a MAC, an IP, an error string)
+            limit: Maximum hits
+
+        Returns:
+            (line number, line) pairs, oldest first
+        """
+        # ASCII case folding on both sides (bytes.lower), so index and scan agree
+        needle = query.encode('utf-8').lower()
+        if not needle:
+            return []
+        # Only the snapshot is taken under _lock; indexing and scanning run outside it
+        with self._lock:
+            first_block = self._first_block
+            blocks = list(self._blocks)
+            active_first = self._next_line - len(self._active)
+            tail = list(enumerate(self._active, active_first))
+            if self._partial:
+                tail.append((self._next_line, clean_line(self._partial)))
+
+        with self._index_lock:
+            self._update_index(first_block, blocks)
+            candidates = self._candidate_blocks(needle, first_block, blocks)
+
+        hits = []
+        for block in candidates:
+            for index in block.find(needle, limit - len(hits)):
+                hits.append((block.first_line + index, block.line(index)))
+            if len(hits) >= limit:
+                return hits
+
+        for number, line in tail:
+            if needle in line.encode('utf-8', 'replace').lower():
+                hits.append((number, line))
+                if len(hits) >= limit:
+                    break
+        return hits
+
+    def _candidate_blocks(self, needle: bytes, first_block: int, blocks: List[_Block]):
+        """Blocks of the snapshot (blocks, numbered from first_block) that can contain needle"""
+        trigrams = _trigrams(needle)
+        if not trigrams:
+            return blocks  # no word of 3+ characters: scan everything
+
+        postings = []
+        for trigram in trigrams:
+            numbers = self._index.get(trigram)
+            if numbers is None:
+                return []
+            postings.append(numbers)
+        postings.sort(key=len)
+
+        # Intersect, smallest list first, ignoring evicted blocks and blocks sealed
+        # after the snapshot (indexed by a concurrent search)
+        first = postings[0]
+        end = first_block + len(blocks)
+        candidates = list(first[bisect_left(first, first_block):bisect_left(first, end)])
+        for numbers in postings[1:]:
+            if not candidates:
+                return []
+            present = set(numbers[bisect_left(numbers, candidates[0]):])
+            candidates = [n for n in candidates if n in present]
+        return [blocks[n - first_block] for n in candidates]
+
+    def _update_index(self, first_block: int, blocks: List[_Block]):
+        """Index sealed blocks added since the last search (kept off the reader threads, _index_lock held)"""
+        if first_block - self._index_floor >= max(16, len(blocks)):
+            self._compact_index(first_block)
+        start = max(self._indexed_blocks, first_block)
+        end = first_block + len(blocks)
+        for number in range(start, end):
+            block = blocks[number - first_block]
+            for trigram in _trigrams(block.data.lower()):
+                postings = self._index.get(trigram)
+                if postings is None:
+                    self._index[trigram] = array('I', (number,))
+                else:
+                    postings.append(number)
+        self._indexed_blocks = max(self._indexed_blocks, end)
+
+    def _compact_index(self, floor: int):
+        """Drop postings of blocks numbered below floor (evicted)"""
+        for trigram in list(self._index):
+            postings = self._index[trigram]
+            cut = bisect_left(postings, floor)
+            if cut == len(postings):
+                del self._index[trigram]
+            elif cut:
+                del postings[:cut]
+        self._index_floor = floor
+
+
+@dataclass
+class ScrollbackHit:
+    """One search result"""
+    session: str
+    line_number: int
+    text: str
+    session_open: bool
+
+
+class ScrollbackRegistry:
+    """Scrollback of every open tab, plus the most recently closed ones"""
+
+    def __init__(self, max_lines_per_session: int = 100_000, max_closed_sessions: int = 20):
+        self.max_lines_per_session = max_lines_per_session
+        self.max_closed_sessions = max_closed_sessions
+        self._open: List[ScrollbackBuffer] = []
+        self._closed: deque = deque()
+        self._lock = threading.Lock()
+
+    def open_session(self, label: str, max_lines: Optional[int] = None) -> ScrollbackBuffer:
+        buffer = ScrollbackBuffer(label, max_lines or self.max_lines_per_session)
+        with self._lock:
+            self._open.append(buffer)
+        return buffer
+
+    def close_session(self, buffer: ScrollbackBuffer):
+        """Tab closed: keep its scrollback searchable until max_closed_sessions newer ones close"""
+        with self._lock:
+            if buffer in self._open:
+                self._open.remove(buffer)
+            buffer.is_open = False
+            if self.max_closed_sessions > 0:
+                self._closed.append(buffer)
+                while len(self._closed) > self.max_closed_sessions:
+                    self._closed.popleft()
+
+    def sessions(self) -> List[ScrollbackBuffer]:
+        with self._lock:
+            return list(self._open) + list(self._closed)
+
+    def search(self, query: str, limit: int = 200, include_closed: bool = True) -> List[ScrollbackHit]:
+        """
+        Search the scrollback of all sessions
+
+        Args:
+            query: Text to find (case-insensitive)
+            limit: Maximum hits overall
+            include_closed: Also search recently closed tabs
+
+        Returns:
+            Hits, open tabs first
+        """
+        with self._lock:
+            buffers = list(self._open) + (list(self._closed) if include_closed else [])
+        hits = []
+        for buffer in buffers:
+            for line_number, text in buffer.search(query, limit - len(hits)):
+                hits.append(ScrollbackHit(buffer.label, line_number, text, buffer.is_open))
+            if len(hits) >= limit:
+                break
+        return hits
+
+    def get_stats(self) -> Dict:
+        buffers = self.sessions()
+        return {
+            'open_sessions': sum(1 for buffer in buffers if buffer.is_open),
+            'closed_sessions': sum(1 for buffer in buffers if not buffer.is_open),
+            'lines': sum(buffer.line_count for buffer in buffers),
+            'memory_bytes': sum(buffer.memory_bytes() for buffer in buffers),
+        }
+
+
+# Global instance
+scrollback_registry = ScrollbackRegistry()
@@ -0,0 +1,305 @@
+"""
+Asynchronous SSH session logging
+Each log file gets one background writer thread with a bounded queue and a persistent
+buffered handle, so reader threads hand off text without touching the disk. Files are
+rotated by size and/or age, and rotated files can be gzipped.
+"""
+
+import atexit
+import gzip
+import os
+import queue
+import shutil
+import threading
+import time
+from typing import Dict, Optional
+
+
+class SessionLogger:
+    """
+    Background writer for one session log file
+
+    write() never blocks: when the queue is full (disk stalled), chunks are dropped
+    and a marker with the dropped count is written once the writer catches up.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 rotate_interval: Optional[float] = None, compress: bool = False,
+                 flush_interval: float = 1.0, queue_size: int = 4096,
+                 buffer_size: int = 64 * 1024):
+        """
+        Initialize the logger (the writer thread starts on first write)
+
+        Args:
+            path: Log file path
+            max_bytes: Rotate when the file reaches this size (0 disables size rotation)
+            backup_count: Rotated files to keep (path.1 ... path.N)
+            rotate_interval: Rotate after this many seconds (None disables time rotation)
+            compress: Gzip rotated files (path.1.gz ...)
+            flush_interval: Seconds between flushes of the buffered handle
+            queue_size: Pending chunks before new chunks are dropped
+            buffer_size: File buffer size in bytes
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._predecessor: Optional['SessionLogger'] = None  # closed logger of the same file
+        self._file = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._pending_cr = False  # chunk ended in '\r', its '\n' may start the next one
+        self.dropped_chunks = 0
+        self.bytes_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    # ===== READER SIDE =====
+
+    def write(self, text: str):
+        """Queue text for the log (never blocks the caller)"""
+        if not text:
+            return
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(text)
+        except queue.Full:
+            self.dropped_chunks += 1
+
+    def close(self):
+        """
+        Stop the writer once everything queued is written (never blocks the caller)
+
+        The writer thread flushes and closes the file on its own; use join() to wait for it.
+        """
+        self._stopping.set()
+        try:
+            self._queue.put_nowait(self._STOP)
+        except queue.Full:
+            pass  # the writer stops when it has drained the queue
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the writer thread to finish after close()"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"session-log-{os.path.basename(self.path)}", daemon=True
+                )
+                self._thread.start()
+
+    # ===== WRITER THREAD =====
+
+    def _run(self):
+        # A closed logger of the same file may still be draining: never write it concurrently
+        if self._predecessor is not None:
+            self._predecessor.join()
+            self._predecessor = None
+
+        last_flush = time.monotonic()
+        try:
+            while True:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    if self._stopping.is_set():
+                        break
+                    item = None
+
+                if item is self._STOP:
+                    break
+                if item is not None:
+                    # Batch whatever else is waiting into one write (bounded, so rotation
+                    # still happens close to max_bytes)
+                    parts = [item]
+                    batch_chars = len(item)
+                    stop = False
+                    while batch_chars < self.buffer_size:
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is self._STOP:
+                            stop = True
+                            break
+                        parts.append(item)
+                        batch_chars += len(item)
+                    self._write(''.join(parts))
+                    if stop:
+                        break
+
+                if time.monotonic() - last_flush >= self.flush_interval:
+                    self._flush()
+                    last_flush = time.monotonic()
+        except Exception as e:
+            print(f"Session log writer for {self.path} failed: {e}")
+        finally:
+            if self.dropped_chunks:
+                self._write('')
+            if self._pending_cr:
+                self._pending_cr = False
+                self._write('\n')
+            self._close_file()
+
+    def _normalize(self, text: str) -> str:
+        """CRLF/CR -> LF, including a CRLF split across two chunks"""
+        if self._pending_cr:
+            text = '\r' + text
+        self._pending_cr = text.endswith('\r')
+        if self._pending_cr:
+            text = text[:-1]
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    def _write(self, text: str):
+        if self.dropped_chunks:
+            dropped, self.dropped_chunks = self.dropped_chunks, 0
+            text = f"\n[session log: {dropped} chunks dropped, disk too slow]\n" + text
+
+        data = self._normalize(text)
+        if not data:
+            return
+
+        try:
+            written = len(data) if data.isascii() else len(data.encode('utf-8', 'replace'))
+            if self._file is None:
+                self._open_file()
+            if self._should_rotate(written):
+                self._rotate()
+            self._file.write(data)
+            self._size += written
+            self.bytes_written += written
+        except OSError as e:
+            print(f"Failed to write session log {self.path}: {e}")
+
+    def _open_file(self):
+        self._file = open(self.path, 'a', encoding='utf-8', errors='replace', buffering=self.buffer_size)
+        self._size = self._file.tell()
+        self._opened_at = time.monotonic()
+
+    def _flush(self):
+        if self._file is not None:
+            try:
+                self._file.flush()
+            except OSError as e:
+                print(f"Failed to flush session log {self.path}: {e}")
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+    def _should_rotate(self, incoming: int) -> bool:
+        """Rotate before a write that would take a non-empty file past max_bytes, or on age"""
+        if self.max_bytes and self._size and self._size + incoming > self.max_bytes:
+            return True
+        if self.rotate_interval and time.monotonic() - self._opened_at >= self.rotate_interval:
+            return True
+        return False
+
+    def _backup_name(self, index: int) -> str:
+        return f"{self.path}.{index}.gz" if self.compress else f"{self.path}.{index}"
+
+    def _rotate(self):
+        """Shift path.N-1 -> path.N ..., move the current file to path.1 and reopen"""
+        self._close_file()
+
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self._backup_name(index)
+                if os.path.exists(source):
+                    os.replace(source, self._backup_name(index + 1))
+
+            if self.compress:
+                with open(self.path, 'rb') as source, gzip.open(self._backup_name(1), 'wb') as target:
+                    shutil.copyfileobj(source, target)
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self._backup_name(1))
+        else:
+            os.remove(self.path)
+
+        self._open_file()
+
+
+# ===== SHARED LOGGERS =====
+
+_loggers: Dict[str, SessionLogger] = {}
+_logger_refs: Dict[str, int] = {}
+_closing_loggers: Dict[str, SessionLogger] = {}  # closed, writer may still be draining
+_loggers_lock = threading.Lock()
+
+
+def open_session_log(path: str, **options) -> SessionLogger:
+    """
+    Get the logger for a log file, shared by every session that logs to it
+    (tabs to the same host use the same file, and must not rotate it under each other)
+
+    Args:
+        path: Log file path
+        **options: SessionLogger options, used when the logger is created
+
+    Returns:
+        SessionLogger; call release_session_log(path) when the session ends
+    """
+    key = os.path.abspath(path)
+    with _loggers_lock:
+        logger = _loggers.get(key)
+        if logger is None:
+            logger = SessionLogger(path, **options)
+            logger._predecessor = _closing_loggers.pop(key, None)
+            _loggers[key] = logger
+        _logger_refs[key] = _logger_refs.get(key, 0) + 1
+        return logger
+
+
+def release_session_log(path: str):
+    """Drop one session's reference, closing the logger when no session uses it"""
+    key = os.path.abspath(path)
+    with _loggers_lock:
+        refs = _logger_refs.get(key, 0) - 1
+        if refs > 0:
+            _logger_refs[key] = refs
+            return
+        _logger_refs.pop(key, None)
+        logger = _loggers.pop(key, None)
+        if logger:
+            _closing_loggers[key] = logger
+    if logger:
+        logger.close()
+
+
+@atexit.register
+def close_all_session_logs():
+    """Flush and close every session log (runs at interpreter exit)"""
+    with _loggers_lock:
+        loggers = list(_loggers.values())
+        closing = list(_closing_loggers.values())
+        _loggers.clear()
+        _logger_refs.clear()
+        _closing_loggers.clear()
+    for logger in loggers:
+        logger.close()
+    for logger in loggers + closing:
+        logger.join(5.0)
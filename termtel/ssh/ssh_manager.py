@@ -1,60 +1,266 @@
 # ssh_manager.py
+"""
+SSH sessions bridged to a browser terminal over a WebSocket
+
+Output is event driven: the loop watches each channel's readiness fd and sends
+coalesced batches as binary frames (no polling floor, no base64). Frame layout:
+
+    [1 byte tab id length][tab id, UTF-8][raw terminal bytes]
+
+so tab ids are limited to 255 UTF-8 bytes; create_client rejects longer ones.
+
+Blocking paramiko work (TCP connect, key exchange, auth, large sends) runs in an
+executor so the event loop never stalls. While a tab's WebSocket sends lag behind,
+its channel is not read, so the SSH window throttles that device only.
+"""
 import paramiko
 import asyncio
 import base64
+import select
+import threading
+import time
+
+
+class _TabSession:
+    """Per-tab bridge state"""
+
+    def __init__(self, client):
+        self.client = client
+        self.channel = None
+        self.websocket = None
+        self.pending = bytearray()
+        self.sending = False
+        self.reading = False
+        self.last_send = 0.0
+        self.flush_handle = None
+        self.closed = None  # asyncio.Future, set when the channel is done
+        self.watch_thread = None
+        self.watch_event = None
+        self.bytes_sent = 0
+        self.frames_sent = 0
+
 
 class SSHClientManager:
-    def __init__(self):
+    READ_SIZE = 32768
+    FLUSH_INTERVAL = 0.008     # seconds between frames while output keeps arriving
+    FLUSH_BYTES = 65536        # send at once when this much output is pending
+    HIGH_WATERMARK = 256 * 1024  # stop reading the channel above this much unsent output
+    LOW_WATERMARK = 64 * 1024
+    DIRECT_SEND_BYTES = 4096   # larger input (pastes) is sent from the executor
+    MAX_TAB_ID_BYTES = 255     # binary frames carry the tab id length in one byte
+
+    def __init__(self, binary_frames=True):
+        """
+        Args:
+            binary_frames: Send output as binary frames; False keeps the legacy JSON
+                           {'type': 'ssh_output', 'data': <base64>, 'tabId': ...} text frames
+        """
         self.clients = {}
+        self.binary_frames = binary_frames
 
     async def create_client(self, tab_id):
+        """
+        Register a tab
+
+        Raises:
+            ValueError: if binary frames are on and the tab id is longer than
+                        MAX_TAB_ID_BYTES when UTF-8 encoded
+        """
+        tab_bytes = len(str(tab_id).encode('utf-8'))
+        if self.binary_frames and tab_bytes > self.MAX_TAB_ID_BYTES:
+            raise ValueError(f"Tab id is {tab_bytes} bytes, binary frames allow at most {self.MAX_TAB_ID_BYTES}")
         ssh_client = paramiko.SSHClient()
         ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        self.clients[tab_id] = {'client': ssh_client, 'channel': None}
+        self.clients[tab_id] = _TabSession(ssh_client)
 
     async def connect(self, tab_id, hostname, port, username, password, websocket):
-        ssh_client = self.clients[tab_id]['client']
+        session = self.clients[tab_id]
+        session.websocket = websocket
+        loop = asyncio.get_running_loop()
         try:
-            transport = paramiko.Transport((hostname, int(port)))
-            transport.set_keepalive(60)
-            transport.connect(username=username, password=password)
-            ssh_client._transport = transport
-            channel = ssh_client.invoke_shell(term="xterm")
-            self.clients[tab_id]['channel'] = channel
+            # TCP connect, key exchange and auth block: keep them off the event loop
+            session.channel = await loop.run_in_executor(
+                None, self._open_channel, session.client, hostname, port, username, password)
         except paramiko.SSHException as e:
             await self.handle_ssh_error(tab_id, hostname, e, websocket)
         except Exception as e:
             print(f"SSH Server error: {e}")
 
+    @staticmethod
+    def _open_channel(ssh_client, hostname, port, username, password):
+        transport = paramiko.Transport((hostname, int(port)))
+        transport.set_keepalive(60)
+        transport.connect(username=username, password=password)
+        ssh_client._transport = transport
+        return ssh_client.invoke_shell(term="xterm")
+
     async def handle_ssh_error(self, tab_id, hostname, error, websocket):
         error_message = f"SSH connection error to {hostname}: {error}"
-        encoded_data = base64.b64encode(error_message.encode('utf-8')).decode('utf-8')
-        await websocket.send_json({'type': 'ssh_output', 'data': encoded_data, 'tabId': tab_id})
+        await self._send_frame(websocket, tab_id, error_message.encode('utf-8'))
 
     async def send_input(self, tab_id, input_data):
-        channel = self.clients[tab_id]['channel']
-        if channel:
-            channel.send(input_data)
+        session = self.clients.get(tab_id)
+        channel = session.channel if session else None
+        if not channel:
+            return
+        if isinstance(input_data, str):
+            input_data = input_data.encode('utf-8')
+        if len(input_data) <= self.DIRECT_SEND_BYTES and channel.send_ready():
+            sent = channel.send(input_data)
+            input_data = input_data[sent:]
+        if input_data:
+            # Paste, or the window is full: sendall waits for window space off the loop
+            await asyncio.get_running_loop().run_in_executor(None, channel.sendall, input_data)
 
     async def resize_terminal(self, tab_id, cols, rows):
-        channel = self.clients[tab_id]['channel']
-        if channel:
-            channel.resize_pty(width=cols, height=rows)
+        session = self.clients.get(tab_id)
+        if session and session.channel:
+            session.channel.resize_pty(width=cols, height=rows)
 
     async def disconnect(self, tab_id):
-        client_data = self.clients.pop(tab_id, None)
-        if client_data:
-            channel = client_data['channel']
-            client = client_data['client']
-            if channel:
-                channel.close()
-            client.close()
+        session = self.clients.pop(tab_id, None)
+        if session:
+            self._stop_reading(session)
+            if session.watch_event is not None:
+                session.watch_event.set()  # let the fallback watcher see the tab is gone
+            if session.flush_handle:
+                session.flush_handle.cancel()
+            if session.channel:
+                session.channel.close()
+            session.client.close()
+            if session.closed and not session.closed.done():
+                session.closed.set_result(None)
 
     async def listen_to_ssh_output(self, tab_id, websocket):
-        while True:
-            await asyncio.sleep(0.1)
-            channel = self.clients[tab_id]['channel']
-            if channel and channel.recv_ready():
-                data = channel.recv(1024)
-                encoded_data = base64.b64encode(data).decode('utf-8')
-                await websocket.send_json({'type': 'ssh_output', 'data': encoded_data, 'tabId': tab_id})
+        """Forward a tab's SSH output to the WebSocket until the channel closes"""
+        session = self.clients[tab_id]
+        session.websocket = websocket
+        if not session.channel:
+            return
+        session.closed = asyncio.get_running_loop().create_future()
+        self._start_reading(tab_id, session)
+        await session.closed
+
+    # ===== OUTPUT PATH =====
+
+    def _start_reading(self, tab_id, session):
+        if session.reading:
+            return
+        session.reading = True
+        loop = asyncio.get_running_loop()
+        if session.watch_thread is not None:
+            session.watch_event.set()  # fallback watcher: resume
+            return
+        try:
+            loop.add_reader(session.channel.fileno(), self._on_readable, tab_id)
+        except NotImplementedError:
+            # Event loops without add_reader (Windows proactor): one watcher thread that
+            # waits for readiness and hands the read to the loop
+            session.watch_event = threading.Event()
+            session.watch_event.set()
+            session.watch_thread = threading.Thread(
+                target=self._watch_channel, args=(loop, tab_id, session), daemon=True)
+            session.watch_thread.start()
+
+    def _stop_reading(self, session):
+        if not session.reading:
+            return
+        session.reading = False
+        if session.watch_thread is not None:
+            session.watch_event.clear()
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(session.channel.fileno())
+        except (NotImplementedError, RuntimeError, ValueError, OSError):
+            pass
+
+    def _watch_channel(self, loop, tab_id, session):
+        channel = session.channel
+        while tab_id in self.clients and (channel.recv_ready() or not channel.closed):
+            session.watch_event.wait()
+            select.select([channel], [], [], 1.0)
+            if channel.recv_ready() or channel.closed or channel.eof_received:
+                done = threading.Event()
+                loop.call_soon_threadsafe(lambda: (self._on_readable(tab_id), done.set()))
+                done.wait()
+                if not channel.recv_ready() and (channel.closed or channel.eof_received):
+                    break
+
+    def _on_readable(self, tab_id):
+        session = self.clients.get(tab_id)
+        if session is None or not session.reading:
+            return
+        channel = session.channel
+        try:
+            # Coalesce whatever is buffered (readiness means recv will not block); while a
+            # send is in flight keep reading up to the high watermark, where reading stops
+            limit = self.HIGH_WATERMARK if session.sending else self.FLUSH_BYTES
+            while channel.recv_ready() and len(session.pending) < limit:
+                session.pending += channel.recv(self.READ_SIZE)
+            at_eof = not channel.recv_ready() and (channel.closed or channel.eof_received)
+        except Exception as e:
+            print(f"Error while reading from channel: {e}")
+            at_eof = True
+
+        if at_eof:
+            self._stop_reading(session)
+            self._schedule_flush(tab_id, session, 0)
+            return
+
+        # Backpressure: the socket is not keeping up, leave output in the SSH window
+        if len(session.pending) >= self.HIGH_WATERMARK:
+            self._stop_reading(session)
+
+        delay = 0 if len(session.pending) >= self.FLUSH_BYTES else \
+            max(0.0, session.last_send + self.FLUSH_INTERVAL - time.monotonic())
+        self._schedule_flush(tab_id, session, delay)
+
+    def _schedule_flush(self, tab_id, session, delay):
+        if session.sending:
+            return  # the running send picks up the new output
+        if session.flush_handle is not None:
+            if delay > 0:
+                return  # the timer picks up the new output
+            session.flush_handle.cancel()
+            session.flush_handle = None
+        loop = asyncio.get_running_loop()
+        if delay <= 0:
+            session.sending = True
+            loop.create_task(self._flush(tab_id, session))
+        else:
+            session.flush_handle = loop.call_later(delay, self._flush_due, tab_id, session)
+
+    def _flush_due(self, tab_id, session):
+        session.flush_handle = None
+        self._schedule_flush(tab_id, session, 0)
+
+    async def _flush(self, tab_id, session):
+        try:
+            while session.pending:
+                data = bytes(session.pending)
+                session.pending.clear()
+                await self._send_frame(session.websocket, tab_id, data)
+                session.last_send = time.monotonic()
+                session.bytes_sent += len(data)
+                session.frames_sent += 1
+        except Exception as e:
+            print(f"WebSocket send failed for {tab_id}: {e}")
+        finally:
+            session.sending = False
+
+        channel = session.channel
+        if self.clients.get(tab_id) is not session:
+            return
+        if not channel.recv_ready() and (channel.closed or channel.eof_received):
+            if not session.reading and session.closed and not session.closed.done():
+                session.closed.set_result(None)
+        elif not session.reading and len(session.pending) <= self.LOW_WATERMARK:
+            self._start_reading(tab_id, session)
+
+    async def _send_frame(self, websocket, tab_id, data):
+        if self.binary_frames:
+            tab = str(tab_id).encode('utf-8')
+            await websocket.send_bytes(bytes([len(tab)]) + tab + data)
+        else:
+            encoded_data = base64.b64encode(data).decode('utf-8')
+            await websocket.send_json({'type': 'ssh_output', 'data': encoded_data, 'tabId': tab_id})
@@ -0,0 +1,264 @@
+"""
+Shared SSH I/O reactor
+One thread (or a small fixed pool) services the shell channels of every open terminal
+tab with a selector, instead of one reader thread per tab. Each channel keeps its own
+batching, flow control and logging (ShellOutputMixin); the reactor only decides when
+to read, flush and retry, and dispatches each batch through that tab's signals.
+"""
+
+import selectors
+import socket
+import threading
+import time
+from typing import List, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .sshshellreader import ShellOutputMixin, ChannelIOStats
+
+# Reactor threads shared by all tabs (sessions go to the least loaded one)
+REACTOR_POOL_SIZE = 2
+
+
+class ReactorShellReader(ShellOutputMixin, QObject):
+    """
+    Shell channel reader driven by a ShellIOReactor
+    Drop-in for ShellReaderThread: same signals, start/stop/wait/isRunning and flow control.
+    """
+    data_ready = pyqtSignal(str)
+    bytes_ready = pyqtSignal(bytes)  # raw batch, same cadence as data_ready
+
+    def __init__(self, channel, buffer, parent_widget, reactor=None):
+        super().__init__()
+        self._init_output(channel, buffer, parent_widget)
+        self._reactor: Optional['ShellIOReactor'] = reactor
+        self._started = False
+        self._done = threading.Event()
+
+        # Reactor-side state (only touched on the reactor thread)
+        self._selected = False
+        self._retry_at = 0.0
+
+    def start(self):
+        """Hand the channel to the reactor"""
+        if self._started:
+            return
+        if self._reactor is None:
+            self._reactor = get_shell_reactor()
+        self._started = True
+        self._reactor.register(self)
+
+    def isRunning(self) -> bool:
+        return self._started and not self._done.is_set()
+
+    def wait(self, msecs=None) -> bool:
+        """Wait for the reactor to finish with this channel (QThread.wait-style, in ms)"""
+        if not self._started:
+            return True
+        return self._done.wait(None if msecs is None else msecs / 1000)
+
+    def stop(self, timeout=2.0) -> bool:
+        """
+        Stop reading and wait for the final flush
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the reactor has released the channel
+        """
+        self.request_stop()
+        return self.wait(int(timeout * 1000))
+
+    def _wake(self):
+        if self._reactor is not None:
+            self._reactor.wake()
+
+
+class ShellIOReactor:
+    """Selector loop servicing many shell channels from one thread"""
+
+    def __init__(self, name: str = "ssh-io"):
+        self.name = name
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+
+        self._readers: List[ReactorShellReader] = []
+        self._added: List[ReactorShellReader] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    # ===== ANY THREAD =====
+
+    def register(self, reader: ReactorShellReader):
+        """Start servicing a reader's channel"""
+        with self._lock:
+            self._added.append(reader)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        self.wake()
+
+    def wake(self):
+        """Make the loop re-check stop requests, flow control and timers"""
+        try:
+            self._wake_w.send(b'\0')
+        except OSError:
+            pass  # buffer full: a wakeup is already pending
+
+    @property
+    def session_count(self) -> int:
+        with self._lock:
+            return len(self._readers) + len(self._added)
+
+    def stats(self) -> List[ChannelIOStats]:
+        """I/O counters of the sessions this reactor is servicing"""
+        with self._lock:
+            return [reader.stats for reader in self._readers + self._added]
+
+    # ===== REACTOR THREAD =====
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._added:
+                    self._readers.extend(self._added)
+                    self._added = []
+                readers = list(self._readers)
+
+            timeout = None
+            now = time.monotonic()
+            for reader in readers:
+                try:
+                    delay = self._update(reader, now)
+                except Exception as e:
+                    print(f" SSH reactor error on {reader.stats.label}: {e}")
+                    self._release(reader)
+                    continue
+                if delay is not None and (timeout is None or delay < timeout):
+                    timeout = delay
+
+            for key, _ in self._selector.select(timeout):
+                reader = key.data
+                if reader is None:
+                    self._drain_wakeups()
+                    continue
+                try:
+                    self._on_readable(reader)
+                except Exception as e:
+                    print(f" SSH reactor error on {reader.stats.label}: {e}")
+                    self._release(reader)
+
+    def _drain_wakeups(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def _update(self, reader: ReactorShellReader, now: float) -> Optional[float]:
+        """
+        Sync a reader's selector registration with its state and run its timers
+
+        Returns:
+            Seconds until this reader needs attention again, None if only on I/O
+        """
+        if reader._stop_requested.is_set() or reader.channel.closed:
+            self._release(reader)
+            return None
+
+        timeout = None
+        if not reader._flowing.is_set():
+            # Paused by flow control: hand over what is pending, then stop reading
+            if reader._pending:
+                reader._flush()
+            self._set_selected(reader, False)
+            return None
+
+        if reader._retry_at:
+            if now < reader._retry_at:
+                self._set_selected(reader, False)
+                return reader._retry_at - now
+            reader._retry_at = 0.0
+
+        self._set_selected(reader, True)
+        if reader._pending:
+            delay = reader._flush_delay()
+            if delay <= 0:
+                reader._flush()
+            else:
+                timeout = delay
+        return timeout
+
+    def _on_readable(self, reader: ReactorShellReader):
+        if not reader._selected or not reader._channel_ready():
+            return  # unregistered earlier in this round, or a stale readiness event
+        try:
+            if not reader._read_available():
+                self._release(reader)
+                return
+        except Exception as e:
+            delay = reader._read_error(e)
+            if delay is None:
+                self._release(reader)
+            else:
+                reader._retry_at = time.monotonic() + delay
+                self._set_selected(reader, False)
+            return
+
+        if reader._flush_delay() <= 0:
+            reader._flush()
+
+    def _set_selected(self, reader: ReactorShellReader, selected: bool):
+        if selected == reader._selected:
+            return
+        if selected:
+            self._selector.register(reader.channel, selectors.EVENT_READ, reader)
+        else:
+            try:
+                self._selector.unregister(reader.channel)
+            except (KeyError, ValueError, OSError):
+                pass
+        reader._selected = selected
+
+    def _release(self, reader: ReactorShellReader):
+        """Stop servicing a reader: final flush, release its log, wake its waiters"""
+        self._set_selected(reader, False)
+        with self._lock:
+            if reader in self._readers:
+                self._readers.remove(reader)
+        if reader._done.is_set():
+            return
+        try:
+            reader._finish()
+        finally:
+            reader._done.set()
+
+
+# ===== SHARED REACTORS =====
+
+_reactors: List[ShellIOReactor] = []
+_reactors_lock = threading.Lock()
+
+
+def get_shell_reactor() -> ShellIOReactor:
+    """Least loaded reactor of the shared pool (created on first use)"""
+    with _reactors_lock:
+        if len(_reactors) < REACTOR_POOL_SIZE:
+            reactor = ShellIOReactor(name=f"ssh-io-{len(_reactors)}")
+            _reactors.append(reactor)
+            return reactor
+        return min(_reactors, key=lambda r: r.session_count)
+
+
+def shell_io_stats() -> List[ChannelIOStats]:
+    """I/O counters of every session serviced by the shared reactors"""
+    with _reactors_lock:
+        reactors = list(_reactors)
+    stats = []
+    for reactor in reactors:
+        stats.extend(reactor.stats())
+    return stats
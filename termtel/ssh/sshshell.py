@@ -1,16 +1,39 @@
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from .sshshellreader import ShellReaderThread
+from .ssh_reactor import ReactorShellReader
+from .bulk_sender import BulkSender, BulkSendOptions
 from .ssh_key_config import SSHKeyConfig
+from .transport_cache import ssh_transport_cache, CachedHostKeyPolicy, HostKeyChangedError, check_host_key
+from .connection_broker import ssh_connection_broker, SharedSSHClient
 from PyQt6.QtWidgets import QMessageBox
 import paramiko
 import warnings
 import socket
+import base64
 
 
 class Backend(QObject):
     send_output = pyqtSignal(str)
+    output_batch = pyqtSignal(str)  # base64 raw output batch for xterm.js, see attach_output()
+    paste_progress = pyqtSignal(int, int)  # bytes sent, total bytes of a bulk paste
+    paste_finished = pyqtSignal(bool, str)  # completed, message
     buffer = ""
 
+    # Renderer flow control: output emitted to the page but not yet acknowledged as
+    # written by xterm.js. Above the high watermark the reader stops reading the channel.
+    OUTPUT_HIGH_WATERMARK = 256 * 1024
+    OUTPUT_LOW_WATERMARK = 64 * 1024
+
+    # Read the channel on the shared I/O reactor (ssh_reactor) rather than a thread per tab
+    SHARED_IO_REACTOR = True
+
+    # Open the shell on an already authenticated transport to the same host/user when one
+    # exists (e.g. telemetry), and offer ours for reuse (connection_broker)
+    SHARE_TRANSPORTS = True
+
+    # Writes at least this large (pastes) are paced from a worker thread (bulk_sender)
+    BULK_SEND_THRESHOLD = 2048
+
     def __init__(self, host, username, password=None, port='22', key_path=None, parent_widget=None, parent=None):
         super().__init__(parent)
         self.parent_widget = parent_widget
@@ -18,6 +41,15 @@ class Backend(QObject):
         self.channel = None
         self.reader_thread = None
         self.auth_method_used = None
+        self._expected_host_key = ""  # cached fingerprint the server must present
+
+        # Output held until the page subscribes to output_batch
+        self._output_attached = False
+        self._held_output = []
+
+        # Bulk paste in progress, and input typed while it runs (sent after it)
+        self._bulk_sender = None
+        self._queued_input = []
 
         # Initialize SSH key config manager
         self.key_config = SSHKeyConfig()
@@ -61,6 +93,7 @@ class Backend(QObject):
             "ssh-dss",
         )
 
+        cached = None
         try:
             # Apply transport settings
             self._apply_transport_settings()
@@ -73,17 +106,31 @@ class Backend(QObject):
             username = str(username).strip()
             port = int(port)
 
+            # Setup that worked for this host before: skip the probe handshakes
+            cached = ssh_transport_cache.get(host, port, username)
+            if cached:
+                print(f"Using cached transport setup for {host}:{port} ({cached.auth_method})")
+            # Refuse a host key other than the cached one before any credentials are sent
+            self._expected_host_key = cached.host_key_fingerprint if cached else ""
+            self.client.set_missing_host_key_policy(CachedHostKeyPolicy(self._expected_host_key))
+
             # Check if password is blank and use key auth
             password = str(password).strip() if password else ""
 
-            if password == "" and key_path is None:
+            lease = ssh_connection_broker.acquire(host, port, username) if self.SHARE_TRANSPORTS else None
+
+            if lease is not None:
+                # Another session is already logged in to this host as this user
+                self.client = SharedSSHClient(lease)
+                self.auth_method_used = "shared"
+            elif password == "" and key_path is None:
                 # Password is blank and no explicit key_path provided
                 print(f"Password is blank, attempting key-based authentication")
                 detected_key_path = self.key_config.get_key_path(host=host, username=username)
 
                 if detected_key_path:
                     print(f"Found key in config: {detected_key_path}")
-                    self._try_key_auth(host, port, username, detected_key_path)
+                    self._try_key_auth(host, port, username, detected_key_path, probe=cached is None)
                 else:
                     self.notify("Authentication Error",
                                 f"No password provided and no SSH key found in config.\n"
@@ -91,17 +138,22 @@ class Backend(QObject):
                     return
             elif key_path:
                 # Explicit key_path was provided
-                self._try_key_auth(host, port, username, key_path)
+                self._try_key_auth(host, port, username, key_path, probe=cached is None)
             else:
                 # Password authentication
-                available_methods = self._detect_available_auth_methods(host, port, username)
                 auth_methods_to_try = ["password", "keyboard-interactive"]
 
-                if available_methods:
-                    auth_methods_to_try = [method for method in auth_methods_to_try if method in available_methods]
-                    if not auth_methods_to_try:
-                        print(f"No matching auth methods found, falling back to defaults")
-                        auth_methods_to_try = ["password", "keyboard-interactive"]
+                if cached and cached.auth_method in auth_methods_to_try:
+                    # Known good method first, the other one only as a fallback
+                    auth_methods_to_try.remove(cached.auth_method)
+                    auth_methods_to_try.insert(0, cached.auth_method)
+                else:
+                    available_methods = self._detect_available_auth_methods(host, port, username)
+                    if available_methods:
+                        auth_methods_to_try = [method for method in auth_methods_to_try if method in available_methods]
+                        if not auth_methods_to_try:
+                            print(f"No matching auth methods found, falling back to defaults")
+                            auth_methods_to_try = ["password", "keyboard-interactive"]
 
                 auth_success = False
                 for auth_method in auth_methods_to_try:
@@ -119,8 +171,13 @@ class Backend(QObject):
                             self._try_keyboard_interactive_auth(host, port, username, password)
                             auth_success = True
                             self.auth_method_used = "keyboard-interactive"
+                    except HostKeyChangedError:
+                        raise
                     except (paramiko.AuthenticationException, paramiko.SSHException) as e:
                         print(f"Auth method {auth_method} failed: {e}")
+                        if cached and auth_method == cached.auth_method:
+                            ssh_transport_cache.invalidate(host, port, username, f"{auth_method} failed")
+                            cached = None
                         continue
 
                 if not auth_success:
@@ -143,6 +200,13 @@ class Backend(QObject):
                     print(f"  Negotiated KEX: {transport._agreed_kex_algorithm}")
                 else:
                     print(f"  Negotiated KEX: (not available)")
+
+                if self.SHARE_TRANSPORTS and not isinstance(self.client, SharedSSHClient):
+                    self.client = SharedSSHClient(
+                        ssh_connection_broker.register(host, port, username, transport))
+
+                if self.auth_method_used and self.auth_method_used != "shared":
+                    ssh_transport_cache.record(host, port, username, self.auth_method_used, transport)
             else:
                 print("✗ ERROR: No transport available!")
                 self.notify("Connection Error", "Failed to get transport from client")
@@ -152,7 +216,15 @@ class Backend(QObject):
             self.setup_shell()
             print("✓ Backend initialization complete!")
 
+        except HostKeyChangedError as e:
+            ssh_transport_cache.invalidate(host, port, username, "host key changed")
+            self.notify("Host Key Changed",
+                        f"{e}\nThe connection was aborted before authenticating. "
+                        f"Verify the device's key, then reconnect to accept it.")
+            print(f"✗ {e}")
         except Exception as e:
+            if cached:
+                ssh_transport_cache.invalidate(host, port, username, "connection failed")
             self.notify("Connection Error", str(e))
             print(f"✗ Backend initialization failed: {e}")
             import traceback
@@ -342,12 +414,14 @@ class Backend(QObject):
 
         return []
 
-    def _try_key_auth(self, host, port, username, key_path):
-        """Try authentication with RSA/ED25519/ECDSA key"""
+    def _try_key_auth(self, host, port, username, key_path, probe=True):
+        """Try authentication with RSA/ED25519/ECDSA key (probe: log server algorithms first)"""
         print(f"Trying key authentication with {key_path}")
 
-        # Optional: Detect server algorithms (with timeout, won't hang)
-        self._detect_server_algorithms(host, port, timeout=3)
+        # Optional: Detect server algorithms (with timeout, won't hang). Skipped when the
+        # transport cache already knows this host.
+        if probe:
+            self._detect_server_algorithms(host, port, timeout=3)
 
         transport = None
 
@@ -415,6 +489,8 @@ class Backend(QObject):
             print(f"✗ Key requires passphrase")
             self.notify("Key Error", f"SSH key is encrypted and requires a passphrase.\nKey: {key_path}")
             raise
+        except HostKeyChangedError:
+            raise
         except paramiko.AuthenticationException as e:
             print(f"✗ Authentication failed: {e}")
             self.notify("Login Failure", f"Key Authentication Failed: {host}\nKey: {key_path}\nError: {e}")
@@ -451,10 +527,15 @@ class Backend(QObject):
             self.client.close()
 
         self.client = paramiko.SSHClient()
-        self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        self.client.set_missing_host_key_policy(CachedHostKeyPolicy(self._expected_host_key))
 
         transport = paramiko.Transport((host, port))
         transport.start_client()
+        try:
+            check_host_key(host, transport.get_remote_server_key(), self._expected_host_key)
+        except HostKeyChangedError:
+            transport.close()
+            raise
 
         def handler(title, instructions, prompt_list):
             print(f"Interactive auth: Received {len(prompt_list)} prompts")
@@ -495,14 +576,56 @@ class Backend(QObject):
                 return
 
         if self.channel is not None:
-            print("  → Starting ShellReaderThread...")
-            self.reader_thread = ShellReaderThread(self.channel, self.buffer, parent_widget=self.parent_widget)
+            reader_class = ReactorShellReader if self.SHARED_IO_REACTOR else ShellReaderThread
+            print(f"  → Starting {reader_class.__name__}...")
+            self.reader_thread = reader_class(self.channel, self.buffer, parent_widget=self.parent_widget)
             self.reader_thread.data_ready.connect(self.send_output)
+            self.reader_thread.bytes_ready.connect(self._on_output_bytes)
+            self.reader_thread.set_flow_control(self.OUTPUT_HIGH_WATERMARK, self.OUTPUT_LOW_WATERMARK)
             self.reader_thread.start()
-            print("  ✓ ShellReaderThread started")
+            print(f"  ✓ {reader_class.__name__} started")
         else:
             print("  ✗ ERROR: Channel is None!")
 
+    def _on_output_bytes(self, data):
+        """Forward a raw output batch to the page (held until the page attaches)"""
+        if self._bulk_sender is not None:
+            self._bulk_sender.feed_output(data)
+        if self._output_attached:
+            self.output_batch.emit(base64.b64encode(data).decode('ascii'))
+        else:
+            self._held_output.append(data)
+
+    @pyqtSlot()
+    def attach_output(self):
+        """Called by the page once it is connected to output_batch: replay held output"""
+        self._output_attached = True
+        if self._held_output:
+            data = b''.join(self._held_output)
+            self._held_output = []
+            self.output_batch.emit(base64.b64encode(data).decode('ascii'))
+
+    @pyqtSlot(int)
+    def ack_output(self, count):
+        """Called by the page when xterm.js has processed count bytes"""
+        if self.reader_thread:
+            self.reader_thread.acknowledge(count)
+
+    def io_stats(self):
+        """Byte/batch/latency counters of this session's reader (ChannelIOStats), or None"""
+        return self.reader_thread.stats if self.reader_thread is not None else None
+
+    def search_scrollback(self, query, limit=100):
+        """
+        Search this session's output history (escape sequences stripped)
+
+        Returns:
+            (line number, line) pairs; scrollback_registry.search() covers all tabs
+        """
+        if self.reader_thread is None:
+            return []
+        return self.reader_thread.scrollback.search(query, limit)
+
     def notify(self, message, info):
         msg = QMessageBox()
         msg.setIcon(QMessageBox.Icon.Information)
@@ -513,18 +636,77 @@ class Backend(QObject):
 
     @pyqtSlot(str)
     def write_data(self, data):
-        if self.channel and self.channel.send_ready():
+        if not self.channel or self.channel.closed:
+            print("Error: Channel is not ready or doesn't exist")
+            self.notify("Error", "Channel is not ready or doesn't exist")
+            return
+
+        if self._bulk_sender is not None:
+            # Keep typing in order behind the paste; Ctrl+C aborts the paste
+            if '\x03' in data:
+                self._bulk_sender.cancel()
+            self._queued_input.append(data)
+            return
+
+        payload = data.encode('utf-8')
+        if len(payload) < self.BULK_SEND_THRESHOLD and self.channel.send_ready():
             try:
-                self.channel.send(data)
+                sent = self.channel.send(payload)
             except paramiko.SSHException as e:
                 print(f"Error while writing to channel: {e}")
+                return
             except Exception as e:
                 print(f"Channel error {e}")
                 self.notify("Closed", "Connection is closed.")
-                pass
-        else:
-            print("Error: Channel is not ready or doesn't exist")
+                return
+            if sent >= len(payload):
+                return
+            payload = payload[sent:]
+
+        # Large paste, or the channel window is (briefly) full: send from a worker
+        # thread instead of blocking or failing on the UI thread
+        self._start_bulk_send(payload, BulkSendOptions())
+
+    @pyqtSlot(str, bool)
+    def send_paste(self, text, line_sync):
+        """
+        Paste text with pacing (called by the page)
+
+        Args:
+            text: Text to send (line endings are sent as CR, like typed Enter)
+            line_sync: Send one line at a time, waiting for the device prompt after each
+        """
+        if not self.channel or self.channel.closed:
             self.notify("Error", "Channel is not ready or doesn't exist")
+            return
+        payload = text.replace('\r\n', '\r').replace('\n', '\r').encode('utf-8')
+        if self._bulk_sender is not None:
+            print("Paste already in progress, ignoring new paste")
+            return
+        self._start_bulk_send(payload, BulkSendOptions(line_sync=line_sync))
+
+    @pyqtSlot()
+    def cancel_paste(self):
+        if self._bulk_sender is not None:
+            self._bulk_sender.cancel()
+
+    def _start_bulk_send(self, payload, options):
+        self._bulk_sender = BulkSender(self.channel, payload, options, parent=self)
+        self._bulk_sender.progress.connect(self.paste_progress)
+        self._bulk_sender.finished.connect(self._on_bulk_send_finished)
+        print(f" Bulk send started: {len(payload)} bytes{' (line sync)' if options.line_sync else ''}")
+        self._bulk_sender.start()
+
+    def _on_bulk_send_finished(self, completed, message):
+        print(f" Bulk send {'finished' if completed else 'stopped'}: {message}")
+        sender, self._bulk_sender = self._bulk_sender, None
+        if sender is not None:
+            sender.deleteLater()
+        self.paste_finished.emit(completed, message)
+
+        queued, self._queued_input = ''.join(self._queued_input), []
+        if queued and self.channel and not self.channel.closed:
+            self.write_data(queued)
 
     @pyqtSlot(str)
     def set_pty_size(self, data):
@@ -541,14 +723,53 @@ class Backend(QObject):
         else:
             print("Error: Channel is not ready or doesn't exist")
 
+    # Seconds close() waits for the reader thread before closing the channel under it
+    READER_STOP_TIMEOUT = 2.0
+
+    def request_stop(self):
+        """Ask the reader thread to stop without waiting (lets several tabs stop in parallel)"""
+        if self.reader_thread is not None:
+            self.reader_thread.request_stop()
+
+    def close(self, timeout=None) -> bool:
+        """
+        Stop the reader thread and close the SSH channel and client
+
+        Args:
+            timeout: Seconds to wait for the reader (default READER_STOP_TIMEOUT)
+
+        Returns:
+            True if the reader thread exited cleanly
+        """
+        if timeout is None:
+            timeout = self.READER_STOP_TIMEOUT
+        if self._bulk_sender is not None:
+            self._bulk_sender.cancel()
+        stopped = True
+        reader = self.reader_thread
+        if reader is not None and reader.isRunning():
+            stopped = reader.stop(timeout)
+            if not stopped:
+                print(f" Shell reader did not stop within {timeout}s, closing channel under it")
+
+        if self.channel:
+            try:
+                self.channel.close()
+            except Exception as e:
+                print(f"Error closing channel: {e}")
+        if self.client:
+            try:
+                self.client.close()
+            except Exception as e:
+                print(f"Error closing SSH client: {e}")
+
+        if reader is not None and not stopped:
+            # A closed channel wakes the reader's select(), so this normally returns at once
+            stopped = reader.wait(int(timeout * 1000))
+        return stopped
+
     def __del__(self):
         try:
-            if self.reader_thread and self.reader_thread.isRunning():
-                self.reader_thread.terminate()
+            self.close(timeout=0.5)
         except:
-            pass
-        if self.channel:
-            self.channel.close()
-
-        if self.client:
-            self.client.close()
\ No newline at end of file
+            pass
\ No newline at end of file
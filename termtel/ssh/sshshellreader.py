@@ -1,11 +1,56 @@
 from PyQt6.QtCore import pyqtSignal, QThread
-import os
+from dataclasses import dataclass
+import codecs
+import select
+import socket
+import threading
+import time
 
-class ShellReaderThread(QThread):
-    data_ready = pyqtSignal(str)
+from .session_logger import open_session_log, release_session_log
+from .scrollback import scrollback_registry
 
-    def __init__(self, channel, buffer, parent_widget):
-        super().__init__()
+
+@dataclass
+class ChannelIOStats:
+    """Per-session I/O counters (read by the UI thread, updated by the reader)"""
+    label: str = ""
+    bytes_received: int = 0
+    reads: int = 0
+    batches: int = 0
+    read_errors: int = 0
+    total_batch_delay: float = 0.0  # seconds output waited between first read and emit
+    max_batch_delay: float = 0.0
+    last_activity: float = 0.0  # time.monotonic() of the last read
+
+    @property
+    def avg_batch_delay_ms(self) -> float:
+        return (self.total_batch_delay / self.batches * 1000) if self.batches else 0.0
+
+    @property
+    def max_batch_delay_ms(self) -> float:
+        return self.max_batch_delay * 1000
+
+
+class ShellOutputMixin:
+    """
+    Channel output handling shared by the dedicated reader thread and the shared
+    I/O reactor: read batching, UTF-8 decoding, flow control, logging and stats.
+    The concrete class provides the data_ready/bytes_ready signals and _wake().
+    """
+
+    # Bulk output (show tech, big configs) is read in large chunks and coalesced, so the
+    # terminal gets one batch per flush interval instead of one per 1 KB
+    READ_SIZE = 32768          # bytes per channel.recv()
+    FLUSH_INTERVAL = 0.008     # seconds between emits while output keeps arriving
+    FLUSH_BYTES = 65536        # emit early once this much output is pending
+
+    # Read errors back off exponentially instead of spinning; the reader gives up after
+    # MAX_READ_ERRORS in a row or as soon as the transport is gone
+    ERROR_BACKOFF_INITIAL = 0.05
+    ERROR_BACKOFF_MAX = 2.0
+    MAX_READ_ERRORS = 10
+
+    def _init_output(self, channel, buffer, parent_widget):
         self.channel = channel
         self.intial_buffer = buffer
         self.parent_widget = parent_widget
@@ -14,44 +59,286 @@ class ShellReaderThread(QThread):
         else:
             self.log_filename = "../logs/session.log"
 
-        # Ensure log directory exists
-        os.makedirs(os.path.dirname(self.log_filename), exist_ok=True)
+        # Shared background writer for this log file (creates the log directory)
+        self.session_logger = open_session_log(self.log_filename)
+
+        # Incremental decoder: a multibyte character split across two reads is held
+        # back until its remaining bytes arrive instead of raising/garbling
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._pending = []
+        self._pending_bytes = 0
+        self._batch_started = 0.0
+        self._last_emit = 0.0
+
+        # Flow control: while cleared, the channel is not read, so the SSH window fills
+        # and the device stops sending until the renderer catches up
+        self._flowing = threading.Event()
+        self._flowing.set()
+        self._flow_lock = threading.Lock()
+        self._unacked = 0
+        self.high_watermark = None  # disabled until set_flow_control()
+        self.low_watermark = 0
+
+        self._stop_requested = threading.Event()
+        self._read_errors = 0
+        self.stats = ChannelIOStats(label=str(getattr(parent_widget, 'host', '') or ''))
+
+        # Searchable copy of the output, kept after the tab closes (see scrollback)
+        self.scrollback = scrollback_registry.open_session(self.stats.label or self.log_filename)
+
+    def set_flow_control(self, high_watermark, low_watermark):
+        """
+        Pause reading once more than high_watermark emitted bytes are unacknowledged,
+        resume when acknowledge() brings that back to low_watermark
+        """
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+
+    def acknowledge(self, count):
+        """Consumer has processed count emitted bytes (thread-safe)"""
+        with self._flow_lock:
+            self._unacked = max(0, self._unacked - count)
+            if self._unacked <= self.low_watermark and not self._flowing.is_set():
+                self._flowing.set()
+                self._wake()
+
+    def pause_reading(self):
+        """Stop reading from the channel (thread-safe)"""
+        self._flowing.clear()
+
+    def resume_reading(self):
+        """Resume reading from the channel (thread-safe)"""
+        self._flowing.set()
+        self._wake()
+
+    def request_stop(self):
+        """Ask the reader to flush and exit (thread-safe, returns immediately)"""
+        self._stop_requested.set()
+        self._wake()
+
+    @property
+    def paused(self) -> bool:
+        return not self._flowing.is_set()
+
+    @property
+    def unacknowledged_bytes(self) -> int:
+        return self._unacked
 
     def log_data(self, data):
-        # Make sure that a log filename was provided
-        if self.log_filename is not None:
-            try:
-                # Attempt to encode and decode the data as UTF-8 to ensure it's valid
-                data = data.encode('utf-8', 'ignore').decode('utf-8', 'ignore')
-                data = data.replace('\r\n', '\n').replace('\r', '\n')
-                with open(self.log_filename, 'a', encoding='utf-8') as log_file: # 'a' option will append data to the end of the file
-                    # log_file.write(data + os.linesep)
-                    log_file.write(data)
-            except UnicodeError:
-                print("Failed to encode data as UTF-8.")
+        # Handed to the session logger thread: no disk I/O on the reader thread
+        if self.session_logger is not None:
+            self.session_logger.write(data)
 
+    def _close_log(self):
+        if self.session_logger is not None:
+            release_session_log(self.log_filename)
+            self.session_logger = None
 
-    def run(self):
-        while True:
-            if not self.channel.closed:
-                try:
-                    data = self.channel.recv(1024)
+    def _channel_ready(self) -> bool:
+        return self.channel.recv_ready() or self.channel.closed or self.channel.eof_received
+
+    def _queue(self, data):
+        """Add raw output to the pending batch"""
+        if data:
+            if not self._pending:
+                self._batch_started = time.monotonic()
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            self.stats.reads += 1
+            self.stats.bytes_received += len(data)
+
+    def _read_available(self) -> bool:
+        """
+        Read what the channel has buffered, up to the batch size (channel must be ready)
+
+        Returns:
+            False at EOF
+        """
+        data = self.channel.recv(self.READ_SIZE)
+        if not data:
+            # Remote end sent EOF (or the channel was closed under us)
+            if self.channel.eof_received:
+                self.channel.close()
+            return False
+        self._read_errors = 0
+        self.stats.last_activity = time.monotonic()
+        self._queue(data)
+
+        # Drain whatever else is already buffered, up to the batch size
+        while self._pending_bytes < self.FLUSH_BYTES and self.channel.recv_ready():
+            self._queue(self.channel.recv(self.READ_SIZE))
+        return True
+
+    def _flush_delay(self) -> float:
+        """
+        Seconds to hold the pending batch for more output, 0 to emit now.
+        The first chunk after a quiet period (keystroke echo, prompts) goes out at once.
+        """
+        if self._pending_bytes >= self.FLUSH_BYTES:
+            return 0.0
+        return max(0.0, self._last_emit + self.FLUSH_INTERVAL - time.monotonic())
 
-                    if data:
-                        data_decoded = data.decode()
-                        # Log data that is being received
-                        self.log_data(data_decoded)
+    def _read_error(self, error):
+        """
+        Record a read error
 
-                        # for debugging
-                        if self.intial_buffer == "":
-                            self.intial_buffer = bytes(data).decode('utf-8')
-                            self.parent_widget.initial_buffer = bytes(data).decode('utf-8')
+        Returns:
+            Seconds to back off before reading again, None to give up
+        """
+        self._read_errors += 1
+        self.stats.read_errors += 1
+        print(f"Error while reading from channel: {error}")
+        self.log_data(f"Error while reading from channel: {error}")
 
-                        self.data_ready.emit(data_decoded)
+        transport = self.channel.get_transport()
+        if self.channel.closed or transport is None or not transport.is_active():
+            return None
+        if self._read_errors >= self.MAX_READ_ERRORS:
+            print(f"Giving up after {self._read_errors} consecutive read errors")
+            return None
+        return min(self.ERROR_BACKOFF_INITIAL * 2 ** (self._read_errors - 1), self.ERROR_BACKOFF_MAX)
+
+    def _flush(self, final=False):
+        """Emit the pending batch (raw and decoded) and log it"""
+        now = time.monotonic()
+        self._last_emit = now
+        data = b''.join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+
+        data_decoded = self._decoder.decode(data, final=final)
+        if data:
+            delay = now - self._batch_started
+            self.stats.batches += 1
+            self.stats.total_batch_delay += delay
+            if delay > self.stats.max_batch_delay:
+                self.stats.max_batch_delay = delay
+            if self.high_watermark is not None:
+                # Counted before the emit, so the consumer can never ack ahead of the count
+                with self._flow_lock:
+                    self._unacked += len(data)
+                    if self._unacked > self.high_watermark:
+                        self._flowing.clear()
+            self.bytes_ready.emit(data)
+        if not data_decoded:
+            return
+
+        # Log data that is being received
+        self.log_data(data_decoded)
+        self.scrollback.feed(data_decoded)
+
+        # for debugging
+        if self.intial_buffer == "":
+            self.intial_buffer = data_decoded
+            self.parent_widget.initial_buffer = data_decoded
+
+        self.data_ready.emit(data_decoded)
+
+    def _finish(self):
+        """Flush the final batch and release the log (reader is done with the channel)"""
+        try:
+            self._flush(final=True)
+        except Exception as e:
+            print(f"Error flushing final output: {e}")
+        if self._stop_requested.is_set():
+            print("Shell reader stopped")
+        else:
+            print("Channel closed...")
+            self.log_data("Channel closed...")
+        self._close_log()
+        scrollback_registry.close_session(self.scrollback)
+
+
+class ShellReaderThread(ShellOutputMixin, QThread):
+    """Dedicated reader thread for one channel (see ssh_reactor for the shared reader)"""
+    data_ready = pyqtSignal(str)
+    bytes_ready = pyqtSignal(bytes)  # raw batch, same cadence as data_ready
+
+    def __init__(self, channel, buffer, parent_widget):
+        super().__init__()
+        self._init_output(channel, buffer, parent_widget)
+
+        # The loop blocks in select() on the channel plus a wakeup socket, so an idle tab
+        # uses no CPU and stop()/resume wake it immediately
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+
+    def stop(self, timeout=2.0) -> bool:
+        """
+        Stop the reader and wait for it to exit
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if the thread has finished
+        """
+        self.request_stop()
+        return self.wait(int(timeout * 1000))
+
+    def _wake(self):
+        try:
+            self._wake_w.send(b'\0')
+        except OSError:
+            pass  # buffer full (a wakeup is already pending) or already closed
+
+    def _drain_wakeups(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def _wait(self, timeout, channel=True) -> bool:
+        """
+        Block until the channel has data, a wakeup arrives, or timeout passes
+
+        Args:
+            timeout: Seconds, None to wait indefinitely
+            channel: Include the channel (False while paused or backing off)
+
+        Returns:
+            True if the channel is ready to read (data, EOF or closed)
+        """
+        if channel and self._channel_ready():
+            return True
+        watched = [self._wake_r, self.channel] if channel else [self._wake_r]
+        readable, _, _ = select.select(watched, [], [], timeout)
+        if self._wake_r in readable:
+            self._drain_wakeups()
+        return channel and self._channel_ready()
+
+    def run(self):
+        try:
+            while not self._stop_requested.is_set() and not self.channel.closed:
+                if not self._flowing.is_set():
+                    # Paused by flow control: sleep until acknowledged (or stopped)
+                    if self._pending:
+                        self._flush()
+                    self._wait(None, channel=False)
+                    continue
+
+                if not self._wait(None):
+                    continue  # woken for stop or flow control
+
+                try:
+                    if not self._read_available():
+                        break
                 except Exception as e:
-                    print(f"Error while reading from channel: {e}")
-                    self.log_data(f"Error while reading from channel: {e}")
-            else:
-                print("Channel closed...")
-                self.log_data("Channel closed...")
-                break
+                    delay = self._read_error(e)
+                    if delay is None:
+                        break
+                    self._wait(delay, channel=False)
+                    continue
+
+                # Output keeps streaming: hold the batch for the rest of the flush interval
+                delay = self._flush_delay()
+                if delay > 0 and self._wait(delay) and not self.channel.closed:
+                    continue
+
+                self._flush()
+        finally:
+            self._finish()
+            self._wake_r.close()
+            self._wake_w.close()
@@ -0,0 +1,203 @@
+"""
+Persistent SSH transport setup cache
+Remembers, per host/port/username, the auth method that worked and the host key
+fingerprint, so repeat connections skip the algorithm and auth-method probe
+handshakes. The server's host key is checked against the cached fingerprint before
+authenticating; a different key aborts the connection and drops the entry. Entries
+also expire after a TTL and are dropped when a connection using them fails.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+from typing import Dict, Optional
+
+import paramiko
+
+
+@dataclass
+class TransportCacheEntry:
+    """What a successful connection to one host/port/username negotiated"""
+    auth_method: str
+    host_key_type: str = ""
+    host_key_fingerprint: str = ""  # SHA256:... (OpenSSH format)
+    updated_at: float = 0.0  # epoch seconds
+
+    def age(self) -> float:
+        return time.time() - self.updated_at
+
+
+def host_key_fingerprint(key) -> str:
+    """OpenSSH-style SHA256 fingerprint of a paramiko PKey"""
+    digest = hashlib.sha256(key.asbytes()).digest()
+    return "SHA256:" + base64.b64encode(digest).decode('ascii').rstrip('=')
+
+
+class HostKeyChangedError(paramiko.SSHException):
+    """The server presented a host key other than the one cached for it"""
+
+    def __init__(self, hostname, expected: str, actual: str):
+        super().__init__(f"Host key for {hostname} changed ({expected} -> {actual})")
+        self.hostname = hostname
+        self.expected = expected
+        self.actual = actual
+
+
+def check_host_key(hostname, key, expected_fingerprint: str):
+    """
+    Compare a server's host key with its cached fingerprint
+
+    Args:
+        hostname: Host the key came from (for the error)
+        key: Server host key (paramiko PKey)
+        expected_fingerprint: Cached fingerprint, '' when nothing is known yet
+
+    Raises:
+        HostKeyChangedError: if the key does not match
+    """
+    if not expected_fingerprint:
+        return
+    actual = host_key_fingerprint(key)
+    if actual != expected_fingerprint:
+        raise HostKeyChangedError(hostname, expected_fingerprint, actual)
+
+
+class CachedHostKeyPolicy(paramiko.AutoAddPolicy):
+    """AutoAddPolicy that refuses a key which differs from the cached fingerprint"""
+
+    def __init__(self, expected_fingerprint: str = ""):
+        self.expected_fingerprint = expected_fingerprint
+
+    def missing_host_key(self, client, hostname, key):
+        check_host_key(hostname, key, self.expected_fingerprint)
+        super().missing_host_key(client, hostname, key)
+
+
+class SSHTransportCache:
+    """Per-host transport setup cache backed by a JSON file"""
+
+    DEFAULT_TTL = 7 * 24 * 3600  # seconds
+
+    def __init__(self, cache_path=None, ttl: float = DEFAULT_TTL):
+        if cache_path is None:
+            # Next to the SSH key config
+            self.cache_path = Path.home() / ".ssh_manager" / "transport_cache.json"
+        else:
+            self.cache_path = Path(cache_path)
+        self.ttl = ttl
+        self._entries: Optional[Dict[str, TransportCacheEntry]] = None  # loaded on first use
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(host, port, username) -> str:
+        return f"{username}@{host}:{port}"
+
+    def _load(self) -> Dict[str, TransportCacheEntry]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                raw = json.load(f)
+            known = {f.name for f in fields(TransportCacheEntry)}
+            for key, values in raw.items():
+                if isinstance(values, dict) and values.get('auth_method'):
+                    self._entries[key] = TransportCacheEntry(**{k: v for k, v in values.items() if k in known})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading SSH transport cache: {e}")
+        return self._entries
+
+    def _save(self):
+        """Write the cache atomically (concurrent app instances never see a partial file)"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump({key: asdict(entry) for key, entry in self._entries.items()}, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"Error saving SSH transport cache: {e}")
+
+    def get(self, host, port, username) -> Optional[TransportCacheEntry]:
+        """
+        Fresh cache entry for a host, if any
+
+        Args:
+            host: Hostname/IP
+            port: SSH port
+            username: SSH username
+
+        Returns:
+            TransportCacheEntry, or None when missing or older than the TTL
+        """
+        with self._lock:
+            entry = self._load().get(self._key(host, port, username))
+            if entry is None or entry.age() > self.ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry
+
+    def record(self, host, port, username, auth_method, transport=None) -> TransportCacheEntry:
+        """
+        Store the setup of a successful connection
+
+        Args:
+            host: Hostname/IP
+            port: SSH port
+            username: SSH username
+            auth_method: Auth method that succeeded
+            transport: Connected paramiko Transport (host key)
+
+        Returns:
+            The new entry
+        """
+        entry = TransportCacheEntry(auth_method=auth_method, updated_at=time.time())
+        if transport is not None:
+            try:
+                key = transport.get_remote_server_key()
+                entry.host_key_type = key.get_name()
+                entry.host_key_fingerprint = host_key_fingerprint(key)
+            except Exception:
+                pass
+
+        with self._lock:
+            entries = self._load()
+            entries[self._key(host, port, username)] = entry
+            self._save()
+        return entry
+
+    def invalidate(self, host, port, username, reason: str = ""):
+        """Drop a host's entry (its cached setup failed or no longer applies)"""
+        with self._lock:
+            if self._load().pop(self._key(host, port, username), None) is not None:
+                print(f"SSH transport cache: dropped {self._key(host, port, username)}"
+                      f"{f' ({reason})' if reason else ''}")
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'entries': len(self._load()),
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# Global instance
+ssh_transport_cache = SSHTransportCache()
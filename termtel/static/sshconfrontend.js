@@ -104,6 +104,133 @@ window.handle_output = function(data) {
     term.write(data);
 };
 
+// Output stream: the backend pushes raw byte batches (base64) over the web channel.
+// xterm.js decodes UTF-8 itself; each batch is acknowledged once xterm.js has processed
+// it, and the backend stops reading the SSH channel while too much is unacknowledged.
+const OUTPUT_ACK_BYTES = 32768;  // ack at least this much at once
+const OUTPUT_ACK_DELAY = 10;     // ms before acking a smaller remainder
+let outputUnacked = 0;
+let outputAckTimer = null;
+
+function base64ToBytes(b64) {
+    const binary = atob(b64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+
+function flushOutputAck() {
+    if (outputAckTimer) {
+        clearTimeout(outputAckTimer);
+        outputAckTimer = null;
+    }
+    if (outputUnacked > 0 && window.backend) {
+        window.backend.ack_output(outputUnacked);
+        outputUnacked = 0;
+    }
+}
+
+function ackOutput(count) {
+    outputUnacked += count;
+    if (outputUnacked >= OUTPUT_ACK_BYTES) {
+        flushOutputAck();
+    } else if (!outputAckTimer) {
+        outputAckTimer = setTimeout(flushOutputAck, OUTPUT_ACK_DELAY);
+    }
+}
+
+function attachOutputStream(backend) {
+    backend.output_batch.connect(function(b64) {
+        const bytes = base64ToBytes(b64);
+        term.write(bytes, () => ackOutput(bytes.length));
+    });
+    // Replays anything received before the page was ready (login banner, first prompt)
+    backend.attach_output();
+}
+
+// Bulk paste progress: large pastes are paced by the backend; show progress with a cancel
+// button while they run
+function showPasteProgress(sent, total) {
+    let overlay = document.getElementById('paste-progress');
+    if (!overlay) {
+        overlay = document.createElement('div');
+        overlay.id = 'paste-progress';
+        overlay.style.cssText = 'position:absolute;right:12px;bottom:12px;z-index:1001;' +
+            'background:#1e1e1e;color:#fff;border:1px solid #444;border-radius:4px;' +
+            'padding:6px 10px;font-size:12px;font-family:sans-serif;';
+        const label = document.createElement('span');
+        label.id = 'paste-progress-label';
+        const cancel = document.createElement('button');
+        cancel.textContent = 'Cancel';
+        cancel.style.marginLeft = '8px';
+        cancel.addEventListener('click', () => {
+            if (window.backend) {
+                window.backend.cancel_paste();
+            }
+            term.focus();
+        });
+        overlay.appendChild(label);
+        overlay.appendChild(cancel);
+        document.body.appendChild(overlay);
+    }
+    const percent = total > 0 ? Math.floor(sent * 100 / total) : 100;
+    document.getElementById('paste-progress-label').textContent =
+        `Pasting ${percent}% (${sent} / ${total} bytes)`;
+}
+
+function hidePasteProgress(completed, message) {
+    const overlay = document.getElementById('paste-progress');
+    if (overlay) {
+        overlay.remove();
+    }
+    if (!completed) {
+        console.log("Paste stopped:", message);
+    }
+}
+
+function attachPasteProgress(backend) {
+    backend.paste_progress.connect(showPasteProgress);
+    backend.paste_finished.connect(hidePasteProgress);
+}
+
+// Paste the clipboard one line at a time, waiting for the device prompt after each line
+function pasteLineByLine() {
+    if (!window.backend || typeof window.backend.send_paste !== 'function') {
+        console.log("Line-by-line paste not available, using normal paste");
+        pasteToTerminal();
+        return;
+    }
+    term.focus();
+    const sendLines = function(text) {
+        if (text) {
+            window.backend.send_paste(text, true);
+        } else {
+            console.log("Clipboard appears to be empty");
+        }
+    };
+
+    // Same clipboard sources as pasteToTerminal(): backend slot if present, else the Clipboard API
+    if (typeof window.backend.clipboard_paste === 'function') {
+        try {
+            window.handlePasteResult = function(text) {
+                sendLines(text);
+                delete window.handlePasteResult;
+            };
+            window.backend.clipboard_paste();
+            return;
+        } catch (backendError) {
+            console.error("Backend clipboard_paste failed:", backendError);
+            delete window.handlePasteResult;
+        }
+    }
+
+    navigator.clipboard.readText()
+        .then(sendLines)
+        .catch(err => console.error("Clipboard API error:", err));
+}
+
 // Initialize terminal themes
 const terminal_themes = {
     "Cyberpunk": {
@@ -509,6 +636,17 @@ function createContextMenu() {
     });
     contextMenu.appendChild(pasteItem);
 
+    // Add Paste Line by Line menu item (waits for the prompt after each line)
+    const pasteLinesItem = document.createElement('div');
+    pasteLinesItem.textContent = 'Paste Line by Line';
+    pasteLinesItem.className = 'context-menu-item';
+    pasteLinesItem.addEventListener('click', (e) => {
+        e.preventDefault();
+        hideContextMenu();
+        pasteLineByLine();
+    });
+    contextMenu.appendChild(pasteLinesItem);
+
     // Add Copy & Paste menu item
     const copyPasteItem = document.createElement('div');
     copyPasteItem.textContent = 'Copy & Paste';
@@ -596,6 +734,8 @@ document.addEventListener('DOMContentLoaded', () => {
 // Establish a connection with the Qt backend
 new QWebChannel(qt.webChannelTransport, function(channel) {
     window.backend = channel.objects.backend;
+    attachOutputStream(window.backend);
+    attachPasteProgress(window.backend);
 });
 
 // Window load event handler
@@ -0,0 +1,341 @@
+"""
+Asyncio collection engine - alternative to one netmiko connection per thread
+Drives many SSH sessions from a single event loop (asyncssh) while reusing the
+platform JSON commands/templates and producing the same RawCommandOutput and
+normalized dataclasses as the netmiko path
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
+
+from termtel.termtelwidgets.netmiko_controller import (
+    DeviceInfo, ConnectionCredentials, RawCommandOutput, ConfigDrivenFieldNormalizer,
+    TELEMETRY_CYCLE_COMMANDS, shared_template_parser, get_parse_executor
+)
+
+# asyncssh imports
+try:
+    import asyncssh
+    ASYNCSSH_AVAILABLE = True
+except ImportError:
+    ASYNCSSH_AVAILABLE = False
+    print("Note: asyncssh not available, async collection engine disabled")
+
+
+@dataclass
+class AsyncCollectionResult:
+    """Result of one collection cycle for one device"""
+    device_ip: str
+    port: int
+    platform: str
+    outputs: Dict[str, RawCommandOutput] = field(default_factory=dict)
+    normalized: Dict[str, Any] = field(default_factory=dict)
+    error_message: str = ""
+
+
+class AsyncCollectionEngine:
+    """
+    Single event loop (in its own thread) that owns every async SSH session
+
+    Commands run over SSH exec channels, so no prompt/paging handling is needed and
+    a slow device only parks a coroutine, not an OS thread. Parsing and
+    normalization are handed to the shared parse pool to keep the loop responsive.
+    """
+
+    def __init__(self, platform_config, max_concurrent_sessions: int = 500,
+                 known_hosts=None):
+        """
+        Initialize the engine
+
+        Args:
+            platform_config: PlatformConfigManager with commands and templates
+            max_concurrent_sessions: Upper bound on sessions opening/running at once
+            known_hosts: asyncssh known_hosts setting (None disables host key checks,
+                matching the netmiko path)
+        """
+        self.platform_config = platform_config
+        self.field_normalizer = ConfigDrivenFieldNormalizer(platform_config)
+        self.max_concurrent_sessions = max_concurrent_sessions
+        self.known_hosts = known_hosts
+
+        self.connections: Dict[str, Any] = {}  # "ip:port" -> asyncssh.SSHClientConnection
+        self.connection_timeouts: Dict[str, int] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session_limit: Optional[asyncio.Semaphore] = None
+        self._started = threading.Event()
+
+    # ===== EVENT LOOP MANAGEMENT =====
+
+    def start(self):
+        """Start the event loop thread (idempotent)"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._loop = asyncio.new_event_loop()
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="telemetry-asyncio", daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def _run_loop(self):
+        """Event loop thread body"""
+        asyncio.set_event_loop(self._loop)
+        self._session_limit = asyncio.Semaphore(self.max_concurrent_sessions)
+        self._started.set()
+        self._loop.run_forever()
+
+    def stop(self):
+        """Close every session and stop the event loop"""
+        if not self._loop or not self._loop.is_running():
+            return
+        try:
+            self.run(self.disconnect_all())
+        except Exception as e:
+            print(f" Async engine: error closing sessions: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+    def submit(self, coro):
+        """Schedule a coroutine on the engine loop, returns a concurrent.futures.Future"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the engine loop and block the calling thread for its result"""
+        return self.submit(coro).result(timeout)
+
+    # ===== CONNECTIONS =====
+
+    @staticmethod
+    def _connection_key(device_ip: str, port: int) -> str:
+        return f"{device_ip}:{port}"
+
+    async def connect(self, device_info: DeviceInfo, credentials: ConnectionCredentials) -> bool:
+        """Open an SSH session for a device"""
+        if not ASYNCSSH_AVAILABLE:
+            print("asyncssh not available, cannot create async connection")
+            return False
+
+        connection_key = self._connection_key(device_info.ip_address, credentials.port)
+        netmiko_config = self.platform_config.get_netmiko_config(device_info.platform)
+        timeout = netmiko_config.timeout if netmiko_config else credentials.timeout
+
+        options = {
+            'host': device_info.ip_address,
+            'port': credentials.port,
+            'username': credentials.username,
+            'known_hosts': self.known_hosts,
+            'agent_path': None,
+            'connect_timeout': credentials.timeout,
+            'login_timeout': credentials.auth_timeout,
+        }
+        if getattr(credentials, 'key_file', None):
+            options['client_keys'] = [credentials.key_file]
+        else:
+            options['password'] = credentials.password
+            options['client_keys'] = None
+
+        try:
+            async with self._session_limit:
+                connection = await asyncssh.connect(**options)
+            self.connections[connection_key] = connection
+            self.connection_timeouts[connection_key] = timeout
+            print(f" Async engine connected to {device_info.hostname} ({connection_key})")
+            return True
+
+        except asyncssh.PermissionDenied as e:
+            print(f" Async engine authentication failed for {device_info.hostname}: {e}")
+        except (OSError, asyncio.TimeoutError, asyncssh.Error) as e:
+            print(f" Async engine connection failed for {device_info.hostname}: {e}")
+        return False
+
+    async def execute(self, device_ip: str, port: int, command: str,
+                      timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """Run one command on an exec channel, returns (success, output)"""
+        connection_key = self._connection_key(device_ip, port)
+        connection = self.connections.get(connection_key)
+        if connection is None:
+            return False, "No active connection found"
+
+        try:
+            async with self._session_limit:
+                result = await asyncio.wait_for(
+                    connection.run(command, check=False),
+                    timeout or self.connection_timeouts.get(connection_key, 30)
+                )
+            output = result.stdout if isinstance(result.stdout, str) else ""
+            if result.exit_status not in (0, None) and not output:
+                return False, result.stderr or f"Exit status {result.exit_status}"
+            return True, output
+
+        except Exception as e:
+            print(f"Async engine error executing '{command}' on {connection_key}: {e}")
+            return False, str(e)
+
+    async def disconnect(self, device_ip: str, port: int = 22):
+        """Close a device session"""
+        connection_key = self._connection_key(device_ip, port)
+        connection = self.connections.pop(connection_key, None)
+        self.connection_timeouts.pop(connection_key, None)
+        if connection is not None:
+            connection.close()
+            await connection.wait_closed()
+            print(f"Async engine disconnected from {device_ip}")
+
+    async def disconnect_all(self):
+        """Close every session"""
+        for connection_key in list(self.connections.keys()):
+            device_ip, port = connection_key.rsplit(':', 1)
+            await self.disconnect(device_ip, int(port))
+
+    # ===== COLLECTION =====
+
+    async def collect_device(self, device_ip: str, port: int, platform: str,
+                             command_types: Optional[List[str]] = None) -> AsyncCollectionResult:
+        """
+        Run a collection cycle for one device
+
+        Commands for a device run one after another on its session; the parse and
+        normalize stage of each output runs on the parse pool while the next command
+        is in flight.
+        """
+        result = AsyncCollectionResult(device_ip=device_ip, port=port, platform=platform)
+        loop = asyncio.get_running_loop()
+        parse_jobs = []
+
+        for command_type in command_types or TELEMETRY_CYCLE_COMMANDS:
+            command = self.platform_config.format_command(platform, command_type)
+            if command.startswith("#"):
+                continue
+
+            timeout = self.platform_config.get_command(platform, command_type).timeout
+            success, output = await self.execute(device_ip, port, command, timeout)
+            if not success:
+                result.outputs[command_type] = RawCommandOutput(
+                    command=command, output="", platform=platform, timestamp=time.time(),
+                    success=False, error_message=output
+                )
+                continue
+
+            parse_jobs.append((command_type, loop.run_in_executor(
+                get_parse_executor(), self._process_output, platform, command_type, command, output
+            )))
+
+        for command_type, job in parse_jobs:
+            try:
+                raw_output, normalized = await job
+                result.outputs[command_type] = raw_output
+                if normalized is not None:
+                    result.normalized[command_type] = normalized
+            except Exception as e:
+                print(f" Async engine parse failed for {device_ip} {command_type}: {e}")
+
+        return result
+
+    async def collect_many(self, devices: List[Tuple[str, int, str]],
+                           command_types: Optional[List[str]] = None) -> List[AsyncCollectionResult]:
+        """
+        Collect from many connected devices concurrently on this loop
+
+        Args:
+            devices: List of (device_ip, port, platform)
+            command_types: Command types to run (defaults to a full telemetry cycle)
+        """
+        results = await asyncio.gather(
+            *(self.collect_device(ip, port, platform, command_types) for ip, port, platform in devices),
+            return_exceptions=True
+        )
+
+        collected = []
+        for (ip, port, platform), result in zip(devices, results):
+            if isinstance(result, Exception):
+                result = AsyncCollectionResult(device_ip=ip, port=port, platform=platform,
+                                               error_message=str(result))
+            collected.append(result)
+        return collected
+
+    def _process_output(self, platform: str, command_type: str, command: str, output: str):
+        """Parse pool: parse with the platform template and normalize, as the netmiko path does"""
+        parsed_data = None
+        template_entry = self.platform_config.get_template_entry(platform, command_type)
+        if template_entry and command_type != 'logs':
+            parsed_data = shared_template_parser.parse(
+                template_entry.template_platform, template_entry.template_command, output
+            )
+
+        normalized = None
+        if parsed_data:
+            if command_type == 'cdp_neighbors':
+                normalized = self.field_normalizer.normalize_neighbors(parsed_data, platform, command)
+            elif command_type == 'arp_table':
+                normalized = self.field_normalizer.normalize_arp(parsed_data, platform)
+            elif command_type in ['route_table', 'route_table_vrf']:
+                normalized = self.field_normalizer.normalize_routes(parsed_data, platform)
+
+        raw_output = RawCommandOutput(
+            command=command,
+            output=output,
+            platform=platform,
+            timestamp=time.time(),
+            template_used=template_entry.template_file if template_entry else 'none',
+            parsed_successfully=bool(parsed_data),
+            parsed_data=parsed_data
+        )
+        return raw_output, normalized
+
+
+class AsyncConnectionManager:
+    """
+    Drop-in replacement for NetmikoConnectionManager backed by AsyncCollectionEngine
+    Blocking calls are forwarded to the engine loop, so existing controller code works unchanged
+    """
+
+    def __init__(self, engine: AsyncCollectionEngine):
+        self.engine = engine
+        self.platform_config = engine.platform_config
+        self._owned_connections = set()  # (ip, port) opened through this manager
+
+    @property
+    def connections(self) -> Dict[str, Any]:
+        return {f"{ip}:{port}": self.engine.connections[f"{ip}:{port}"]
+                for ip, port in self._owned_connections
+                if f"{ip}:{port}" in self.engine.connections}
+
+    def create_connection(self, device_info: DeviceInfo, credentials: ConnectionCredentials) -> bool:
+        """Open an async session for the device"""
+        success = self.engine.run(self.engine.connect(device_info, credentials))
+        if success:
+            self._owned_connections.add((device_info.ip_address, credentials.port))
+        return success
+
+    def execute_command(self, device_ip: str, port: int, command: str) -> tuple[bool, str]:
+        """Execute command on connected device"""
+        return self.engine.run(self.engine.execute(device_ip, port, command))
+
+    def disconnect(self, device_ip: str, port: int = 22):
+        """Disconnect from device"""
+        self._owned_connections.discard((device_ip, port))
+        self.engine.run(self.engine.disconnect(device_ip, port))
+
+    def disconnect_all(self):
+        """Disconnect from all devices opened through this manager (the engine is shared)"""
+        for device_ip, port in list(self._owned_connections):
+            self.disconnect(device_ip, port)
+
+
+_shared_engine = None
+_shared_engine_lock = threading.Lock()
+
+
+def get_async_engine(platform_config) -> AsyncCollectionEngine:
+    """Process-wide async engine, so every controller shares one event loop"""
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = AsyncCollectionEngine(platform_config)
+        return _shared_engine
@@ -7,6 +7,7 @@ FIXED: Route normalization with platform-aware field mapping
 import sys
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 from dataclasses import dataclass, field, asdict
 from io import StringIO
 from typing import Dict, List, Optional, Callable, Any, Union
@@ -222,6 +223,15 @@ import os
 from io import StringIO
 from typing import Optional, List, Dict
 from termtel.helpers.resource_manager import resource_manager
+from termtel.termtelwidgets.template_cache import compiled_template_cache, KeyedLocks
+from termtel.termtelwidgets.parse_pool import process_parse_pool
+from termtel.termtelwidgets.streaming_parser import StreamingTemplateParser, stream_command
+from termtel.termtelwidgets.structured_output import StructuredCommandSelector, parse_structured_output
+from termtel.termtelwidgets.telemetry_delta import TelemetrySnapshotStore
+from termtel.termtelwidgets.normalized_records import (NormalizedNeighborData, NormalizedArpData,
+                                                       NormalizedRouteData, intern_records,
+                                                       records_from_tuples, entries_to_rows,
+                                                       ParsedTable, ROUTE_FIELDS)
 
 try:
     import textfsm
@@ -234,6 +244,8 @@ except ImportError:
 class LocalTemplateParser:
     """
     UPDATED: Parser for local template files using package resources
+    Thread-safe: one instance (shared_template_parser) is used by the controller
+    and every TelemetryWorkerThread so template loads are cached process-wide
     """
 
     def __init__(self, template_dir: Optional[str] = None):
@@ -245,8 +257,12 @@ class LocalTemplateParser:
         """
         self.template_dir = template_dir  # Keep for backwards compatibility
         self._template_cache = {}
+        self._stats_lock = threading.Lock()
+        self._load_locks = KeyedLocks()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
-    def parse(self, platform: str, command: str, data: str) -> Optional[List[Dict]]:
+    def parse(self, platform: str, command: str, data: str) -> Optional[ParsedTable]:
         """
         Parse data using package resource templates
 
@@ -256,7 +272,7 @@ class LocalTemplateParser:
             data: Raw command output to parse
 
         Returns:
-            List of dictionaries with parsed data or None if parsing fails
+            ParsedTable (header plus raw rows; indexing/iterating yields dicts) or None if parsing fails
         """
         if not TEXTFSM_AVAILABLE:
             print(" TextFSM not available")
@@ -275,9 +291,8 @@ class LocalTemplateParser:
             return None
 
         try:
-            # Create TextFSM template from content
-            template_file = StringIO(template_content)
-            template = textfsm.TextFSM(template_file)
+            # Clone the compiled template instead of rebuilding the FSM on every parse
+            template = compiled_template_cache.get_fsm(template_name, template_content)
 
             # Ensure data is a string
             if isinstance(data, list):
@@ -285,18 +300,25 @@ class LocalTemplateParser:
             elif not isinstance(data, str):
                 data = str(data)
 
+            # Large outputs are parsed in a worker process so the GIL stays free for the UI
+            offloaded = None
+            if process_parse_pool.should_offload(data):
+                offloaded = process_parse_pool.parse(template_name, template_content, data)
+
             # Parse the data
-            parsed_rows = template.ParseText(data)
-            headers = template.header
+            if offloaded is not None:
+                headers, parsed_rows = offloaded
+                print(f" Parsed {len(data)} chars in parse process pool")
+            else:
+                parsed_rows = template.ParseText(data)
+                headers = template.header
 
-            # Convert to list of dictionaries
-            result = []
-            for row in parsed_rows:
-                result.append(dict(zip(headers, row)))
+            # Rows stay as TextFSM returned them; dicts are only built if a caller indexes
+            result = ParsedTable(headers, parsed_rows)
 
             print(f" Template parsing successful: {len(result)} entries parsed")
             if result:
-                print(f" Fields found: {list(result[0].keys())}")
+                print(f" Fields found: {list(result.header)}")
 
             return result
 
@@ -307,20 +329,62 @@ class LocalTemplateParser:
             print(f" Sample data: {sample_data}...")
             return None
 
+    def open_stream(self, platform: str, command: str) -> Optional[StreamingTemplateParser]:
+        """
+        Start an incremental parse with the template for a platform/command
+
+        Returns:
+            StreamingTemplateParser to feed output to as it arrives, or None if there is no template
+        """
+        if not TEXTFSM_AVAILABLE:
+            return None
+
+        template_name = f"{platform}_{command}.textfsm"
+        template_content = self._get_template_content(template_name)
+        if not template_content:
+            print(f" Template not found: {template_name}")
+            return None
+
+        return StreamingTemplateParser(compiled_template_cache.get_fsm(template_name, template_content))
+
     def _get_template_content(self, template_name: str) -> Optional[str]:
         """
         Get template content using package resources with caching
         """
-        # Check cache first
-        if template_name in self._template_cache:
-            return self._template_cache[template_name]
+        # Check cache first (entries go stale when the template is invalidated after a save)
+        template_content = self._get_cached_content(template_name)
+        if template_content is not None:
+            return template_content
+
+        # Only one thread loads a given template, concurrent callers wait and reuse it
+        with self._load_locks.get(template_name):
+            template_content = self._get_cached_content(template_name)
+            if template_content is not None:
+                return template_content
+
+            with self._stats_lock:
+                self.cache_misses += 1
+            return self._load_template_content(template_name)
+
+    def _get_cached_content(self, template_name: str) -> Optional[str]:
+        """Return cached template content if it is still current, counting the hit"""
+        cached = self._template_cache.get(template_name)
+        if cached and cached[0] == compiled_template_cache.generation(template_name):
+            with self._stats_lock:
+                self.cache_hits += 1
+            return cached[1]
+        return None
+
+    def _load_template_content(self, template_name: str) -> Optional[str]:
+        """Load template content from package resources or the file system into the cache"""
+        generation = compiled_template_cache.generation(template_name)
 
         # Try package resources first
         template_content = resource_manager.get_template_content(template_name)
 
         if template_content:
             print(f" Loaded template from package resources: {template_name}")
-            self._template_cache[template_name] = template_content
+            self._template_cache[template_name] = (generation, template_content)
             return template_content
 
         # Fallback to file system (for development)
@@ -331,7 +395,7 @@ class LocalTemplateParser:
                     with open(template_path, 'r', encoding='utf-8') as f:
                         template_content = f.read()
                     print(f" Loaded template from file system: {template_path}")
-                    self._template_cache[template_name] = template_content
+                    self._template_cache[template_name] = (generation, template_content)
                     return template_content
                 except Exception as e:
                     print(f" Error reading template file {template_path}: {e}")
@@ -392,8 +456,7 @@ class LocalTemplateParser:
             return result
 
         try:
-            template_file = StringIO(template_content)
-            template = textfsm.TextFSM(template_file)
+            template = compiled_template_cache.get_fsm(template_name, template_content)
             result['parseable'] = True
             result['fields'] = template.header
             result['valid'] = True
@@ -406,6 +469,7 @@ class LocalTemplateParser:
     def clear_cache(self):
         """Clear the template cache"""
         self._template_cache.clear()
+        compiled_template_cache.clear()
         print(" Template cache cleared")
 
     def get_cache_info(self) -> Dict[str, any]:
@@ -413,9 +477,43 @@ class LocalTemplateParser:
         return {
             'cached_templates': list(self._template_cache.keys()),
             'cache_size': len(self._template_cache),
-            'total_available': len(self.list_available_templates())
+            'total_available': len(self.list_available_templates()),
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'compiled': compiled_template_cache.get_cache_info(),
+            'process_pool': process_parse_pool.get_stats()
         }
 
+
+# Shared instance used by the controller and all worker threads
+shared_template_parser = LocalTemplateParser()
+
+# Commands run by one telemetry collection cycle, in execution order
+TELEMETRY_CYCLE_COMMANDS = [
+    'cdp_neighbors', 'arp_table', 'route_table', 'vrf_list',
+    'cpu_utilization', 'memory_utilization', 'logs'
+]
+
+_parse_executor = None
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> ThreadPoolExecutor:
+    """
+    Shared pool for the parse/normalize stage of pipelined collection
+
+    Command execution stays on the thread that owns the SSH session; parsing of
+    one command's output runs here while the next command is on the wire.
+    """
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            _parse_executor = ThreadPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                thread_name_prefix="telemetry-parse"
+            )
+        return _parse_executor
+
 @dataclass
 class ConnectionCredentials:
     """Device connection credentials with SSH key support"""
@@ -464,41 +562,24 @@ class RawCommandOutput:
     parsed_data: Optional[List[Dict]] = None
 
 
-@dataclass
-class NormalizedNeighborData:
-    """Normalized neighbor data structure across all platforms"""
-    local_interface: str
-    neighbor_device: str
-    neighbor_interface: str
-    neighbor_ip: str = ""
-    neighbor_platform: str = ""
-    neighbor_capability: str = ""
-    protocol_used: str = ""  # CDP, LLDP, etc.
-
-
-@dataclass
-class NormalizedArpData:
-    """Normalized ARP data structure across all platforms"""
-    ip_address: str
-    mac_address: str
-    interface: str
-    age: str = ""
-    type: str = ""
-    state: str = ""
+# Route record defaults in ROUTE_FIELDS order (NormalizedRouteData field defaults)
+_ROUTE_DEFAULTS = ("", "", "", "", "", "", "", "", "default")
+_CONNECTED_CODES = frozenset(('Connected', 'C', 'connected'))
+_CISCO_CONNECTED_CODES = frozenset(('C', 'Connected', 'L', 'Local'))
 
 
 @dataclass
-class NormalizedRouteData:
-    """Normalized route data structure across all platforms"""
-    network: str
-    next_hop: str
-    protocol: str
-    mask: str = ""
-    interface: str = ""
-    metric: str = ""
-    admin_distance: str = ""
-    age: str = ""
-    vrf: str = "default"
+class RouteFieldPlan:
+    """
+    Route extraction plan compiled once per (platform, template header)
+    Rows are read by column index; protocol codes are translated once per distinct code
+    """
+    platform: str
+    header: tuple
+    columns: tuple  # (normalized field, candidate column indexes) in ROUTE_FIELDS order
+    direct_column: Optional[int]  # Arista DIRECT column
+    family: str  # 'cisco', 'arista', 'linux' or '' - selects the network/next hop rules
+    protocols: Dict[str, str]  # protocol code -> name, seeded from field_mappings.protocols
 
 
 class ConfigDrivenFieldNormalizer:
@@ -507,9 +588,61 @@ class ConfigDrivenFieldNormalizer:
     FIXED: Enhanced route normalization with platform-aware field mapping
     """
 
+    # Route field names per platform family, tried before the generic ROUTE_FIELD_MAPPINGS
+    ROUTE_PLATFORM_OVERRIDES = {
+        'cisco_ios': {
+            'network': ['NETWORK', 'network'],
+            'mask': ['PREFIX_LENGTH', 'mask'],
+            'next_hop': ['NEXTHOP_IP', 'nexthop'],
+            'interface': ['NEXTHOP_IF', 'interface'],
+            'protocol': ['PROTOCOL', 'protocol'],
+            'metric': ['METRIC', 'metric'],
+            'admin_distance': ['DISTANCE', 'admin_distance'],
+            'age': ['UPTIME', 'age'],
+            'vrf': ['VRF', 'vrf']
+        },
+        'cisco_nxos': {
+            'network': ['NETWORK', 'network'],
+            'mask': ['PREFIX_LENGTH', 'mask'],
+            'next_hop': ['NEXTHOP_IP', 'nexthop'],
+            'interface': ['NEXTHOP_IF', 'interface'],
+            'protocol': ['PROTOCOL', 'protocol'],
+            'metric': ['METRIC', 'metric'],
+            'admin_distance': ['DISTANCE', 'admin_distance'],
+            'age': ['UPTIME', 'age'],
+            'vrf': ['VRF', 'vrf']
+        },
+        'arista_eos': {
+            'network': ['PREFIX', 'NETWORK', 'network'],
+            'mask': ['PREFIX_LENGTH', 'MASK', 'mask'],
+            'next_hop': ['VIA', 'NEXTHOP_IP', 'nexthop'],
+            'interface': ['INTERFACE', 'NEXTHOP_IF', 'interface'],
+            'protocol': ['ROUTE_TYPE', 'PROTOCOL', 'protocol'],
+            'metric': ['METRIC', 'COST', 'metric'],
+            'admin_distance': ['AD', 'DISTANCE', 'admin_distance'],
+            'age': ['AGE', 'UPTIME', 'age'],
+            'vrf': ['VRF', 'TABLE', 'vrf']
+        },
+        'linux': {
+            'network': ['DESTINATION', 'DST', 'network'],
+            'mask': ['PREFIX_LENGTH', 'PREFIXLEN', 'mask'],
+            'next_hop': ['GATEWAY', 'VIA', 'nexthop'],
+            'interface': ['INTERFACE', 'DEV', 'interface'],
+            'protocol': ['PROTO', 'PROTOCOL', 'protocol'],
+            'metric': ['METRIC', 'metric'],
+            'admin_distance': ['DISTANCE', 'admin_distance'],
+            'age': ['AGE', 'age'],
+            'vrf': ['TABLE', 'vrf']
+        }
+    }
+
     def __init__(self, platform_config_manager):
         self.platform_config = platform_config_manager
 
+        # (platform, template header) -> RouteFieldPlan
+        self._route_plans: Dict[tuple, RouteFieldPlan] = {}
+        self._route_plans_generation = platform_config_manager.generation
+
         # Keep the original field mappings as fallback
         self.NEIGHBOR_FIELD_MAPPINGS = {
             'local_interface': ['LOCAL_INTERFACE', 'local_interface', 'local_port'],
@@ -532,7 +665,7 @@ class ConfigDrivenFieldNormalizer:
 
         # UPDATED: Enhanced route field mappings that handle platform variations
         self.ROUTE_FIELD_MAPPINGS = {
-            'network': ['NETWORK', 'PREFIX', 'DESTINATION', 'DEST', 'network', 'destination'],
+            'network': ['NETWORK', 'PREFIX', 'DESTINATION', 'DEST', 'IP_ADDRESS', 'network', 'destination'],
             'mask': ['PREFIX_LENGTH', 'MASK', 'NETMASK', 'mask', 'prefix_length'],
             'next_hop': ['NEXTHOP_IP', 'NEXT_HOP', 'VIA', 'GATEWAY', 'nexthop', 'gateway'],
             'interface': ['NEXTHOP_IF', 'INTERFACE', 'INTF', 'PORT', 'DEV', 'interface', 'port'],
@@ -558,11 +691,27 @@ class ConfigDrivenFieldNormalizer:
         field_mapping = self.platform_config.get_field_mapping(platform, field_type)
         return field_mapping.get(value, value)
 
-    def normalize_neighbors(self, parsed_data: List[Dict], platform: str, command_used: str = "") -> List[NormalizedNeighborData]:
-        """Normalize neighbor data from parsed template output"""
-        normalized = []
+    def normalize_neighbors(self, parsed_data: Union[ParsedTable, List[Dict]], platform: str,
+                            command_used: str = "") -> List[NormalizedNeighborData]:
+        """Normalize neighbor data from parsed template output (ParsedTable or dict entries)"""
+        header, rows = entries_to_rows(parsed_data)
+        candidates = self._column_candidates(header, self.NEIGHBOR_FIELD_MAPPINGS)
+
+        # Set protocol based on command used or platform capabilities
+        # (None keeps the protocol mapped from the entry)
+        protocol_used = None
+        if 'cdp' in command_used.lower():
+            protocol_used = "CDP"
+        elif 'lldp' in command_used.lower():
+            protocol_used = "LLDP"
+        else:
+            platform_def = self.platform_config.get_platform(platform)
+            if platform_def:
+                # Use platform's primary neighbor protocol
+                protocol_used = platform_def.capabilities.neighbor_protocol.upper()
 
-        for entry in parsed_data:
+        normalized = []
+        for row in rows:
             normalized_entry = NormalizedNeighborData(
                 local_interface="",
                 neighbor_device="",
@@ -570,38 +719,34 @@ class ConfigDrivenFieldNormalizer:
             )
 
             # Map fields using the field mappings
-            for norm_field, possible_fields in self.NEIGHBOR_FIELD_MAPPINGS.items():
-                for field in possible_fields:
-                    if field in entry and entry[field]:
-                        setattr(normalized_entry, norm_field, str(entry[field]).strip())
+            for norm_field, columns in candidates:
+                for column in columns:
+                    if row[column]:
+                        setattr(normalized_entry, norm_field, str(row[column]).strip())
                         break
 
-            # Set protocol based on command used or platform capabilities
-            platform_def = self.platform_config.get_platform(platform)
-            if platform_def:
-                if 'cdp' in command_used.lower():
-                    normalized_entry.protocol_used = "CDP"
-                elif 'lldp' in command_used.lower():
-                    normalized_entry.protocol_used = "LLDP"
-                else:
-                    # Use platform's primary neighbor protocol
-                    normalized_entry.protocol_used = platform_def.capabilities.neighbor_protocol.upper()
-            else:
-                # Fallback logic
-                if 'cdp' in command_used.lower():
-                    normalized_entry.protocol_used = "CDP"
-                elif 'lldp' in command_used.lower():
-                    normalized_entry.protocol_used = "LLDP"
+            if protocol_used is not None:
+                normalized_entry.protocol_used = protocol_used
 
             normalized.append(normalized_entry)
 
-        return normalized
+        return intern_records(normalized)
 
-    def normalize_arp(self, parsed_data: List[Dict], platform: str) -> List[NormalizedArpData]:
-        """Normalize ARP data from parsed template output"""
-        normalized = []
+    def normalize_arp(self, parsed_data: Union[ParsedTable, List[Dict]], platform: str) -> List[NormalizedArpData]:
+        """Normalize ARP data from parsed template output (ParsedTable or dict entries)"""
+        header, rows = entries_to_rows(parsed_data)
+        candidates = self._column_candidates(header, self.ARP_FIELD_MAPPINGS)
 
-        for entry in parsed_data:
+        # Platform-specific adjustments using config
+        state_mapping = None
+        is_cisco = platform.startswith('cisco')
+        if platform.startswith('linux'):
+            # Linux ip neigh format might need state translation: config-driven if available
+            state_mapping = self.platform_config.get_field_mapping(platform, 'arp_states') or \
+                {'REACHABLE': 'Active', 'STALE': 'Incomplete'}
+
+        normalized = []
+        for row in rows:
             normalized_entry = NormalizedArpData(
                 ip_address="",
                 mac_address="",
@@ -609,306 +754,235 @@ class ConfigDrivenFieldNormalizer:
             )
 
             # Map fields using the field mappings
-            for norm_field, possible_fields in self.ARP_FIELD_MAPPINGS.items():
-                for field in possible_fields:
-                    if field in entry and entry[field]:
-                        setattr(normalized_entry, norm_field, str(entry[field]).strip())
+            for norm_field, columns in candidates:
+                for column in columns:
+                    if row[column]:
+                        setattr(normalized_entry, norm_field, str(row[column]).strip())
                         break
 
-            # Platform-specific adjustments using config
-            if platform.startswith('linux'):
-                # Linux ip neigh format might need state translation
+            if state_mapping is not None:
                 if normalized_entry.state:
-                    # Use config-driven state mapping if available
-                    state_mapping = self.platform_config.get_field_mapping(platform, 'arp_states')
-                    if state_mapping:
-                        normalized_entry.state = state_mapping.get(normalized_entry.state, normalized_entry.state)
-                    else:
-                        # Fallback mapping
-                        state_map = {'REACHABLE': 'Active', 'STALE': 'Incomplete'}
-                        normalized_entry.state = state_map.get(normalized_entry.state, normalized_entry.state)
-            elif platform.startswith('cisco'):
+                    normalized_entry.state = state_mapping.get(normalized_entry.state, normalized_entry.state)
+            elif is_cisco:
                 # Cisco ARP entries are typically "ARPA" type
                 if not normalized_entry.type:
                     normalized_entry.type = "ARPA"
 
             normalized.append(normalized_entry)
 
-        return normalized
+        return intern_records(normalized)
+
+    @staticmethod
+    def _column_candidates(header, field_mappings: Dict[str, List[str]]) -> List[tuple]:
+        """(normalized field, header column indexes to try in priority order) per mapped field"""
+        column_index = {}
+        for i, name in enumerate(header):
+            column_index.setdefault(name, i)
+        return [(norm_field, tuple(dict.fromkeys(column_index[name] for name in possible_fields
+                                                 if name in column_index)))
+                for norm_field, possible_fields in field_mappings.items()]
 
-    def normalize_routes(self, parsed_data: List[Dict], platform: str) -> List[NormalizedRouteData]:
+    def normalize_routes(self, parsed_data: Union[ParsedTable, List[Dict]], platform: str) -> List[NormalizedRouteData]:
         """
         FIXED: Platform-aware route normalization that handles different field names per platform
-        Uses both hardcoded mappings AND platform-specific JSON config
+        Rows (a ParsedTable's as is, dict entries converted) run through the compiled plan for their header
         """
         print(f"=== PLATFORM-AWARE ROUTE NORMALIZATION ===")
         print(f"Platform: {platform}")
         print(f"Input data count: {len(parsed_data)}")
 
-        if parsed_data and len(parsed_data) > 0:
-            print(f"Sample input entry: {parsed_data[0]}")
-            print(f"Available fields: {list(parsed_data[0].keys())}")
-
-        normalized = []
+        # Full-table routers: normalize in worker processes instead of holding the GIL here
+        if process_parse_pool.should_offload_rows(parsed_data):
+            route_rows = process_parse_pool.normalize_routes(self, parsed_data, platform)
+            if route_rows is not None:
+                print(f"Normalized {len(route_rows)} routes in parse process pool")
+                return records_from_tuples(NormalizedRouteData, route_rows)
 
-        # Get platform-specific field mappings from JSON config
-        platform_field_mappings = self._get_platform_field_mappings(platform)
-        print(f"Platform field mappings: {platform_field_mappings}")
+        if not parsed_data:
+            return []
 
-        for i, entry in enumerate(parsed_data):
-            print(f"\nProcessing entry {i}: {entry}")
+        header, rows = entries_to_rows(parsed_data)
+        print(f"Sample input row: {dict(zip(header, rows[0]))}")
+        return self.normalize_route_rows(header, rows, platform)
 
-            normalized_entry = NormalizedRouteData(
-                network="",
-                next_hop="",
-                protocol=""
-            )
+    def normalize_route_rows(self, header, rows, platform: str) -> List[NormalizedRouteData]:
+        """
+        Normalize route rows (tuples or lists in template header order)
 
-            # Platform-aware field extraction
-            normalized_entry = self._extract_route_fields(entry, platform, platform_field_mappings)
+        Args:
+            header: Template column names
+            rows: Row values, one per header column
+            platform: Platform name
 
-            # Platform-specific protocol normalization
-            if normalized_entry.protocol:
-                normalized_entry.protocol = self._normalize_protocol(
-                    normalized_entry.protocol, platform
-                )
+        Returns:
+            Valid normalized routes, interned
+        """
+        plan = self.get_route_plan(platform, header)
+        print(f"Route plan for {platform}: " +
+              ", ".join(f"{name}<-{[plan.header[c] for c in columns]}" for name, columns in plan.columns if columns))
 
-            # Validate and add entry
-            if self._is_valid_route_entry(normalized_entry):
-                normalized.append(normalized_entry)
-                print(f"   Entry added: {normalized_entry.network} via {normalized_entry.next_hop} ({normalized_entry.protocol})")
-            else:
-                print(f"   Entry rejected - validation failed")
-                self._log_validation_failure(normalized_entry)
+        normalized = self._apply_route_plan(plan, rows)
 
-        print(f"\n=== NORMALIZATION COMPLETE ===")
-        print(f"Input entries: {len(parsed_data)}")
+        print(f"=== NORMALIZATION COMPLETE ===")
+        print(f"Input entries: {len(rows)}")
         print(f"Output entries: {len(normalized)}")
+        if len(normalized) < len(rows):
+            print(f"    Rejected {len(rows) - len(normalized)} entries without a network")
 
-        return normalized
+        return intern_records(normalized)
+
+    def get_route_plan(self, platform: str, header) -> 'RouteFieldPlan':
+        """Compiled extraction plan for a platform and template header (built once, then cached)"""
+        # Plans carry protocol mappings from the config: start over when it is reloaded
+        if self._route_plans_generation != self.platform_config.generation:
+            self._route_plans.clear()
+            self._route_plans_generation = self.platform_config.generation
+
+        key = (platform, tuple(header))
+        plan = self._route_plans.get(key)
+        if plan is None:
+            plan = self._compile_route_plan(platform, key[1])
+            self._route_plans[key] = plan
+        return plan
+
+    def clear_route_plans(self):
+        """Drop compiled plans (after the platform config is reloaded)"""
+        self._route_plans.clear()
 
     def _get_platform_field_mappings(self, platform: str) -> Dict[str, List[str]]:
         """
-        Get platform-specific field mappings, combining hardcoded and JSON config
+        Get platform-specific field mappings, falling back to the generic ones
         """
-        # Base field mappings (fallback for all platforms)
-        base_mappings = self.ROUTE_FIELD_MAPPINGS.copy()
-
-        # Platform-specific overrides
-        platform_overrides = {
-            'cisco_ios': {
-                'network': ['NETWORK', 'network'],
-                'mask': ['PREFIX_LENGTH', 'mask'],
-                'next_hop': ['NEXTHOP_IP', 'nexthop'],
-                'interface': ['NEXTHOP_IF', 'interface'],
-                'protocol': ['PROTOCOL', 'protocol'],
-                'metric': ['METRIC', 'metric'],
-                'admin_distance': ['DISTANCE', 'admin_distance'],
-                'age': ['UPTIME', 'age'],
-                'vrf': ['VRF', 'vrf']
-            },
-            'cisco_nxos': {
-                'network': ['NETWORK', 'network'],
-                'mask': ['PREFIX_LENGTH', 'mask'],
-                'next_hop': ['NEXTHOP_IP', 'nexthop'],
-                'interface': ['NEXTHOP_IF', 'interface'],
-                'protocol': ['PROTOCOL', 'protocol'],
-                'metric': ['METRIC', 'metric'],
-                'admin_distance': ['DISTANCE', 'admin_distance'],
-                'age': ['UPTIME', 'age'],
-                'vrf': ['VRF', 'vrf']
-            },
-            'arista_eos': {
-                'network': ['PREFIX', 'NETWORK', 'network'],
-                'mask': ['PREFIX_LENGTH', 'MASK', 'mask'],
-                'next_hop': ['VIA', 'NEXTHOP_IP', 'nexthop'],
-                'interface': ['INTERFACE', 'NEXTHOP_IF', 'interface'],
-                'protocol': ['ROUTE_TYPE', 'PROTOCOL', 'protocol'],
-                'metric': ['METRIC', 'COST', 'metric'],
-                'admin_distance': ['AD', 'DISTANCE', 'admin_distance'],
-                'age': ['AGE', 'UPTIME', 'age'],
-                'vrf': ['VRF', 'TABLE', 'vrf']
-            },
-            'linux': {
-                'network': ['DESTINATION', 'DST', 'network'],
-                'mask': ['PREFIX_LENGTH', 'PREFIXLEN', 'mask'],
-                'next_hop': ['GATEWAY', 'VIA', 'nexthop'],
-                'interface': ['INTERFACE', 'DEV', 'interface'],
-                'protocol': ['PROTO', 'PROTOCOL', 'protocol'],
-                'metric': ['METRIC', 'metric'],
-                'admin_distance': ['DISTANCE', 'admin_distance'],
-                'age': ['AGE', 'age'],
-                'vrf': ['TABLE', 'vrf']
-            }
-        }
+        if platform in self.ROUTE_PLATFORM_OVERRIDES:
+            return self.ROUTE_PLATFORM_OVERRIDES[platform]
 
-        # Use platform-specific mappings if available, otherwise use base
-        if platform in platform_overrides:
-            return platform_overrides[platform]
-        else:
-            # Check if platform starts with known prefix
-            for known_platform in platform_overrides:
-                if platform.startswith(known_platform):
-                    return platform_overrides[known_platform]
+        # Check if platform starts with known prefix
+        for known_platform, mappings in self.ROUTE_PLATFORM_OVERRIDES.items():
+            if platform.startswith(known_platform):
+                return mappings
 
-            return base_mappings
+        return self.ROUTE_FIELD_MAPPINGS
 
-    def _extract_route_fields(self, entry: Dict, platform: str,
-                              field_mappings: Dict[str, List[str]]) -> NormalizedRouteData:
+    def _compile_route_plan(self, platform: str, header: tuple) -> 'RouteFieldPlan':
         """
-        Extract route fields using platform-specific field mappings - FIXED for Arista lists
+        Resolve which header columns feed each normalized field, in priority order
+        Fields whose platform names are all missing from the header fall back to the
+        generic names (e.g. the linux template uses NETWORK, not DESTINATION)
         """
-        result = NormalizedRouteData(network="", next_hop="", protocol="")
-
-        print(f"\n EXTRACTING FIELDS DEBUG:")
-        print(f"  Raw entry: {entry}")
-
-        # Extract each field using the mapping priority
-        for norm_field, possible_fields in field_mappings.items():
-            value = None
-            for field_name in possible_fields:
-                if field_name in entry and entry[field_name] is not None:
-                    raw_value = entry[field_name]
-
-                    print(f"  Processing {norm_field} from {field_name}: {raw_value} (type: {type(raw_value)})")
-
-                    # Handle list values (common in Arista for multi-path routes)
-                    if isinstance(raw_value, list):
-                        if raw_value:  # Non-empty list
-                            if norm_field in ['next_hop', 'interface']:
-                                # For next_hop and interface, handle carefully
-                                cleaned_values = []
-                                for v in raw_value:
-                                    v_str = str(v).strip()
-                                    # Filter out 'connected' strings for next_hop
-                                    if norm_field == 'next_hop':
-                                        if v_str and v_str != 'connected' and v_str not in cleaned_values:
-                                            cleaned_values.append(v_str)
-                                    else:
-                                        # For interface, keep all non-empty values
-                                        if v_str and v_str not in cleaned_values:
-                                            cleaned_values.append(v_str)
-
-                                if cleaned_values:
-                                    if len(cleaned_values) == 1:
-                                        value = cleaned_values[0]
-                                    else:
-                                        # Multiple paths - join with separator
-                                        value = " | ".join(cleaned_values)
-                                    print(f"    List processed to: '{value}'")
-                                else:
-                                    print(f"    List was empty after cleaning")
-                            else:
-                                # For other fields, just take the first non-empty value
-                                for v in raw_value:
-                                    v_str = str(v).strip()
-                                    if v_str:
-                                        value = v_str
-                                        print(f"    List first value: '{value}'")
-                                        break
+        column_index = {}
+        for i, name in enumerate(header):
+            column_index.setdefault(name, i)
+
+        field_mappings = self._get_platform_field_mappings(platform)
+        columns = []
+        for norm_field in ROUTE_FIELDS:
+            candidates = field_mappings.get(norm_field, ())
+            found = [column_index[name] for name in candidates if name in column_index]
+            if not found:
+                found = [column_index[name] for name in self.ROUTE_FIELD_MAPPINGS.get(norm_field, ())
+                         if name in column_index]
+            columns.append((norm_field, tuple(dict.fromkeys(found))))
+
+        family = next((name for name in ('cisco', 'arista', 'linux') if platform.startswith(name)), '')
+
+        return RouteFieldPlan(
+            platform=platform,
+            header=header,
+            columns=tuple(columns),
+            direct_column=column_index.get('DIRECT'),
+            family=family,
+            protocols=dict(self.platform_config.get_field_mapping(platform, 'protocols') or {})
+        )
+
+    def _apply_route_plan(self, plan: 'RouteFieldPlan', rows) -> List[NormalizedRouteData]:
+        """Run the plan over rows: column lookups by index, protocol codes translated once each"""
+        columns = plan.columns
+        direct_column = plan.direct_column
+        family = plan.family
+        protocols = plan.protocols
+        list_value = self._route_list_value
+        defaults = _ROUTE_DEFAULTS
+        connected_codes = _CISCO_CONNECTED_CODES if family == 'cisco' else _CONNECTED_CODES
+
+        normalized = []
+        append = normalized.append
+        for row in rows:
+            values = list(defaults)
+            for position, (norm_field, candidates) in enumerate(columns):
+                for column in candidates:
+                    raw_value = row[column]
+                    if raw_value is None:
+                        continue
+                    if type(raw_value) is str:
+                        value = raw_value.strip()
+                    elif isinstance(raw_value, list):
+                        # Multi-path routes (Arista, Aruba) carry list values
+                        value = list_value(norm_field, raw_value)
                     else:
-                        # Single value
                         value = str(raw_value).strip()
-                        print(f"    Single value: '{value}'")
-
-                    if value:  # Only use non-empty values
+                    if value:
+                        values[position] = value
                         break
 
-            if value:
-                setattr(result, norm_field, value)
-                print(f"     Set {norm_field} = '{value}'")
+            network, next_hop, protocol, mask, interface = values[:5]
+
+            # Network/prefix combination
+            if network and '/' not in network:
+                if family == 'cisco':
+                    if mask == '0' and network == '0.0.0.0':
+                        network = "0.0.0.0/0"  # Default route
+                    elif mask and mask != '0':
+                        network = f"{network}/{mask}"
+                elif family == 'arista' and mask:
+                    network = f"{network}/{mask}"
+                elif family == 'linux':
+                    if mask:
+                        network = f"{network}/{mask}"
+                    elif network == 'default':
+                        network = "0.0.0.0/0"
+            if not network:
+                continue
+            values[0] = network
+
+            # Next hop determination (on the raw protocol code)
+            if direct_column is not None and row[direct_column] == 'directly':
+                if not next_hop or next_hop == 'connected':
+                    values[1] = "Directly Connected"
+            elif not next_hop:
+                if interface:
+                    values[1] = "Directly Connected" if protocol in connected_codes else "Interface Only"
+                else:
+                    values[1] = "Unspecified"
 
-        # Special handling for network field combination
-        result = self._handle_network_combination(result, entry, platform)
+            if protocol:
+                name = protocols.get(protocol)
+                if name is None:
+                    name = protocols[protocol] = self._normalize_protocol(protocol, plan.platform)
+                values[2] = name
 
-        # FIXED: Use the corrected next hop determination
-        result = self._handle_next_hop_determination(result, entry, platform)
+            append(NormalizedRouteData(*values))
 
-        return result
-
-    def _handle_network_combination(self, result: NormalizedRouteData, entry: Dict, platform: str) -> NormalizedRouteData:
-        """
-        Handle platform-specific network/prefix combination logic
-        """
-        network = result.network
-        mask = result.mask
-
-        print(f"    Network combination: network='{network}', mask='{mask}'")
-
-        # Different platforms handle network/mask differently
-        if platform.startswith('cisco'):
-            # Cisco: NETWORK='172.16.1.0', PREFIX_LENGTH='24' -> '172.16.1.0/24'
-            if network and mask and '/' not in network:
-                if mask == '0' and network == '0.0.0.0':
-                    result.network = "0.0.0.0/0"  # Default route
-                elif mask != '0':
-                    result.network = f"{network}/{mask}"
-
-        elif platform.startswith('arista'):
-            # Arista might have different format
-            if network and mask and '/' not in network:
-                result.network = f"{network}/{mask}"
-
-        elif platform.startswith('linux'):
-            # Linux might already have CIDR notation
-            if network and '/' not in network and mask:
-                result.network = f"{network}/{mask}"
-            elif network == 'default':
-                result.network = "0.0.0.0/0"
-
-        print(f"    Final network: '{result.network}'")
-        return result
+        return normalized
 
-    def _handle_next_hop_determination(self, result: NormalizedRouteData, entry: Dict,
-                                       platform: str) -> NormalizedRouteData:
+    @staticmethod
+    def _route_list_value(norm_field: str, raw_value: list) -> Optional[str]:
         """
-        Handle platform-specific next hop determination logic - FIXED for Arista
+        Value of a list column: next hops and interfaces are de-duplicated and joined
+        (dropping 'connected' next hops), other fields take the first non-empty item
         """
-        print(f" NEXT HOP DEBUG:")
-        print(f"  Platform: {platform}")
-        print(f"  Current next_hop: '{result.next_hop}'")
-        print(f"  Current interface: '{result.interface}'")
-        print(f"  Raw entry keys: {list(entry.keys())}")
-
-        # Check DIRECT field for Arista
-        direct_value = entry.get('DIRECT', '')
-        print(f"  DIRECT field: '{direct_value}'")
-
-        # Only set to "Directly Connected" if:
-        # 1. DIRECT field explicitly says "directly" AND
-        # 2. We don't already have a valid next_hop
-        if direct_value == 'directly':
-            if not result.next_hop or result.next_hop in ['', 'connected']:
-                result.next_hop = "Directly Connected"
-                print(f"     Set to 'Directly Connected' (DIRECT='directly')")
-            else:
-                print(f"     DIRECT='directly' but already have next_hop: '{result.next_hop}'")
-
-        # If we have a valid next_hop, keep it
-        elif result.next_hop and result.next_hop not in ['', 'connected']:
-            print(f"     Keeping existing next_hop: '{result.next_hop}'")
-
-        # If no next_hop but we have an interface, it might be directly connected
-        elif not result.next_hop and result.interface:
-            # For Cisco Connected/Local routes
-            if platform.startswith('cisco') and result.protocol in ['C', 'Connected', 'L', 'Local']:
-                result.next_hop = "Directly Connected"
-                print(f"     Cisco connected route, set to 'Directly Connected'")
-            # For other platforms, be more conservative
-            elif result.protocol in ['Connected', 'C']:
-                result.next_hop = "Directly Connected"
-                print(f"     Connected protocol, set to 'Directly Connected'")
-            else:
-                result.next_hop = "Interface Only"
-                print(f"    No next_hop but has interface, set to 'Interface Only'")
-
-        # Last resort
-        elif not result.next_hop:
-            result.next_hop = "Unspecified"
-            print(f"     No next_hop found, set to 'Unspecified'")
-
-        print(f"    Final next_hop: '{result.next_hop}'")
-        return result
+        if norm_field in ('next_hop', 'interface'):
+            cleaned_values = []
+            for v in raw_value:
+                v_str = str(v).strip()
+                if v_str and v_str not in cleaned_values and not (norm_field == 'next_hop' and v_str == 'connected'):
+                    cleaned_values.append(v_str)
+            return " | ".join(cleaned_values) if cleaned_values else None
+
+        for v in raw_value:
+            v_str = str(v).strip()
+            if v_str:
+                return v_str
+        return None
 
     # In netmiko_controller.py, update the _normalize_protocol method in ConfigDrivenFieldNormalizer:
 
@@ -1021,30 +1095,6 @@ class ConfigDrivenFieldNormalizer:
         # Return original if no mapping found
         print(f"   No mapping found for '{protocol_clean}', returning as-is")
         return protocol_clean
-    def _is_valid_route_entry(self, entry: NormalizedRouteData) -> bool:
-        """
-        Validate if route entry has minimum required fields
-        """
-        # Must have a network
-        if not entry.network or entry.network.strip() == "":
-            return False
-
-        # Must have either next_hop or interface (be more lenient)
-        # Some routes might not have explicit next hop but still be valid
-        return True
-
-    def _log_validation_failure(self, entry: NormalizedRouteData):
-        """
-        Log why a route entry failed validation
-        """
-        reasons = []
-        if not entry.network:
-            reasons.append("missing network")
-        if not entry.next_hop and not entry.interface:
-            reasons.append("missing next_hop and interface")
-
-        print(f"    Validation failed: {', '.join(reasons)}")
-        print(f"    Entry: network='{entry.network}', next_hop='{entry.next_hop}', interface='{entry.interface}'")
 
     def normalize_system_info(self, parsed_data: List[Dict], platform: str) -> Dict:
         """Normalize system information using platform-specific field mappings from JSON config"""
@@ -1110,6 +1160,72 @@ class ConfigDrivenFieldNormalizer:
 
         print(f"  Final normalized result: {normalized}")
         return normalized
+def _connect_on_shared_transport(connection_params: Dict, host: str, port: int, username: str):
+    """Open the netmiko session on an already authenticated transport (no new login), or None"""
+    try:
+        from termtel.ssh.connection_broker import ssh_connection_broker, SharedSSHClient
+    except ImportError:
+        return None
+
+    lease = ssh_connection_broker.acquire(host, port, username)
+    if lease is None:
+        return None
+    try:
+        connection = ConnectHandler(**connection_params, auto_connect=False)
+        connection._get_ssh_client_instance = lambda: SharedSSHClient(lease)
+        connection._open()
+        print(f"✓ Opened telemetry session on the shared SSH transport to {host}")
+        return connection
+    except Exception as e:
+        print(f"⚠ Shared transport session failed ({e}), logging in separately")
+        lease.release()
+        return None
+
+
+def _share_transport(connection, host: str, port: int, username: str):
+    """Offer a new netmiko login for reuse; disconnect() then releases it instead of closing it"""
+    try:
+        from termtel.ssh.connection_broker import ssh_connection_broker, SharedSSHClient
+    except ImportError:
+        return
+
+    client = getattr(connection, 'remote_conn_pre', None)
+    transport = client.get_transport() if client is not None else None
+    if transport is None or isinstance(client, SharedSSHClient):
+        return
+    lease = ssh_connection_broker.register(host, port, username, transport)
+    shared_client = SharedSSHClient(lease)
+    shared_client._channels.append(connection.remote_conn)
+    connection.remote_conn_pre = shared_client
+
+
+def connect_brokered(connection_params: Dict, host: str, port: int, username: str):
+    """
+    Netmiko connection through the SSH connection broker
+
+    Opens the session on a terminal tab's login to the device when there is one,
+    otherwise logs in and offers the new transport for reuse.
+
+    Returns:
+        Connected netmiko connection; close it with disconnect_brokered()
+    """
+    connection = _connect_on_shared_transport(connection_params, host, port, username)
+    if connection is None:
+        connection = ConnectHandler(**connection_params)
+        _share_transport(connection, host, port, username)
+    return connection
+
+
+def disconnect_brokered(connection):
+    """Disconnect a connect_brokered() connection, releasing its transport lease even if disconnect() fails"""
+    client = getattr(connection, 'remote_conn_pre', None)
+    try:
+        connection.disconnect()
+    finally:
+        if getattr(client, 'lease', None) is not None:
+            client.close()
+
+
 class NetmikoConnectionManager:
     """UPDATED: Connection manager that uses platform configuration"""
 
@@ -1314,7 +1430,9 @@ class NetmikoConnectionManager:
             if use_ssh_key:
                 print(f"  Key file: {key_file_path}")
 
-            connection = ConnectHandler(**connection_params)
+            # Reuse a terminal tab's login to this device when there is one
+            connection = connect_brokered(connection_params, device_info.ip_address,
+                                          credentials.port, credentials.username)
 
             # Test connection with a simple command
             if netmiko_platform.startswith('cisco'):
@@ -1333,7 +1451,7 @@ class NetmikoConnectionManager:
                 return True
             else:
                 print(f"✗ Connection test failed for {device_info.hostname}")
-                connection.disconnect()
+                disconnect_brokered(connection)
                 return False
 
         except NetmikoAuthenticationException as e:
@@ -1371,13 +1489,32 @@ class NetmikoConnectionManager:
             print(f"Error executing command '{command}': {e}")
             return False, str(e)
 
+    def execute_command_streaming(self, device_ip: str, port: int, command: str,
+                                  on_text: Callable[[str], None], read_timeout: float = 30) -> tuple[bool, str]:
+        """
+        Execute command on connected device, handing output to on_text in whole lines as it arrives
+
+        Returns:
+            (success, output kept for raw views - cut off after RAW_OUTPUT_LIMIT characters)
+        """
+        connection_key = f"{device_ip}:{port}"
+
+        if connection_key not in self.connections:
+            return False, "No active connection found"
+
+        try:
+            return True, stream_command(self.connections[connection_key], command, on_text, read_timeout)
+        except Exception as e:
+            print(f"Error executing command '{command}': {e}")
+            return False, str(e)
+
     def disconnect(self, device_ip: str, port: int = 22):
         """Disconnect from device"""
         connection_key = f"{device_ip}:{port}"
 
         if connection_key in self.connections:
             try:
-                self.connections[connection_key].disconnect()
+                disconnect_brokered(self.connections[connection_key])
                 del self.connections[connection_key]
                 del self.connection_params[connection_key]
                 print(f"Disconnected from {device_ip}")
@@ -1413,6 +1550,11 @@ class EnhancedPlatformAwareTelemetryController(QObject):
     normalized_neighbors_ready = pyqtSignal(list)  # List[NormalizedNeighborData]
     normalized_arp_ready = pyqtSignal(list)  # List[NormalizedArpData]
     normalized_routes_ready = pyqtSignal(list)  # List[NormalizedRouteData]
+
+    # Per-table deltas against the previous cycle, for widgets that patch rows in place
+    neighbors_delta_ready = pyqtSignal(object)  # TableDelta
+    arp_delta_ready = pyqtSignal(object)  # TableDelta
+    routes_delta_ready = pyqtSignal(object)  # TableDelta
     normalized_system_ready = pyqtSignal(object)  # NormalizedSystemData
     normalized_logs_ready = pyqtSignal(list)
     normalized_system_metrics_ready = pyqtSignal(object)  # NormalizedSystemMetrics
@@ -1442,12 +1584,22 @@ class EnhancedPlatformAwareTelemetryController(QObject):
 
         # UPDATED: Pass platform config to connection manager
         self.connection_manager = NetmikoConnectionManager(self.platform_config)
+        self.collection_engine = "netmiko"  # see set_collection_engine()
         self.credentials = None
         self.is_connected = False
 
         # UPDATED: Use config-driven field normalizer
         self.field_normalizer = ConfigDrivenFieldNormalizer(self.platform_config)
-        self.local_template_parser = LocalTemplateParser() if TEXTFSM_AVAILABLE else None
+        self.local_template_parser = shared_template_parser if TEXTFSM_AVAILABLE else None
+
+        # Overlap command execution with parsing/normalization of the previous output
+        self.pipelined_collection = True
+
+        # JSON variants of commands (platforms.json 'structured') replace template parsing
+        self.structured_commands = StructuredCommandSelector(self.platform_config)
+
+        # Previous normalized tables, for delta signals
+        self.snapshots = TelemetrySnapshotStore()
 
         # Data collection timer
         self.data_collection_timer = QTimer()
@@ -1455,6 +1607,40 @@ class EnhancedPlatformAwareTelemetryController(QObject):
 
 
 
+    def set_collection_engine(self, engine: str = "netmiko") -> bool:
+        """
+        Select the SSH engine used for collection
+
+        Args:
+            engine: 'netmiko' (one blocking session per device) or 'async' (asyncssh
+                sessions multiplexed on one shared event loop)
+
+        Returns:
+            True if the engine was selected
+        """
+        if self.is_connected:
+            print(f" Cannot switch collection engine while connected")
+            return False
+
+        if engine == "async":
+            # Imported lazily, async_collector imports this module
+            from termtel.termtelwidgets.async_collector import (
+                AsyncConnectionManager, get_async_engine, ASYNCSSH_AVAILABLE
+            )
+            if not ASYNCSSH_AVAILABLE:
+                print(f" asyncssh not available, keeping netmiko engine")
+                return False
+            self.connection_manager = AsyncConnectionManager(get_async_engine(self.platform_config))
+        elif engine == "netmiko":
+            self.connection_manager = NetmikoConnectionManager(self.platform_config)
+        else:
+            print(f" Unknown collection engine: {engine}")
+            return False
+
+        self.collection_engine = engine
+        print(f" Collection engine: {engine}")
+        return True
+
     def get_available_platforms(self) -> List[str]:
         """Get list of available platforms from configuration"""
         return self.platform_config.get_available_platforms()
@@ -1473,13 +1659,10 @@ class EnhancedPlatformAwareTelemetryController(QObject):
             print(f" No platform_config available")
             return f"# No platform config available"
 
-        # Check available platforms
-        available_platforms = self.platform_config.get_available_platforms()
-        print(f"Available platforms: {available_platforms}")
-
-        # Check if current platform is in available platforms
-        if self.platform not in available_platforms:
+        # Check if current platform is configured
+        if self.platform_config.get_platform(self.platform) is None:
             print(f" Platform '{self.platform}' not in available platforms")
+            print(f"Available platforms: {self.platform_config.get_available_platforms()}")
             return f"# Platform '{self.platform}' not supported"
 
         # Try to get the command
@@ -1590,6 +1773,9 @@ class EnhancedPlatformAwareTelemetryController(QObject):
         self.platform = platform
         print(f" Set self.platform to: '{self.platform}'")
 
+        # Structured variants are re-tried on each device
+        self.structured_commands = StructuredCommandSelector(self.platform_config, self.structured_commands.enabled)
+
         # Verify platform configuration exists for this platform
         platform_def = self.platform_config.get_platform(platform)
         if platform_def:
@@ -1694,16 +1880,16 @@ class EnhancedPlatformAwareTelemetryController(QObject):
 
         if success:
             # Get template info from configuration
-            template_info = self.platform_config.get_template_info(self.platform, 'system_info')
-            if template_info:
-                template_platform, template_file = template_info
-                template_command = template_file.replace('.textfsm', '').replace(f'{template_platform}_', '')
-                parsed_data = self._parse_with_template(output, template_platform, template_command)
+            template_entry = self.platform_config.get_template_entry(self.platform, 'system_info')
+            if template_entry:
+                parsed_data = self._parse_with_template(
+                    output, template_entry.template_platform, template_entry.template_command
+                )
             else:
                 parsed_data = None
 
             # Update device info with parsed data
-            if parsed_data and isinstance(parsed_data, list) and len(parsed_data) > 0:
+            if parsed_data and len(parsed_data) > 0:
                 normalized_sys_info = self.field_normalizer.normalize_system_info(parsed_data, self.platform)
 
                 # Update device info with normalized data
@@ -1723,11 +1909,11 @@ class EnhancedPlatformAwareTelemetryController(QObject):
                 output=output,
                 platform=self.platform,
                 timestamp=time.time(),
-                template_used=template_info[1] if template_info else 'none',
+                template_used=template_entry.template_file if template_entry else 'none',
                 parsed_successfully=bool(parsed_data)
             ))
 
-    def _parse_with_template(self, output: str, platform: str, command: str) -> Optional[List[Dict]]:
+    def _parse_with_template(self, output: str, platform: str, command: str) -> Optional[ParsedTable]:
         """Parse command output using local TextFSM templates"""
         if not TEXTFSM_AVAILABLE or not self.local_template_parser:
             print(f"TextFSM not available for parsing {platform} {command}")
@@ -1759,33 +1945,138 @@ class EnhancedPlatformAwareTelemetryController(QObject):
             print(f"  Sample output: {sample_output}...")
             return None
 
-    def execute_command_and_parse(self, command_type: str, **kwargs) -> tuple[bool, str, Optional[List[Dict]]]:
+    def execute_command_and_parse(self, command_type: str, **kwargs) -> tuple[bool, str, Optional[ParsedTable]]:
         """UPDATED: Execute command and parse using JSON configuration"""
         if not self.is_connected:
             return False, "Not connected to device", None
 
+        success, command, output = self._execute_platform_command(command_type, **kwargs)
+        parsed_data = None
+        if success and output:
+            parsed_data = self._parse_command_output(command_type, output, command)
+
+        return success, output, parsed_data
+
+    def _execute_platform_command(self, command_type: str, **kwargs) -> tuple[bool, str, str]:
+        """Execute stage: run a configured command on the device, returns (success, command, output)"""
         command = self.get_platform_command(command_type, **kwargs)
         print(f"SSH COMMAND:")
         if command.startswith("#"):  # Error/unknown command
-            return False, f"Unknown command type: {command_type}", None
+            return False, command, f"Unknown command type: {command_type}"
+
+        # Structured variant first: decoded JSON instead of template parsing
+        structured_command = self.structured_commands.command_for(self.platform, command_type, **kwargs)
+        if structured_command:
+            success, output = self.connection_manager.execute_command(
+                self.device_info.ip_address,
+                self.credentials.port,
+                structured_command
+            )
+            if success and self.structured_commands.accept(self.platform, command_type, output):
+                return success, structured_command, output
 
         success, output = self.connection_manager.execute_command(
             self.device_info.ip_address,
             self.credentials.port,
             command
         )
+        return success, command, output
 
+    def _parse_command_output(self, command_type: str, output: str, command: str = "") -> Optional[ParsedTable]:
+        """Parse stage: parse command output with the template configured for the command"""
+        structured = self.structured_commands.variant_for(command)
+        if structured is not None:
+            return parse_structured_output(output, structured)
+
+        # Template parser key from configuration
+        parser_key = self.platform_config.get_parser_key(self.platform, command_type)
+        if not parser_key:
+            return None
+
+        template_platform, template_command = parser_key
+        return self._parse_with_template(output, template_platform, template_command)
+
+    def _normalize_command_output(self, command_type: str, command: str, parsed_data):
+        """Normalize stage: convert parsed rows to normalized records where a normalizer exists"""
+        if not parsed_data:
+            return None
+
+        if command_type == 'cdp_neighbors':
+            return self.field_normalizer.normalize_neighbors(parsed_data, self.platform, command)
+        elif command_type == 'arp_table':
+            return self.field_normalizer.normalize_arp(parsed_data, self.platform)
+        elif command_type in ['route_table', 'route_table_vrf']:
+            return self.field_normalizer.normalize_routes(parsed_data, self.platform)
+        return None
+
+    def _process_command_output(self, command_type: str, success: bool, command: str, output: str) -> tuple:
+        """Parse and normalize one command's output, returns (success, output, parsed_data, normalized_data)"""
         parsed_data = None
+        normalized_data = None
         if success and output:
-            # Get template info from configuration
-            template_info = self.platform_config.get_template_info(self.platform, command_type)
-            if template_info:
-                template_platform, template_file = template_info
-                # Convert template filename to command name for parser
-                template_command = template_file.replace('.textfsm', '').replace(f'{template_platform}_', '')
-                parsed_data = self._parse_with_template(output, template_platform, template_command)
+            parsed_data = self._parse_command_output(command_type, output, command)
+            normalized_data = self._normalize_command_output(command_type, command, parsed_data)
+        return success, output, parsed_data, normalized_data
 
-        return success, output, parsed_data
+    def _run_collection_cycle(self, command_types: List[str],
+                              on_result: Optional[Callable[[str, tuple], None]] = None) -> Dict[str, tuple]:
+        """
+        Run the execute stage for each command and the parse/normalize stage for its output
+
+        In pipelined mode the parse/normalize stage is handed to the shared parse pool
+        as soon as a command returns, so it overlaps with the next send_command.
+
+        Args:
+            command_types: Commands to run, in order
+            on_result: Called with (command_type, result) as each table finishes, on the
+                       calling thread: between commands for parses that are already done,
+                       then in completion order for the rest
+
+        Returns:
+            Dict of command_type -> (success, output, parsed_data, normalized_data)
+        """
+        results = {}
+        pending: Dict[Future, str] = {}
+
+        def finish(command_type: str, result: tuple):
+            results[command_type] = result
+            if on_result:
+                on_result(command_type, result)
+
+        def finish_future(future: Future):
+            command_type = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f" Parse stage failed for {command_type}: {e}")
+                result = (False, str(e), None, None)
+            finish(command_type, result)
+
+        for command_type in command_types:
+            success, command, output = self._execute_platform_command(command_type)
+            if self.pipelined_collection:
+                # Tables parsed while this command ran can go out before the next one
+                for future in [f for f in pending if f.done()]:
+                    finish_future(future)
+                future = get_parse_executor().submit(
+                    self._process_command_output, command_type, success, command, output
+                )
+                pending[future] = command_type
+            else:
+                finish(command_type, self._process_command_output(command_type, success, command, output))
+
+        for future in as_completed(list(pending)):
+            finish_future(future)
+
+        return results
+
+    def _device_id(self) -> str:
+        """Snapshot key for the connected device"""
+        return f"{self.device_info.ip_address}:{self.credentials.port}"
+
+    def _diff_table(self, table: str, records: list):
+        """Diff a normalized table against the previous cycle, returns a TableDelta"""
+        return self.snapshots.diff(self._device_id(), table, records)
 
     def collect_telemetry_data(self):
         """Collect telemetry data using platform-specific commands with template parsing"""
@@ -1794,9 +2085,21 @@ class EnhancedPlatformAwareTelemetryController(QObject):
 
         print(f"Collecting telemetry data from {self.platform}...")
 
+        # Each table is emitted as soon as its parse finishes, not after the whole cycle
+        self._run_collection_cycle(TELEMETRY_CYCLE_COMMANDS, on_result=self._emit_collection_result)
+
+        # === ENHANCED: SYSTEM METRICS COLLECTION ===
+        self._collect_system_metrics()
+
+    def _emit_collection_result(self, command_type: str, result: tuple):
+        """Emit the signals for one collected table"""
+        success, output, parsed_data, normalized_data = result
+        if not success:
+            return
+
         # CDP/LLDP neighbors with normalization
-        success, output, parsed_data = self.execute_command_and_parse('cdp_neighbors')
-        if success:
+        if command_type == 'cdp_neighbors':
+            normalized_neighbors = normalized_data
             command_used = self.get_platform_command('cdp_neighbors')
             self.raw_cdp_output.emit(RawCommandOutput(
                 command=command_used,
@@ -1806,15 +2109,13 @@ class EnhancedPlatformAwareTelemetryController(QObject):
                 parsed_successfully=bool(parsed_data)
             ))
 
-            if parsed_data:
-                normalized_neighbors = self.field_normalizer.normalize_neighbors(
-                    parsed_data, self.platform, command_used
-                )
+            if normalized_neighbors is not None:
                 self.normalized_neighbors_ready.emit(normalized_neighbors)
+                self.neighbors_delta_ready.emit(self._diff_table('neighbors', normalized_neighbors))
 
         # ARP table with normalization
-        success, output, parsed_data = self.execute_command_and_parse('arp_table')
-        if success:
+        elif command_type == 'arp_table':
+            normalized_arp = normalized_data
             self.raw_arp_output.emit(RawCommandOutput(
                 command=self.get_platform_command('arp_table'),
                 output=output,
@@ -1823,13 +2124,13 @@ class EnhancedPlatformAwareTelemetryController(QObject):
                 parsed_successfully=bool(parsed_data)
             ))
 
-            if parsed_data:
-                normalized_arp = self.field_normalizer.normalize_arp(parsed_data, self.platform)
+            if normalized_arp is not None:
                 self.normalized_arp_ready.emit(normalized_arp)
+                self.arp_delta_ready.emit(self._diff_table('arp', normalized_arp))
 
         # Route table with enhanced normalization
-        success, output, parsed_data = self.execute_command_and_parse('route_table')
-        if success:
+        elif command_type == 'route_table':
+            normalized_routes = normalized_data
             self.raw_route_output.emit(RawCommandOutput(
                 command=self.get_platform_command('route_table'),
                 output=output,
@@ -1838,13 +2139,12 @@ class EnhancedPlatformAwareTelemetryController(QObject):
                 parsed_successfully=bool(parsed_data)
             ))
 
-            if parsed_data:
-                normalized_routes = self.field_normalizer.normalize_routes(parsed_data, self.platform)
+            if normalized_routes is not None:
                 self.normalized_routes_ready.emit(normalized_routes)
+                self.routes_delta_ready.emit(self._diff_table('routes', normalized_routes))
 
         # VRF list collection
-        success, output, parsed_data = self.execute_command_and_parse('vrf_list')
-        if success:
+        elif command_type == 'vrf_list':
             self.raw_vrf_list_output.emit(RawCommandOutput(
                 command=self.get_platform_command('vrf_list'),
                 output=output,
@@ -1854,8 +2154,7 @@ class EnhancedPlatformAwareTelemetryController(QObject):
             ))
 
         # === NEW: CPU UTILIZATION DATA COLLECTION ===
-        success, output, parsed_data = self.execute_command_and_parse('cpu_utilization')
-        if success:
+        elif command_type == 'cpu_utilization':
             print(f" CPU command executed successfully")
 
             # Create a CPU-specific signal if it doesn't exist, or use existing one
@@ -1883,11 +2182,8 @@ class EnhancedPlatformAwareTelemetryController(QObject):
 
             print(f"CPU parsed data: {parsed_data}")
 
-        # === ENHANCED: SYSTEM METRICS COLLECTION ===
-        self._collect_system_metrics()
         # === NEW: MEMORY UTILIZATION DATA COLLECTION ===
-        success, output, parsed_data = self.execute_command_and_parse('memory_utilization')
-        if success:
+        elif command_type == 'memory_utilization':
             print(f" Memory command executed successfully")
 
             memory_raw_output = RawCommandOutput(
@@ -1909,8 +2205,7 @@ class EnhancedPlatformAwareTelemetryController(QObject):
             print(f"Memory parsed data: {parsed_data}")
 
         # === NEW: LOGS DATA COLLECTION ===
-        success, output, parsed_data = self.execute_command_and_parse('logs')
-        if success:
+        elif command_type == 'logs':
             print(f" Logs command executed successfully")
 
             self.raw_log_output.emit(RawCommandOutput(
@@ -2164,6 +2459,7 @@ class EnhancedPlatformAwareTelemetryController(QObject):
         if self.is_connected and self.device_info:
             self.data_collection_timer.stop()
             self.connection_manager.disconnect(self.device_info.ip_address, self.credentials.port)
+            self.snapshots.reset(self._device_id())
             self.is_connected = False
             self.device_info.connection_status = "disconnected"
             self.connection_status_changed.emit(self.device_info.ip_address, "disconnected")
@@ -0,0 +1,189 @@
+"""
+Normalized telemetry record types shared by the controller, workers and widgets
+Records are slotted dataclasses: no per-instance __dict__, so a route costs about a
+third of the memory of a plain dataclass. Low-cardinality fields (protocol,
+interface, mask, VRF, ...) are interned, so every record and every open device tab
+shares one string object per distinct value.
+
+ParsedTable carries template parser output (header plus raw rows) to the normalizers
+without building a dict per row.
+"""
+
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+from typing import Dict, List, Any, Iterable, Tuple
+
+
+@dataclass(slots=True)
+class NormalizedNeighborData:
+    """Normalized neighbor data structure across all platforms"""
+    local_interface: str
+    neighbor_device: str
+    neighbor_interface: str
+    neighbor_ip: str = ""
+    neighbor_platform: str = ""
+    neighbor_capability: str = ""
+    protocol_used: str = ""  # CDP, LLDP, etc.
+
+
+@dataclass(slots=True)
+class NormalizedArpData:
+    """Normalized ARP data structure across all platforms"""
+    ip_address: str
+    mac_address: str
+    interface: str
+    age: str = ""
+    type: str = ""
+    state: str = ""
+
+
+@dataclass(slots=True)
+class NormalizedRouteData:
+    """Normalized route data structure across all platforms"""
+    network: str
+    next_hop: str
+    protocol: str
+    mask: str = ""
+    interface: str = ""
+    metric: str = ""
+    admin_distance: str = ""
+    age: str = ""
+    vrf: str = "default"
+
+
+# Field names in declaration order (also the order of record_tuple)
+NEIGHBOR_FIELDS = tuple(f.name for f in fields(NormalizedNeighborData))
+ARP_FIELDS = tuple(f.name for f in fields(NormalizedArpData))
+ROUTE_FIELDS = tuple(f.name for f in fields(NormalizedRouteData))
+
+# Fields with few distinct values per device, worth sharing across records.
+# Masks are prefix lengths or dotted masks: at most a few dozen values, so an interned
+# string costs no more per route than a small int would, and stays a drop-in str.
+INTERNED_FIELDS: Dict[type, Tuple[str, ...]] = {
+    NormalizedNeighborData: ('local_interface', 'neighbor_device', 'neighbor_platform',
+                             'neighbor_capability', 'protocol_used'),
+    NormalizedArpData: ('interface', 'age', 'type', 'state'),
+    NormalizedRouteData: ('next_hop', 'protocol', 'mask', 'interface', 'metric',
+                          'admin_distance', 'vrf'),
+}
+
+_RECORD_FIELDS: Dict[type, Tuple[str, ...]] = {
+    NormalizedNeighborData: NEIGHBOR_FIELDS,
+    NormalizedArpData: ARP_FIELDS,
+    NormalizedRouteData: ROUTE_FIELDS,
+}
+
+
+def intern_records(records: List[Any]) -> List[Any]:
+    """
+    Intern the low-cardinality string fields of normalized records in place
+
+    Args:
+        records: Records of one normalized type
+
+    Returns:
+        The same list, for chaining
+    """
+    if not records:
+        return records
+
+    names = INTERNED_FIELDS.get(type(records[0]), ())
+    intern = sys.intern
+    for record in records:
+        for name in names:
+            value = getattr(record, name)
+            if type(value) is str:
+                setattr(record, name, intern(value))
+    return records
+
+
+def record_tuple(record) -> tuple:
+    """Field values of a normalized record in declaration order"""
+    return tuple(getattr(record, name) for name in _RECORD_FIELDS[type(record)])
+
+
+def records_from_tuples(record_type: type, rows: Iterable[tuple]) -> List[Any]:
+    """Rebuild interned records from record_tuple rows (e.g., returned by worker processes)"""
+    return intern_records([record_type(*row) for row in rows])
+
+
+class ParsedTable(Sequence):
+    """
+    Parsed template output: the template header and the row lists as TextFSM returned them
+    Normalizers read .rows by column index; indexing or iterating yields a dict per row,
+    built on demand, for the template editor, debug views and older callers
+    """
+
+    def __init__(self, header, rows: List[Any]):
+        self.header = tuple(header)
+        self.rows = rows
+        self._column_index = None
+
+    @property
+    def column_index(self) -> Dict[str, int]:
+        """Column name -> position in each row"""
+        if self._column_index is None:
+            self._column_index = {}
+            for i, name in enumerate(self.header):
+                self._column_index.setdefault(name, i)
+        return self._column_index
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [dict(zip(self.header, row)) for row in self.rows[index]]
+        return dict(zip(self.header, self.rows[index]))
+
+    def __iter__(self):
+        header = self.header
+        for row in self.rows:
+            yield dict(zip(header, row))
+
+    def column(self, name: str) -> List[Any]:
+        """All values of one column"""
+        position = self.column_index[name]
+        return [row[position] for row in self.rows]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """The whole table as a list of dicts (the legacy parse() result)"""
+        return list(self)
+
+    def __repr__(self):
+        return f"ParsedTable({len(self.rows)} rows, header={list(self.header)})"
+
+
+def entries_to_rows(entries) -> Tuple[Tuple[str, ...], List[Any]]:
+    """
+    Parsed entries as (header, rows); keys missing from an entry become None
+
+    Args:
+        entries: ParsedTable (returned as is) or dict entries (normally all with the
+                 template's keys, in the same order)
+
+    Returns:
+        (header, rows)
+    """
+    if isinstance(entries, ParsedTable):
+        return entries.header, entries.rows
+    if not entries:
+        return (), []
+    first_keys = entries[0].keys()
+    header = dict.fromkeys(first_keys)
+    for entry in entries:
+        if entry.keys() != first_keys:
+            header.update(dict.fromkeys(entry))
+    header = tuple(header)
+    return header, [tuple(map(entry.get, header)) for entry in entries]
+
+
+def record_dict(record) -> Dict[str, Any]:
+    """Plain dict view of a normalized record (for JSON snapshots and exports)"""
+    return {name: getattr(record, name) for name in _RECORD_FIELDS[type(record)]}
+
+
+def records_to_dicts(records) -> List[Dict[str, Any]]:
+    """record_dict for every normalized record in a list (anything else is skipped)"""
+    return [record_dict(record) for record in records or () if type(record) in _RECORD_FIELDS]
@@ -15,46 +15,10 @@ from typing import List, Dict, Optional
 import os
 
 # Import the base widget classes and data structures
-# These would come from your controller file
-from dataclasses import dataclass
-
-
-@dataclass
-class NormalizedNeighborData:
-    """Normalized neighbor data structure across all platforms"""
-    local_interface: str
-    neighbor_device: str
-    neighbor_interface: str
-    neighbor_ip: str = ""
-    neighbor_platform: str = ""
-    neighbor_capability: str = ""
-    protocol_used: str = ""
-
-
-@dataclass
-class NormalizedArpData:
-    """Normalized ARP data structure across all platforms"""
-    ip_address: str
-    mac_address: str
-    interface: str
-    age: str = ""
-    type: str = ""
-    state: str = ""
-
-
-@dataclass
-class NormalizedRouteData:
-    """Normalized route data structure across all platforms"""
-    network: str
-    next_hop: str
-    protocol: str
-    mask: str = ""
-    interface: str = ""
-    metric: str = ""
-    admin_distance: str = ""
-    age: str = ""
-    vrf: str = "default"
-
+from termtel.termtelwidgets.normalized_records import (NormalizedNeighborData, NormalizedArpData,
+                                                       NormalizedRouteData)
+from termtel.termtelwidgets.route_table_model import (RouteTableModel, RouteFilterProxyModel,
+                                                      ROUTE_COLUMNS, create_route_table_view)
 
 
 class TemplateEditableWidget:
@@ -125,7 +89,10 @@ class EnhancedNeighborWidget(TemplateEditableWidget, QWidget):
 
         # Connect to both raw and normalized signals
         self.controller.raw_cdp_output.connect(self.process_raw_neighbor_output)
-        self.controller.normalized_neighbors_ready.connect(self.update_with_normalized_data)
+        if hasattr(self.controller, 'neighbors_delta_ready'):
+            self.controller.neighbors_delta_ready.connect(self.apply_neighbor_delta)
+        else:
+            self.controller.normalized_neighbors_ready.connect(self.update_with_normalized_data)
         self.controller.theme_changed.connect(self.on_theme_changed)
 
         self._setup_widget()
@@ -311,6 +278,12 @@ class EnhancedNeighborWidget(TemplateEditableWidget, QWidget):
         # NEW: Enable export button when we have data
         self.export_button.setEnabled(len(normalized_neighbors) > 0)
 
+    @pyqtSlot(object)  # TableDelta
+    def apply_neighbor_delta(self, delta):
+        """Redraw only when the neighbor table actually changed"""
+        if not delta.is_empty:
+            self.update_with_normalized_data(delta.records)
+
     def _update_table_with_normalized_data(self, neighbors: List[NormalizedNeighborData]):
         """Update table with normalized neighbor data"""
         self.neighbors_table.setRowCount(len(neighbors))
@@ -433,7 +406,12 @@ class EnhancedArpWidget(TemplateEditableWidget, QWidget):
 
         # Connect to both raw and normalized signals
         self.controller.raw_arp_output.connect(self.process_raw_arp_output)
-        self.controller.normalized_arp_ready.connect(self.update_with_normalized_data)
+        if hasattr(self.controller, 'arp_delta_ready'):
+            self.controller.arp_delta_ready.connect(self.apply_arp_delta)
+        else:
+            self.controller.normalized_arp_ready.connect(self.update_with_normalized_data)
+        if hasattr(self.controller, 'arp_rows_streamed'):
+            self.controller.arp_rows_streamed.connect(self.append_streamed_rows)
         self.controller.theme_changed.connect(self.on_theme_changed)
 
         self._setup_widget()
@@ -611,11 +589,33 @@ class EnhancedArpWidget(TemplateEditableWidget, QWidget):
         # NEW: Enable export button when we have data
         self.export_button.setEnabled(len(normalized_arp) > 0)
 
+    @pyqtSlot(object)  # TableDelta
+    def apply_arp_delta(self, delta):
+        """Redraw only when the ARP table actually changed"""
+        if not delta.is_empty:
+            self.update_with_normalized_data(delta.records)
+
+    @pyqtSlot(list, bool)  # List[NormalizedArpData], first batch
+    def append_streamed_rows(self, arp_entries, first_batch):
+        """Show ARP entries while the ARP command is still running"""
+        start = 0 if first_batch else self.arp_table.rowCount()
+        self.arp_table.setRowCount(start + len(arp_entries))
+        self._set_rows(start, arp_entries)
+        if first_batch:
+            self.arp_table.resizeColumnsToContents()
+
+        self.data_source_label.setText("Loading...")
+        self.count_label.setText(f"Entries: {self.arp_table.rowCount()} (loading)")
+
     def _update_table_with_normalized_data(self, arp_entries: List[NormalizedArpData]):
         """Update table with normalized ARP data"""
         self.arp_table.setRowCount(len(arp_entries))
+        self._set_rows(0, arp_entries)
+        self.arp_table.resizeColumnsToContents()
 
-        for row, entry in enumerate(arp_entries):
+    def _set_rows(self, start: int, arp_entries: List[NormalizedArpData]):
+        """Fill table rows from start with normalized ARP entries"""
+        for row, entry in enumerate(arp_entries, start):
             self.arp_table.setItem(row, 0, QTableWidgetItem(entry.ip_address))
             self.arp_table.setItem(row, 1, QTableWidgetItem(entry.mac_address))
             self.arp_table.setItem(row, 2, QTableWidgetItem(entry.interface))
@@ -636,8 +636,6 @@ class EnhancedArpWidget(TemplateEditableWidget, QWidget):
             if state_item:
                 state_item.setForeground(QColor(state_color))
 
-        self.arp_table.resizeColumnsToContents()
-
     def _update_table_with_raw_data(self, entries: List[Dict]):
         """Update table with raw parsed data"""
         self.arp_table.setRowCount(len(entries))
@@ -731,17 +729,18 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
     def _connect_controller_signals(self):
         """Connect to controller signals"""
 
-        # Route data signals
+        # Route data signals (deltas first: patch rows instead of rebuilding the table)
         route_signal_names = [
-            'normalized_routes_ready',
-            'route_table_ready',
-            'routes_ready'
+            ('routes_delta_ready', self.apply_route_delta),
+            ('normalized_routes_ready', self.update_with_normalized_data),
+            ('route_table_ready', self.update_with_normalized_data),
+            ('routes_ready', self.update_with_normalized_data)
         ]
 
-        for signal_name in route_signal_names:
+        for signal_name, slot_method in route_signal_names:
             try:
                 signal = getattr(self.controller, signal_name)
-                signal.connect(self.update_with_normalized_data)
+                signal.connect(slot_method)
                 print(f" Connected to {signal_name}")
                 break  # Only connect to the first one found
             except AttributeError:
@@ -751,6 +750,7 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
         other_signals = [
             ('raw_route_output', self.process_raw_route_output),
             ('raw_vrf_list_output', self.process_vrf_list_output),
+            ('routes_rows_streamed', self.append_streamed_routes),
             ('theme_changed', self.on_theme_changed),
             ('connection_status_changed', self._on_connection_status_changed),
             ('device_info_updated', self._on_device_info_updated)
@@ -815,12 +815,11 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
 
-        # Route table
-        self.route_table = QTableWidget(0, 8)
-        self.route_table.setHorizontalHeaderLabels([
-            "Network", "Mask", "Next Hop", "Interface", "Protocol",
-            "Metric", "Admin Dist", "Age"
-        ])
+        # Route table: model/view, only visible rows are rendered
+        self.route_model = RouteTableModel(self)
+        self.route_proxy = RouteFilterProxyModel(self)
+        self.route_proxy.setSourceModel(self.route_model)
+        self.route_table = create_route_table_view(self.route_proxy)
         layout.addWidget(self.route_table)
 
         # Status bar
@@ -880,7 +879,7 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
         """Export current route table data to CSV file"""
         try:
             # Check if we have data to export
-            if self.route_table.rowCount() == 0:
+            if self.route_proxy.rowCount() == 0:
                 QMessageBox.information(self, "Export Info", "No route data to export")
                 return
 
@@ -907,24 +906,15 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
                 writer.writerow([f"# VRF: {self.vrf_combo.currentText()}"])
                 writer.writerow([f"# Protocol Filter: {self.protocol_filter.currentText()}"])
                 writer.writerow([f"# Data Source: {self.data_source_label.text()}"])
-                writer.writerow([f"# Total Routes Displayed: {self.route_table.rowCount()}"])
+                writer.writerow([f"# Total Routes Displayed: {self.route_proxy.rowCount()}"])
                 writer.writerow([])  # Empty row separator
 
                 # Write headers
-                headers = []
-                for col in range(self.route_table.columnCount()):
-                    header_item = self.route_table.horizontalHeaderItem(col)
-                    headers.append(header_item.text() if header_item else f"Column {col}")
-                writer.writerow(headers)
+                writer.writerow([header for _, header in ROUTE_COLUMNS])
 
-                # Write data rows
-                for row in range(self.route_table.rowCount()):
-                    row_data = []
-                    for col in range(self.route_table.columnCount()):
-                        item = self.route_table.item(row, col)
-                        cell_value = item.text() if item else ""
-                        row_data.append(cell_value)
-                    writer.writerow(row_data)
+                # Write data rows (filtered and sorted as displayed)
+                for row in range(self.route_proxy.rowCount()):
+                    writer.writerow(self.route_proxy.row_values(row))
 
             # Success message
             QMessageBox.information(
@@ -932,7 +922,7 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
                 "Export Successful",
                 f"Route table exported successfully!\n\n"
                 f"File: {os.path.basename(filename)}\n"
-                f"Routes exported: {self.route_table.rowCount()}\n"
+                f"Routes exported: {self.route_proxy.rowCount()}\n"
                 f"VRF: {self.vrf_combo.currentText()}\n"
                 f"Filter: {self.protocol_filter.currentText()}"
             )
@@ -975,7 +965,7 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
         print(f" Processing VRF list output: {raw_output.command}")
 
     @pyqtSlot(list)
-    def update_with_normalized_data(self, normalized_routes):
+    def update_with_normalized_data(self, normalized_routes, keys=None):
         """Update widget with normalized route data - FIXED VERSION"""
         print(f"\n Normalized route data received: {len(normalized_routes)} routes")
 
@@ -985,66 +975,76 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
 
         self._current_data = normalized_routes
 
-        # FIXED: Update protocol filter BEFORE applying filters
-        self._update_protocol_filter(normalized_routes)
+        # Load the model first, the protocol list is read from its protocol column
+        self._update_table_with_normalized_data(normalized_routes, keys)
 
-        # FIXED: Update table (this will apply current filter)
-        self._update_table_with_normalized_data(normalized_routes)
+        # Update protocol filter, then apply the (possibly reset) selection
+        self._update_protocol_filter(normalized_routes)
+        self.route_proxy.set_protocol_filter(self.protocol_filter.currentText())
 
         # Update count
         self.count_label.setText(f"Routes: {len(normalized_routes)}")
 
         # NEW: Enable export button when we have data
-        self.export_button.setEnabled(len(normalized_routes) > 0)
+        self.export_button.setEnabled(self.route_proxy.rowCount() > 0)
 
         # Debug: Print available protocols
-        protocols = set()
-        for route in normalized_routes:
-            if route.protocol:
-                protocols.add(route.protocol)
-        print(f" Available protocols: {sorted(protocols)}")
+        print(f" Available protocols: {sorted(self.route_model.protocols())}")
 
-    def _update_table_with_normalized_data(self, routes):
-        """Update table with normalized route data - FIXED FILTERING"""
+    @pyqtSlot(list, bool)  # List[NormalizedRouteData], first batch
+    def append_streamed_routes(self, routes, first_batch):
+        """Show routes while the route command is still running"""
+        if first_batch:
+            self.route_model.set_routes(routes)
+        else:
+            self.route_model.append_routes(routes)
+
+        self.data_source_label.setText("Loading...")
+        self.count_label.setText(f"Routes: {self.route_model.rowCount()} (loading)")
+
+    @pyqtSlot(object)  # TableDelta
+    def apply_route_delta(self, delta):
+        """
+        Apply a route table delta from the controller
+
+        Changed rows are updated in the model, removed rows dropped and added rows
+        inserted; the model is only reset for the first snapshot.
+        """
+        if delta.is_empty:
+            print(f" Route table unchanged ({len(delta.records)} routes)")
+            return
+
+        if delta.full or self.route_model.rowCount() != len(delta.records) - len(delta.added) + len(delta.removed):
+            self.update_with_normalized_data(delta.records, delta.keys)
+            return
+
+        print(f" Patching route table: +{len(delta.added)} -{len(delta.removed)} ~{len(delta.changed)}")
+        self._current_data = delta.records
+        self.route_model.apply_delta(delta)
+        self._apply_vrf_filter()
+
+        # A new or vanished protocol changes the filter list (and may reset the filter)
+        if self.route_model.protocols() | {'All Protocols'} != self._available_protocols:
+            self._update_protocol_filter(delta.records)
+            self.route_proxy.set_protocol_filter(self.protocol_filter.currentText())
+
+        self.count_label.setText(f"Routes: {len(delta.records)}")
+        self.export_button.setEnabled(self.route_proxy.rowCount() > 0)
+
+    def _update_table_with_normalized_data(self, routes, keys=None):
+        """Load normalized routes into the model; filtering and sorting are done by the proxy"""
         print(f" Updating route table with {len(routes)} routes")
 
-        # FIXED: Apply current filter properly
-        filtered_routes = self._apply_current_filter(routes)
-        print(f" After filtering: {len(filtered_routes)} routes")
+        self.route_model.set_routes(routes, keys)
+        self.route_proxy.set_protocol_filter(self.protocol_filter.currentText())
+        self._apply_vrf_filter()
+        print(f" After filtering: {self.route_proxy.rowCount()} routes")
         print(f" Current filter: '{self.protocol_filter.currentText()}'")
 
-        self.route_table.setRowCount(len(filtered_routes))
-
-        for row, route in enumerate(filtered_routes):
-            self.route_table.setItem(row, 0, QTableWidgetItem(route.network))
-            self.route_table.setItem(row, 1, QTableWidgetItem(route.mask))
-            self.route_table.setItem(row, 2, QTableWidgetItem(route.next_hop))
-            self.route_table.setItem(row, 3, QTableWidgetItem(route.interface))
-            self.route_table.setItem(row, 4, QTableWidgetItem(route.protocol))
-            self.route_table.setItem(row, 5, QTableWidgetItem(route.metric))
-            self.route_table.setItem(row, 6, QTableWidgetItem(route.admin_distance))
-            self.route_table.setItem(row, 7, QTableWidgetItem(route.age))
-
-            # Color-code by protocol
-            protocol_colors = {
-                'Static': '#ffff00',
-                'Connected': '#00ff00',
-                'Local': '#00ff88',
-                'OSPF': '#ff8800',
-                'BGP': '#ff0088',
-                'EIGRP': '#8800ff',
-                'RIP': '#0088ff'
-            }
-
-            protocol_color = protocol_colors.get(route.protocol, '#ffffff')
-            protocol_item = self.route_table.item(row, 4)
-            if protocol_item:
-                protocol_item.setForeground(QColor(protocol_color))
-
         self.route_table.resizeColumnsToContents()
 
         # NEW: Update export button state based on filtered data
-        self.export_button.setEnabled(len(filtered_routes) > 0)
+        self.export_button.setEnabled(self.route_proxy.rowCount() > 0)
 
         print(f" Route table updated successfully")
 
@@ -1052,11 +1052,8 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
         """Update protocol filter dropdown - FIXED VERSION"""
         print(f" Updating protocol filter...")
 
-        # Get all unique protocols from routes
-        protocols = set(['All Protocols'])
-        for route in routes:
-            if route.protocol and route.protocol.strip():
-                protocols.add(route.protocol)
+        # Get all unique protocols from the loaded routes
+        protocols = set(['All Protocols']) | self.route_model.protocols()
 
         print(f" Found protocols: {sorted(protocols)}")
 
@@ -1086,41 +1083,35 @@ class FixedRouteWidget(TemplateEditableWidget, QWidget):
         # Store available protocols for filtering
         self._available_protocols = protocols
 
-    def _apply_current_filter(self, routes):
-        """Apply current protocol filter to routes - FIXED VERSION"""
-        current_filter = self.protocol_filter.currentText()
-        print(f" Applying filter: '{current_filter}' to {len(routes)} routes")
-
-        if current_filter == "All Protocols":
-            print(f" No filter applied, returning all {len(routes)} routes")
-            return routes
-
-        filtered_routes = []
-        for route in routes:
-            if route.protocol == current_filter:
-                filtered_routes.append(route)
-
-        print(f" Filter '{current_filter}' matched {len(filtered_routes)} routes")
-
-        # Debug: Show what protocols we actually have
-        actual_protocols = set()
-        for route in routes:
-            actual_protocols.add(route.protocol)
-        print(f" Actual protocols in data: {sorted(actual_protocols)}")
-
-        return filtered_routes
-
     def _apply_filters(self):
         """Apply filters to current data - triggered by filter change"""
-        print(f" Filter changed, reapplying to {len(self._current_data)} routes...")
-        if self._current_data:
-            self._update_table_with_normalized_data(self._current_data)
+        print(f" Filter changed to '{self.protocol_filter.currentText()}'")
+        self.route_proxy.set_protocol_filter(self.protocol_filter.currentText())
+        self.export_button.setEnabled(self.route_proxy.rowCount() > 0)
 
     @pyqtSlot(str)
     def on_vrf_changed(self, vrf_name: str):
         """Handle VRF selection change"""
         print(f" VRF changed to: {vrf_name}")
-        self.selected_vrf_label.setText(f"VRF: {vrf_name}")
+        self._apply_vrf_filter()
+
+    def _apply_vrf_filter(self):
+        """
+        Filter by the selected VRF when the loaded table has routes for it
+        The collected table is usually the global one (every route in 'default');
+        filtering that by another VRF would only empty the view, so all routes stay shown.
+        """
+        vrf_name = self.vrf_combo.currentText()
+        if vrf_name and vrf_name != "default" and vrf_name in self.route_model.vrfs():
+            self.route_proxy.set_vrf_filter(vrf_name)
+            self.selected_vrf_label.setText(f"VRF: {vrf_name}")
+        else:
+            self.route_proxy.set_vrf_filter(None)
+            if vrf_name and vrf_name != "default":
+                self.selected_vrf_label.setText(f"VRF: {vrf_name} (not in table, showing all)")
+            else:
+                self.selected_vrf_label.setText(f"VRF: {vrf_name or 'default'}")
+        self.export_button.setEnabled(self.route_proxy.rowCount() > 0)
 
     def refresh_route_table(self):
         """Refresh route table"""
@@ -1204,12 +1195,11 @@ class EnhancedRouteWidget(TemplateEditableWidget, QWidget):
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
 
-        # Route table with enhanced columns
-        self.route_table = QTableWidget(0, 8)
-        self.route_table.setHorizontalHeaderLabels([
-            "Network", "Mask", "Next Hop", "Interface", "Protocol",
-            "Metric", "Admin Dist", "Age"
-        ])
+        # Route table with enhanced columns (model/view, only visible rows are rendered)
+        self.route_model = RouteTableModel(self)
+        self.route_proxy = RouteFilterProxyModel(self)
+        self.route_proxy.setSourceModel(self.route_model)
+        self.route_table = create_route_table_view(self.route_proxy)
 
         layout.addWidget(self.route_table)
 
@@ -1267,105 +1257,39 @@ class EnhancedRouteWidget(TemplateEditableWidget, QWidget):
         self._update_protocol_filter(normalized_routes)
         self.count_label.setText(f"Routes: {len(normalized_routes)}")
 
-    # In normalized_widgets.py, update the protocol_colors in FixedRouteWidget._update_table_with_normalized_data:
-
     def _update_table_with_normalized_data(self, routes):
-        """Update table with normalized route data - FIXED FILTERING"""
+        """Load normalized routes into the model; filtering and sorting are done by the proxy"""
         print(f" Updating route table with {len(routes)} routes")
 
-        # Apply current filter properly
-        filtered_routes = self._apply_current_filter(routes)
-        print(f" After filtering: {len(filtered_routes)} routes")
-
-        # DEBUG: Show what protocols we're getting
-        if filtered_routes:
-            protocols_in_data = set()
-            for route in filtered_routes[:5]:  # First 5 routes
-                protocols_in_data.add(route.protocol)
-                print(f"  Route: {route.network} via {route.next_hop} ({route.protocol})")
-            print(f" Protocols in filtered data: {sorted(protocols_in_data)}")
-
-        self.route_table.setRowCount(len(filtered_routes))
-
-        for row, route in enumerate(filtered_routes):
-            self.route_table.setItem(row, 0, QTableWidgetItem(route.network))
-            self.route_table.setItem(row, 1, QTableWidgetItem(route.mask))
-            self.route_table.setItem(row, 2, QTableWidgetItem(route.next_hop))
-            self.route_table.setItem(row, 3, QTableWidgetItem(route.interface))
-            self.route_table.setItem(row, 4, QTableWidgetItem(route.protocol))
-            self.route_table.setItem(row, 5, QTableWidgetItem(route.metric))
-            self.route_table.setItem(row, 6, QTableWidgetItem(route.admin_distance))
-            self.route_table.setItem(row, 7, QTableWidgetItem(route.age))
-
-            # ENHANCED: Color-code by protocol - EXACT SAME AS TEMPLATE EDITOR
-            protocol_colors = {
-                # Static routes
-                'Static': '#ffff00',
-                'Static Default': '#ffff00',
-
-                # Connected/Local
-                'Connected': '#00ff00',
-                'Local': '#00ff88',
-
-                # OSPF variants
-                'OSPF': '#ff8800',
-                'OSPF Inter-Area': '#ff8800',
-                'OSPF External': '#ff8800',
-                'OSPF NSSA': '#ff8800',
-
-                # BGP variants
-                'BGP': '#ff0088',
-                'BGP Internal': '#ff0088',
-                'BGP External': '#ff0088',
-                'B E': '#ff0088',
-
-                # Other protocols
-                'EIGRP': '#8800ff',
-                'RIP': '#0088ff',
-                'ISIS': '#00ffff',
-                'ISIS Level-1': '#00ffff',
-                'ISIS Level-2': '#00ffff',
-                'Kernel': '#888888',
-                'Mobile': '#ff8888',
-                'IGRP': '#8888ff',
-                'NAT': '#ff88ff'
-            }
-
-            protocol_color = protocol_colors.get(route.protocol, '#ffffff')
-            protocol_item = self.route_table.item(row, 4)
-            if protocol_item:
-                protocol_item.setForeground(QColor(protocol_color))
-                # DEBUG: Show coloring for first few rows
-                if row < 3:
-                    print(f"  Row {row}: Protocol '{route.protocol}' -> Color {protocol_color}")
+        self.route_model.set_routes(routes)
+        self.route_proxy.set_protocol_filter(self.protocol_filter.currentText())
+        print(f" After filtering: {self.route_proxy.rowCount()} routes")
 
         self.route_table.resizeColumnsToContents()
-
-
         print(f" Route table updated successfully")
+
     def _update_table_with_raw_data(self, routes: List[Dict]):
         """Update table with raw parsed data"""
-        self.route_table.setRowCount(len(routes))
-
-        for row, route in enumerate(routes):
-            self.route_table.setItem(row, 0, QTableWidgetItem(route.get('network', 'Unknown')))
-            self.route_table.setItem(row, 1, QTableWidgetItem(route.get('mask', '')))
-            self.route_table.setItem(row, 2, QTableWidgetItem(route.get('next_hop', 'Unknown')))
-            self.route_table.setItem(row, 3, QTableWidgetItem(route.get('interface', 'Unknown')))
-            self.route_table.setItem(row, 4, QTableWidgetItem(route.get('protocol', 'Unknown')))
-            self.route_table.setItem(row, 5, QTableWidgetItem(route.get('metric', '')))
-            self.route_table.setItem(row, 6, QTableWidgetItem(route.get('admin_distance', '')))
-            self.route_table.setItem(row, 7, QTableWidgetItem(route.get('age', '')))
+        self.route_model.set_routes([
+            {
+                'network': route.get('network', 'Unknown'),
+                'mask': route.get('mask', ''),
+                'next_hop': route.get('next_hop', 'Unknown'),
+                'interface': route.get('interface', 'Unknown'),
+                'protocol': route.get('protocol', 'Unknown'),
+                'metric': route.get('metric', ''),
+                'admin_distance': route.get('admin_distance', ''),
+                'age': route.get('age', ''),
+            }
+            for route in routes
+        ])
 
         self.count_label.setText(f"Routes: {len(routes)} (Raw)")
         self.route_table.resizeColumnsToContents()
 
     def _update_protocol_filter(self, routes: List[NormalizedRouteData]):
         """Update protocol filter dropdown with available protocols"""
-        protocols = set(['All Protocols'])
-        for route in routes:
-            if route.protocol:
-                protocols.add(route.protocol)
+        protocols = set(['All Protocols']) | self.route_model.protocols()
 
         current_filter = self.protocol_filter.currentText()
         self.protocol_filter.clear()
@@ -1374,19 +1298,9 @@ class EnhancedRouteWidget(TemplateEditableWidget, QWidget):
         if current_filter in protocols:
             self.protocol_filter.setCurrentText(current_filter)
 
-    def _apply_current_filter(self, routes: List[NormalizedRouteData]) -> List[NormalizedRouteData]:
-        """Apply current protocol filter to routes"""
-        current_filter = self.protocol_filter.currentText()
-
-        if current_filter == "All Protocols":
-            return routes
-
-        return [route for route in routes if route.protocol == current_filter]
-
     def _apply_filters(self):
         """Apply filters to current data"""
-        if self._current_data:
-            self._update_table_with_normalized_data(self._current_data)
+        self.route_proxy.set_protocol_filter(self.protocol_filter.currentText())
 
     def _parse_vrf_list(self, raw_output) -> List[str]:
         """Parse VRF list from platform output"""
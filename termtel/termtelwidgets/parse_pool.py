@@ -0,0 +1,207 @@
+"""
+Process-pool backend for parsing large command outputs
+TextFSM and route normalization are pure Python and hold the GIL, so a full
+routing table parsed in a worker thread still starves the Qt event loop. Outputs
+above a size threshold are sent to worker processes instead; workers keep their
+own pre-warmed compiled template cache and return compact row tuples.
+"""
+
+import io
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Any, Tuple
+
+from termtel.termtelwidgets.template_cache import compiled_template_cache
+from termtel.termtelwidgets.normalized_records import record_tuple, entries_to_rows
+
+# Set in worker processes so they never try to offload again
+_IN_WORKER = False
+
+
+# ===== WORKER PROCESS FUNCTIONS =====
+
+def _init_worker(templates: Dict[str, str]):
+    """Worker initializer: compile the known templates before the first job arrives"""
+    global _IN_WORKER
+    _IN_WORKER = True
+
+    with redirect_stdout(io.StringIO()):
+        for template_name, template_content in templates.items():
+            try:
+                compiled_template_cache.get_fsm(template_name, template_content)
+            except Exception:
+                pass  # Reported by the parse that actually uses it
+
+
+def _parse_rows(template_name: str, template_content: str, data: str) -> Tuple[List[str], List[tuple]]:
+    """Worker: parse output and return (header, row tuples)"""
+    with redirect_stdout(io.StringIO()):
+        template = compiled_template_cache.get_fsm(template_name, template_content)
+    rows = template.ParseText(data)
+    return list(template.header), [tuple(row) for row in rows]
+
+
+def _normalize_route_rows(normalizer, platform: str, header: List[str], rows: List[tuple]) -> List[tuple]:
+    """Worker: normalize a chunk of route rows, returning NormalizedRouteData field tuples"""
+    # The normalizer's progress output is useless from a worker
+    with redirect_stdout(io.StringIO()):
+        normalized = normalizer.normalize_route_rows(header, rows, platform)
+
+    return [record_tuple(route) for route in normalized]
+
+
+# ===== MAIN PROCESS SIDE =====
+
+class ProcessParsePool:
+    """
+    Optional process pool for CPU-heavy parsing
+
+    - parse(): outputs of at least size_threshold characters are parsed in a worker
+    - normalize_routes(): parsed tables of at least row_threshold rows are normalized
+      in chunks across the workers (off by default: pickling the rows both ways costs
+      more than normalizing them in-process)
+    Every method returns None when the job should (or had to) run in-process, so
+    callers keep their existing code path as the fallback.
+    """
+
+    # Measured with benchmarks/telemetry_bench.py on cisco_ios route tables: the pool only
+    # pays for itself as GIL relief on outputs far larger than a 100k-route table (~5 MiB)
+    DEFAULT_SIZE_THRESHOLD = 16 * 1024 * 1024
+
+    def __init__(self, max_workers: Optional[int] = None, size_threshold: int = DEFAULT_SIZE_THRESHOLD,
+                 row_threshold: Optional[int] = None, enabled: bool = True):
+        """
+        Initialize the pool (worker processes start on first use)
+
+        Args:
+            max_workers: Worker process count (defaults to cpu_count - 1)
+            size_threshold: Minimum output size in characters to parse out of process
+            row_threshold: Minimum parsed row count to normalize out of process
+                           (None keeps route normalization in-process)
+            enabled: Master switch for the process backend
+        """
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.size_threshold = size_threshold
+        self.row_threshold = row_threshold
+        self.enabled = enabled
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._warm_templates: Dict[str, str] = {}
+        self.jobs_offloaded = 0
+        self.jobs_failed = 0
+
+    def should_offload(self, data) -> bool:
+        """Check if an output is large enough to parse in a worker process"""
+        return self.enabled and not _IN_WORKER and isinstance(data, str) and len(data) >= self.size_threshold
+
+    def should_offload_rows(self, parsed_data) -> bool:
+        """Check if a parsed table is large enough to normalize in worker processes"""
+        return (self.enabled and not _IN_WORKER and self.row_threshold is not None
+                and parsed_data is not None and len(parsed_data) >= self.row_threshold)
+
+    def add_warm_template(self, template_name: str, template_content: str):
+        """Register a template to be pre-compiled by worker processes started from now on"""
+        with self._lock:
+            self._warm_templates[template_name] = template_content
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker processes on first use"""
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process with live Qt and SSH threads is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(dict(self._warm_templates),)
+                )
+                print(f" Parse process pool started ({self.max_workers} workers)")
+            return self._executor
+
+    def _run(self, fn, *args):
+        """Run a job on the pool, resetting the pool if a worker died"""
+        try:
+            result = self._get_executor().submit(fn, *args).result()
+            self.jobs_offloaded += 1
+            return result
+        except BrokenProcessPool as e:
+            print(f" Parse process pool broken, falling back to in-process parsing: {e}")
+            self.jobs_failed += 1
+            self.shutdown(wait=False)
+            return None
+
+    def parse(self, template_name: str, template_content: str, data: str) -> Optional[Tuple[List[str], List[tuple]]]:
+        """
+        Parse an output in a worker process
+
+        Returns:
+            (header, row tuples), or None if the pool is unavailable
+
+        Raises:
+            Exception: Template or parse errors raised in the worker
+        """
+        self.add_warm_template(template_name, template_content)
+        return self._run(_parse_rows, template_name, template_content, data)
+
+    def normalize_routes(self, normalizer, parsed_data: List[Dict], platform: str,
+                         chunk_rows: int = 20000) -> Optional[List[tuple]]:
+        """
+        Normalize a large route table across the worker processes
+
+        Args:
+            normalizer: Picklable ConfigDrivenFieldNormalizer
+            parsed_data: Parsed route entries
+            platform: Platform name
+            chunk_rows: Rows per job; bounded chunks keep each pickle (which holds the GIL) short
+
+        Returns:
+            NormalizedRouteData field tuples in input order, or None if the pool is unavailable
+        """
+        header, rows = entries_to_rows(parsed_data)
+
+        try:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(_normalize_route_rows, normalizer, platform, header, rows[i:i + chunk_rows])
+                for i in range(0, len(rows), chunk_rows)
+            ]
+            normalized = []
+            for future in futures:
+                normalized.extend(future.result())
+            self.jobs_offloaded += len(futures)
+            return normalized
+
+        except BrokenProcessPool as e:
+            print(f" Parse process pool broken, normalizing in-process: {e}")
+            self.jobs_failed += 1
+            self.shutdown(wait=False)
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get process pool statistics"""
+        return {
+            'enabled': self.enabled,
+            'running': self._executor is not None,
+            'max_workers': self.max_workers,
+            'size_threshold': self.size_threshold,
+            'row_threshold': self.row_threshold,
+            'warm_templates': list(self._warm_templates.keys()),
+            'jobs_offloaded': self.jobs_offloaded,
+            'jobs_failed': self.jobs_failed
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes (they are restarted on next use)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global instance
+process_parse_pool = ProcessParsePool()
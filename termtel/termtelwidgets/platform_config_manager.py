@@ -4,6 +4,7 @@ Updated Platform Config Manager to use package resources
 
 import json
 import os
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -20,6 +21,15 @@ class NetmikoConfig:
     auth_timeout: int = 10
 
 
+@dataclass
+class StructuredCommand:
+    """JSON variant of a command, mapped to template column names (see structured_output)"""
+    command: str
+    records: str
+    fields: Dict[str, str]
+    format: str = "json"
+
+
 @dataclass
 class CommandDefinition:
     command: str
@@ -28,6 +38,7 @@ class CommandDefinition:
     description: str = ""
     parameters: List[str] = None
     fallback_commands: List[str] = None
+    structured: Optional[StructuredCommand] = None
 
 
 @dataclass
@@ -57,11 +68,29 @@ class PlatformDefinition:
     capabilities: PlatformCapabilities
 
 
+@dataclass
+class ResolvedCommand:
+    """A platform command with what every collection cycle needs worked out once"""
+    command_type: str
+    definition: CommandDefinition
+    template_platform: str
+    template_file: str
+    template_command: str  # parser key: template name without platform prefix and extension
+    template_available: bool
+    timeout: int
+    formatted_command: str  # format_command() result without parameters
+
+
 class PlatformConfigManager:
     """
     UPDATED: Platform configuration manager that uses package resources
+    Command lookups go through a per-platform table of ResolvedCommand entries, built on
+    first use and rebuilt when platforms.json changes on disk or reload() is called.
     """
 
+    # Seconds between checks of the config file's modification time
+    CONFIG_CHECK_INTERVAL = 2.0
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize platform config manager
@@ -71,18 +100,53 @@ class PlatformConfigManager:
         """
         self.platforms: Dict[str, PlatformDefinition] = {}
         self.config_path = config_path
+
+        # platform -> command type -> ResolvedCommand
+        self._command_tables: Dict[str, Dict[str, ResolvedCommand]] = {}
+        self.config_file: Optional[str] = None
+        self._config_mtime: Optional[float] = None
+        self._last_config_check = 0.0
+        self.generation = 0  # bumped on every (re)load, for caches derived from the config
+
         self._load_platforms_config()
 
     def _load_platforms_config(self):
         """Load platform configurations from package resources or file system"""
+        config_content, config_source, config_file = self._read_platforms_config()
+
+        # Parse the configuration
+        if config_content:
+            try:
+                config_data = json.loads(config_content)
+                self.platforms = self._parse_config(config_data)
+                print(f" Successfully parsed {len(self.platforms)} platform configurations")
+                print(f" Config source: {config_source}")
+            except json.JSONDecodeError as e:
+                print(f" Error parsing platforms config JSON: {e}")
+                self._load_fallback_config()
+        else:
+            print(f" Could not find platforms.json config file")
+            self._load_fallback_config()
+
+        self._config_loaded(config_file)
+
+    def _read_platforms_config(self) -> tuple[Optional[str], str, Optional[str]]:
+        """
+        Read platforms.json from package resources or file system
+
+        Returns:
+            Tuple of (content or None, source description, file path or None)
+        """
         config_content = None
         config_source = "unknown"
+        config_file = None
 
         try:
             # Method 1: Try package resources first (for installed packages)
             config_content = resource_manager.get_platforms_config()
             if config_content:
                 config_source = "package_resources"
+                config_file = resource_manager.get_config_path('platforms.json')
                 print(f" Loaded platforms config from package resources")
 
         except Exception as e:
@@ -105,34 +169,78 @@ class PlatformConfigManager:
                 os.path.join(os.path.dirname(__file__), '..', 'config', 'platforms.json'),
             ])
 
-            for config_file in config_file_paths:
+            for candidate in config_file_paths:
                 try:
-                    if os.path.exists(config_file):
-                        with open(config_file, 'r', encoding='utf-8') as f:
+                    if os.path.exists(candidate):
+                        with open(candidate, 'r', encoding='utf-8') as f:
                             config_content = f.read()
-                        config_source = f"file_system: {config_file}"
-                        print(f" Loaded platforms config from {config_file}")
+                        config_source = f"file_system: {candidate}"
+                        config_file = candidate
+                        print(f" Loaded platforms config from {candidate}")
                         break
                 except Exception as e:
-                    print(f" Could not load from {config_file}: {e}")
+                    print(f" Could not load from {candidate}: {e}")
                     continue
 
-        # Parse the configuration
-        if config_content:
-            try:
-                config_data = json.loads(config_content)
-                self._parse_config(config_data)
-                print(f" Successfully parsed {len(self.platforms)} platform configurations")
-                print(f" Config source: {config_source}")
-            except json.JSONDecodeError as e:
-                print(f" Error parsing platforms config JSON: {e}")
-                self._load_fallback_config()
-        else:
-            print(f" Could not find platforms.json config file")
-            self._load_fallback_config()
+        return config_content, config_source, config_file
+
+    def reload(self) -> bool:
+        """
+        Re-read platforms.json and rebuild the command tables
+
+        Returns:
+            True if the new configuration was loaded (on errors the current one is kept)
+        """
+        config_content, config_source, config_file = self._read_platforms_config()
+        if not config_content:
+            print(f" Could not find platforms.json config file, keeping current configuration")
+            return False
+
+        try:
+            platforms = self._parse_config(json.loads(config_content))
+        except json.JSONDecodeError as e:
+            print(f" Error parsing platforms config JSON, keeping current configuration: {e}")
+            return False
+        if not platforms:
+            print(f" No platforms in {config_source}, keeping current configuration")
+            return False
+
+        self.platforms = platforms
+        self._config_loaded(config_file)
+        print(f" Reloaded {len(self.platforms)} platform configurations from {config_source}")
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """Reload if the config file's modification time changed, returns True if reloaded"""
+        self._last_config_check = time.monotonic()
+        if self._stat_config() == self._config_mtime:
+            return False
+        print(f" {self.config_file} changed on disk")
+        if self.reload():
+            return True
+        # Leave it until the file changes again (e.g. a half-written save)
+        self._config_mtime = self._stat_config()
+        return False
+
+    def _config_loaded(self, config_file: Optional[str]):
+        """New configuration in place: drop derived tables and note the file's mtime"""
+        self.config_file = config_file
+        self._config_mtime = self._stat_config()
+        self._last_config_check = time.monotonic()
+        self._command_tables = {}
+        self.generation += 1
+
+    def _stat_config(self) -> Optional[float]:
+        if not self.config_file:
+            return None
+        try:
+            return os.path.getmtime(self.config_file)
+        except OSError:
+            return None
 
-    def _parse_config(self, config_data: Dict[str, Any]):
-        """Parse the JSON configuration data"""
+    def _parse_config(self, config_data: Dict[str, Any]) -> Dict[str, PlatformDefinition]:
+        """Parse the JSON configuration data, returns the platform definitions by name"""
+        platforms = {}
         platforms_data = config_data.get('platforms', {})
 
         for platform_name, platform_data in platforms_data.items():
@@ -163,7 +271,8 @@ class PlatformConfigManager:
                         timeout=cmd_data.get('timeout', 30),
                         description=cmd_data.get('description', ''),
                         parameters=cmd_data.get('parameters', []),
-                        fallback_commands=cmd_data.get('fallback_commands', [])
+                        fallback_commands=cmd_data.get('fallback_commands', []),
+                        structured=self._parse_structured(platform_name, cmd_name, cmd_data.get('structured'))
                     )
 
                 # Parse capabilities
@@ -188,12 +297,36 @@ class PlatformConfigManager:
                     capabilities=capabilities
                 )
 
-                self.platforms[platform_name] = platform_def
+                platforms[platform_name] = platform_def
 
             except Exception as e:
                 print(f" Error parsing platform {platform_name}: {e}")
                 continue
 
+        return platforms
+
+    @staticmethod
+    def _parse_structured(platform_name: str, cmd_name: str,
+                          structured_data: Optional[Dict[str, Any]]) -> Optional[StructuredCommand]:
+        """Parse a command's 'structured' variant, None if absent or unusable"""
+        if not structured_data:
+            return None
+
+        structured_format = structured_data.get('format', 'json')
+        if structured_format != 'json':
+            print(f" Unsupported structured format '{structured_format}' for {platform_name} {cmd_name}")
+            return None
+        if not structured_data.get('command') or not structured_data.get('fields'):
+            print(f" Structured variant for {platform_name} {cmd_name} needs a command and fields")
+            return None
+
+        return StructuredCommand(
+            command=structured_data['command'],
+            records=structured_data.get('records', ''),
+            fields=dict(structured_data['fields']),
+            format=structured_format
+        )
+
     def _load_fallback_config(self):
         """Load minimal fallback configuration if main config fails"""
         print(" Loading fallback platform configuration...")
@@ -267,26 +400,103 @@ class PlatformConfigManager:
         """Get platform definition by name"""
         return self.platforms.get(platform_name)
 
-    def format_command(self, platform: str, command_type: str, **kwargs) -> str:
-        """Format a command with parameters using package-aware templates"""
-        platform_def = self.get_platform(platform)
-        if not platform_def:
-            return f"# Platform '{platform}' not found"
+    def get_command(self, platform: str, command_type: str) -> Optional[ResolvedCommand]:
+        """
+        Get a command's resolved entry (template, parser key, timeout, formatted command)
 
-        if command_type not in platform_def.commands:
-            return f"# Command '{command_type}' not supported on {platform}"
+        Returns:
+            ResolvedCommand or None if the platform or command is not configured
+        """
+        if time.monotonic() - self._last_config_check >= self.CONFIG_CHECK_INTERVAL:
+            self.reload_if_changed()
+
+        table = self._command_tables.get(platform)
+        if table is None:
+            platform_def = self.get_platform(platform)
+            if not platform_def:
+                return None
+            table = self._command_tables[platform] = self._build_command_table(platform_def)
+        return table.get(command_type)
+
+    def _build_command_table(self, platform_def: PlatformDefinition) -> Dict[str, ResolvedCommand]:
+        """Resolve every command of a platform once"""
+        table = {}
+        for command_type, command_def in platform_def.commands.items():
+            template_file = command_def.template
+            template_platform, template_command = self._split_template_name(
+                template_file, platform_def.templates.platform)
+            table[command_type] = ResolvedCommand(
+                command_type=command_type,
+                definition=command_def,
+                template_platform=template_platform,
+                template_file=template_file,
+                template_command=template_command,
+                template_available=bool(template_file and resource_manager.get_template_path(template_file)),
+                timeout=command_def.timeout,
+                formatted_command=self._format(command_def.command, {})
+            )
+        return table
+
+    def _split_template_name(self, template_file: str, template_platform: str) -> tuple[str, str]:
+        """
+        Split a template file name into the parser's (platform, command) key
+
+        A command may use another platform's template (AOS-S reads LLDP with
+        hp_procurve_show_lldp_info_remote-device); the key then uses that platform's
+        prefix, so the parser finds the file under its own name.
+        """
+        name = (template_file or '').replace('.textfsm', '')
+        if name.startswith(f'{template_platform}_'):
+            return template_platform, name[len(template_platform) + 1:]
+
+        prefixes = sorted({p.templates.platform for p in self.platforms.values()}, key=len, reverse=True)
+        for prefix in prefixes:
+            if name.startswith(f'{prefix}_'):
+                return prefix, name[len(prefix) + 1:]
 
-        command_def = platform_def.commands[command_type]
+        head, _, rest = name.partition('_')
+        return (head, rest) if rest else (template_platform, name)
 
+    @staticmethod
+    def _format(command: str, kwargs: Dict[str, Any]) -> str:
         try:
             # Format command with parameters
-            formatted_command = command_def.command.format(**kwargs)
-            return formatted_command
+            return command.format(**kwargs)
         except KeyError as e:
             return f"# Missing parameter for command: {e}"
         except Exception as e:
             return f"# Error formatting command: {e}"
 
+    def format_command(self, platform: str, command_type: str, **kwargs) -> str:
+        """Format a command with parameters using package-aware templates"""
+        entry = self.get_command(platform, command_type)
+        if entry is None:
+            if not self.get_platform(platform):
+                return f"# Platform '{platform}' not found"
+            return f"# Command '{command_type}' not supported on {platform}"
+
+        if not kwargs:
+            return entry.formatted_command
+        return self._format(entry.definition.command, kwargs)
+
+    def get_structured_command(self, platform: str, command_type: str, **kwargs) -> Optional[tuple[str, StructuredCommand]]:
+        """
+        Get the structured (JSON) variant of a command
+
+        Returns:
+            Tuple of (formatted command, StructuredCommand) or None if the command has no variant
+        """
+        entry = self.get_command(platform, command_type)
+        structured = entry.definition.structured if entry else None
+        if structured is None:
+            return None
+
+        try:
+            return structured.command.format(**kwargs), structured
+        except (KeyError, IndexError) as e:
+            print(f" Missing parameter for structured command: {e}")
+            return None
+
     def get_template_info(self, platform: str, command_type: str) -> Optional[tuple[str, str]]:
         """
         Get template information using package resources
@@ -294,21 +504,34 @@ class PlatformConfigManager:
         Returns:
             Tuple of (template_platform, template_filename) or None
         """
-        platform_def = self.get_platform(platform)
-        if not platform_def or command_type not in platform_def.commands:
-            return None
+        entry = self.get_template_entry(platform, command_type)
+        return (entry.template_platform, entry.template_file) if entry else None
 
-        command_def = platform_def.commands[command_type]
-        template_platform = platform_def.templates.platform
-        template_file = command_def.template
+    def get_parser_key(self, platform: str, command_type: str) -> Optional[tuple[str, str]]:
+        """
+        Get the template parser arguments for a command
 
-        # Verify template exists using resource manager
-        if resource_manager.get_template_path(template_file):
-            return (template_platform, template_file)
-        else:
-            print(f" Template not found: {template_file}")
+        Returns:
+            Tuple of (template_platform, template_command) for LocalTemplateParser.parse, or None
+        """
+        entry = self.get_template_entry(platform, command_type)
+        return (entry.template_platform, entry.template_command) if entry else None
+
+    def get_template_entry(self, platform: str, command_type: str) -> Optional[ResolvedCommand]:
+        """Get a command's resolved entry if its template exists"""
+        entry = self.get_command(platform, command_type)
+        if entry is None:
             return None
 
+        # Missing templates are looked up again, they may have been added since
+        if not entry.template_available:
+            entry.template_available = bool(entry.template_file and
+                                            resource_manager.get_template_path(entry.template_file))
+            if not entry.template_available:
+                print(f" Template not found: {entry.template_file}")
+                return None
+        return entry
+
     def get_netmiko_config(self, platform: str) -> Optional[NetmikoConfig]:
         """Get netmiko configuration for platform"""
         platform_def = self.get_platform(platform)
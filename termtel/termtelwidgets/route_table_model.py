@@ -0,0 +1,383 @@
+"""
+Model/view route table
+Routes are held column-wise in plain Python lists and served to a QTableView on
+demand, so only the visible cells are ever materialized - no QTableWidgetItem
+per cell. A proxy model does protocol/VRF filtering; sorting is done on the
+columns directly in the source model.
+"""
+
+import bisect
+import socket
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Optional, Any, Hashable
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QTableView, QHeaderView
+
+from termtel.termtelwidgets.telemetry_delta import keyed_records, route_key
+
+# (field, header) for each visible column
+ROUTE_COLUMNS = [
+    ('network', "Network"),
+    ('mask', "Mask"),
+    ('next_hop', "Next Hop"),
+    ('interface', "Interface"),
+    ('protocol', "Protocol"),
+    ('metric', "Metric"),
+    ('admin_distance', "Admin Dist"),
+    ('age', "Age"),
+]
+PROTOCOL_COLUMN = 4
+NUMERIC_COLUMNS = {5, 6}
+
+# Extra column held in the store but not displayed
+_VRF_COLUMN = len(ROUTE_COLUMNS)
+_FIELDS = [name for name, _ in ROUTE_COLUMNS] + ['vrf']
+_get_fields = attrgetter(*_FIELDS)
+_FIELD_GETTERS = [attrgetter(name) for name in _FIELDS]
+
+# Color-code by protocol - same as template editor
+PROTOCOL_COLORS = {
+    # Static routes
+    'Static': '#ffff00',
+    'Static Default': '#ffff00',
+
+    # Connected/Local
+    'Connected': '#00ff00',
+    'Local': '#00ff88',
+
+    # OSPF variants
+    'OSPF': '#ff8800',
+    'OSPF Inter-Area': '#ff8800',
+    'OSPF External': '#ff8800',
+    'OSPF NSSA': '#ff8800',
+
+    # BGP variants
+    'BGP': '#ff0088',
+    'BGP Internal': '#ff0088',
+    'BGP External': '#ff0088',
+    'B E': '#ff0088',
+
+    # Other protocols
+    'EIGRP': '#8800ff',
+    'RIP': '#0088ff',
+    'ISIS': '#00ffff',
+    'ISIS Level-1': '#00ffff',
+    'ISIS Level-2': '#00ffff',
+    'Kernel': '#888888',
+    'Mobile': '#ff8888',
+    'IGRP': '#8888ff',
+    'NAT': '#ff88ff'
+}
+
+
+def _network_sort_key(value: str):
+    """Sort prefixes by address ('10.0.0.0/8' < '9.0.0.0/8' as strings), IPv4 before IPv6"""
+    value = str(value)
+    address, _, length = value.partition('/')
+    length = int(length) if length.isdigit() else 0
+    try:
+        return 0, socket.inet_aton(address), length, value
+    except OSError:
+        pass
+    try:
+        return 1, socket.inet_pton(socket.AF_INET6, address), length, value
+    except (OSError, ValueError):
+        return 2, b'', length, value
+
+
+def _numeric_sort_key(value: str):
+    value = str(value)
+    return (0, int(value), value) if value.isdigit() else (1, 0, value)
+
+
+class RouteTableModel(QAbstractTableModel):
+    """
+    Table model over a columnar store of normalized routes
+
+    Each route is one index into per-field lists of strings plus a delta key, so a
+    100k route table costs a few lists rather than 800k Qt items, and the view
+    only asks for the rows on screen.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns: List[List[str]] = [[] for _ in _FIELDS]
+        self._keys: List[Hashable] = []
+        self._row_of: Dict[Hashable, int] = {}
+        self._colors = {name: QColor(color) for name, color in PROTOCOL_COLORS.items()}
+        self._default_color = QColor('#ffffff')
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    # ===== QAbstractTableModel interface =====
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(ROUTE_COLUMNS)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == PROTOCOL_COLUMN:
+            return self._colors.get(self._columns[PROTOCOL_COLUMN][index.row()], self._default_color)
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ROUTE_COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        """Sort the store in place (Python list sort, no per-comparison model calls)"""
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0 or not self._keys:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        old_keys = [self._keys[index.row()] for index in old_persistent]
+
+        sort_key = self._sort_key_function(column)
+        values = self._columns[column]
+        permutation = sorted(range(len(values)), key=lambda row: sort_key(values[row]),
+                             reverse=order == Qt.SortOrder.DescendingOrder)
+        reorder = itemgetter(*permutation)
+        if len(permutation) == 1:
+            reorder = lambda col: (col[0],)
+        self._columns = [list(reorder(col)) for col in self._columns]
+        self._keys = list(reorder(self._keys))
+        self._rebuild_row_index()
+
+        self.changePersistentIndexList(old_persistent, [
+            self.index(self._row_of[key], index.column()) for key, index in zip(old_keys, old_persistent)
+        ])
+        self.layoutChanged.emit()
+
+    # ===== Loading =====
+
+    def set_routes(self, routes: List[Any], keys: Optional[List[Hashable]] = None):
+        """
+        Replace the table contents
+
+        Args:
+            routes: NormalizedRouteData records (or dicts with the same field names)
+            keys: Delta keys aligned with routes (computed when not given)
+        """
+        if keys is None:
+            keys = [key for key, _ in keyed_records(routes, _record_key)]
+
+        self.beginResetModel()
+        if routes and isinstance(routes[0], dict):
+            self._columns = [list(column) for column in zip(*map(_route_values, routes))]
+        else:
+            # One C-level pass per field
+            self._columns = [list(map(getter, routes)) for getter in _FIELD_GETTERS]
+        if not routes:
+            self._columns = [[] for _ in _FIELDS]
+        self._keys = list(keys)
+        self._rebuild_row_index()
+        self.endResetModel()
+
+        if self._sort_column >= 0:
+            self.sort(self._sort_column, self._sort_order)
+
+    def apply_delta(self, delta):
+        """
+        Patch the table from a TableDelta: changed rows are updated in place,
+        removed rows dropped, added rows inserted (at their sorted position if sorted)
+        """
+        resort = False
+        for key, route in delta.changed:
+            row = self._row_of.get(key)
+            if row is None:
+                continue
+            old_sort_value = self._columns[self._sort_column][row] if self._sort_column >= 0 else None
+            for column, value in zip(self._columns, _route_values(route)):
+                column[row] = value
+            if self._sort_column >= 0 and self._columns[self._sort_column][row] != old_sort_value:
+                resort = True
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(ROUTE_COLUMNS) - 1))
+
+        removed_rows = sorted((self._row_of[key] for key, _ in delta.removed if key in self._row_of), reverse=True)
+        for row in removed_rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            for column in self._columns:
+                del column[row]
+            del self._keys[row]
+            self.endRemoveRows()
+        if removed_rows:
+            self._rebuild_row_index()
+
+        for key, route in delta.added:
+            row = self._insert_position(route)
+            self.beginInsertRows(QModelIndex(), row, row)
+            for column, value in zip(self._columns, _route_values(route)):
+                column.insert(row, value)
+            self._keys.insert(row, key)
+            self.endInsertRows()
+        if delta.added:
+            self._rebuild_row_index()
+
+        if resort:
+            self.sort(self._sort_column, self._sort_order)
+
+    def append_routes(self, routes: List[Any]):
+        """
+        Add routes at the end of the table (streamed batches of a first collection;
+        the complete table replaces them through set_routes)
+        """
+        if not routes:
+            return
+        start = len(self._keys)
+        self.beginInsertRows(QModelIndex(), start, start + len(routes) - 1)
+        for column, values in zip(self._columns, zip(*map(_route_values, routes))):
+            column.extend(values)
+        self._keys.extend(key for key, _ in keyed_records(routes, _record_key))
+        self.endInsertRows()
+        self._row_of.update(zip(self._keys[start:], range(start, len(self._keys))))
+
+        if self._sort_column >= 0:
+            self.sort(self._sort_column, self._sort_order)
+
+    def clear(self):
+        """Remove every route"""
+        self.set_routes([], [])
+
+    # ===== Access =====
+
+    def row_values(self, row: int) -> List[str]:
+        """Displayed values of a row, in column order"""
+        return [self._columns[column][row] for column in range(len(ROUTE_COLUMNS))]
+
+    def protocol(self, row: int) -> str:
+        return self._columns[PROTOCOL_COLUMN][row]
+
+    def vrf(self, row: int) -> str:
+        return self._columns[_VRF_COLUMN][row]
+
+    def protocols(self) -> set:
+        """Distinct non-empty protocols in the table"""
+        return {p for p in set(self._columns[PROTOCOL_COLUMN]) if p and p.strip()}
+
+    def vrfs(self) -> set:
+        """Distinct VRFs in the table"""
+        return set(self._columns[_VRF_COLUMN])
+
+    # ===== Internals =====
+
+    def _rebuild_row_index(self):
+        self._row_of = dict(zip(self._keys, range(len(self._keys))))
+
+    def _sort_key_function(self, column: int):
+        if column == 0:
+            return _network_sort_key
+        if column in NUMERIC_COLUMNS:
+            return _numeric_sort_key
+        return str
+
+    def _insert_position(self, route) -> int:
+        """Row for a new route: end of table, or its sorted position when sorted"""
+        if self._sort_column < 0:
+            return len(self._keys)
+
+        sort_key = self._sort_key_function(self._sort_column)
+        value = sort_key(_route_values(route)[self._sort_column])
+        values = self._columns[self._sort_column]
+        if self._sort_order == Qt.SortOrder.DescendingOrder:
+            return self._descending_position(values, value, sort_key)
+        return bisect.bisect_right(values, value, key=sort_key)
+
+    @staticmethod
+    def _descending_position(values: List[str], value, sort_key) -> int:
+        """bisect for a list sorted in descending order"""
+        lo, hi = 0, len(values)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if sort_key(values[mid]) >= value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+def _route_values(route) -> tuple:
+    """Column values of a NormalizedRouteData (string fields) or raw route dict"""
+    if isinstance(route, dict):
+        return tuple(str(route.get(name) or '') for name in _FIELDS)
+    return _get_fields(route)
+
+
+def _record_key(route):
+    """route_key() for records or dicts"""
+    if isinstance(route, dict):
+        return route.get('network', ''), route.get('vrf', 'default')
+    return route_key(route)
+
+
+class RouteFilterProxyModel(QSortFilterProxyModel):
+    """
+    Protocol/VRF filter over a RouteTableModel
+
+    Sorting is forwarded to the source model, which sorts its columns directly
+    instead of calling back into Python for every comparison.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._protocol: Optional[str] = None
+        self._vrf: Optional[str] = None
+
+    def set_protocol_filter(self, protocol: Optional[str]):
+        """Show only routes of a protocol (None or 'All Protocols' shows all)"""
+        protocol = None if protocol in (None, "", "All Protocols") else protocol
+        if protocol != self._protocol:
+            self._protocol = protocol
+            self.invalidateFilter()
+
+    def set_vrf_filter(self, vrf: Optional[str]):
+        """Show only routes of a VRF (None shows all)"""
+        if vrf != self._vrf:
+            self._vrf = vrf
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._protocol is None and self._vrf is None:
+            return True
+        model = self.sourceModel()
+        if self._protocol is not None and model.protocol(source_row) != self._protocol:
+            return False
+        if self._vrf is not None and model.vrf(source_row) != self._vrf:
+            return False
+        return True
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def row_values(self, row: int) -> List[str]:
+        """Displayed values of a proxy row"""
+        return self.sourceModel().row_values(self.mapToSource(self.index(row, 0)).row())
+
+
+def create_route_table_view(model, parent=None) -> QTableView:
+    """
+    QTableView set up for large route tables
+
+    Rows have a fixed height and column auto-sizing samples a limited number of
+    rows, so nothing has to walk the whole table.
+    """
+    view = QTableView(parent)
+    view.setModel(model)
+    view.setSortingEnabled(True)
+    view.sortByColumn(-1, Qt.SortOrder.AscendingOrder)
+    view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+    view.setWordWrap(False)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    view.verticalHeader().setDefaultSectionSize(view.fontMetrics().height() + 6)
+    view.horizontalHeader().setResizeContentsPrecision(200)
+    view.horizontalHeader().setStretchLastSection(True)
+    return view
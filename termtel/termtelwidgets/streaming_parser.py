@@ -0,0 +1,207 @@
+"""
+Streaming command output parsing
+Output is read from the channel as it arrives and fed, whole lines at a time, to the
+TextFSM state machine, so rows are available while the command is still running and
+the full output never has to be assembled into one string.
+"""
+
+import re
+import select
+import time
+from typing import Callable, List
+
+# Output kept for raw views of a streamed command (characters); the rest is only parsed
+RAW_OUTPUT_LIMIT = 1024 * 1024
+
+# Seconds to wait for the prompt of a timed-out command before giving up on its output
+DRAIN_TIMEOUT = 5.0
+
+
+class StreamingTemplateParser:
+    """
+    Incremental TextFSM parse of one command output
+
+    feed() takes text in any chunking and returns the rows it completed; finish()
+    parses the last line, applies the implicit EOF record and returns the rest.
+    """
+
+    def __init__(self, fsm):
+        """
+        Args:
+            fsm: Fresh TextFSM instance (e.g. from compiled_template_cache.get_fsm)
+        """
+        self.fsm = fsm
+        self.header = tuple(fsm.header)
+        self.finished = False
+        self._partial = ''
+        self._result = fsm.ParseText('', eof=False)  # the FSM's row list, grows as we feed
+        self._emitted = 0
+
+        # Fillup values write into earlier rows, so those rows are only final at EOF
+        self.holds_rows = any('Fillup' in value.OptionNames() for value in fsm.values)
+
+    @property
+    def rows_parsed(self) -> int:
+        return len(self._result)
+
+    def feed(self, text: str) -> List[list]:
+        """
+        Parse the complete lines in text (a trailing partial line waits for the next feed)
+
+        Returns:
+            Rows completed by this text
+
+        Raises:
+            textfsm.TextFSMError: The template rejected the output
+        """
+        if self.finished or not text:
+            return []
+        text = self._partial + text
+        cut = text.rfind('\n')
+        if cut < 0:
+            self._partial = text
+            return []
+        self._partial = text[cut + 1:]
+
+        self.fsm.ParseText(text[:cut], eof=False)
+        # TextFSM has no public accessor for this; ParseText checks it the same way
+        if self.fsm._cur_state_name in ('End', 'EOF'):
+            self.finished = True
+        return self._take(final=False)
+
+    def finish(self) -> List[list]:
+        """Parse the last line and apply EOF, returns the remaining rows"""
+        if not self.finished:
+            self.fsm.ParseText(self._partial, eof=True)
+            self._partial = ''
+            self.finished = True
+        return self._take(final=True)
+
+    def _take(self, final: bool) -> List[list]:
+        if self.holds_rows and not final:
+            return []
+        rows = self._result[self._emitted:]
+        self._emitted = len(self._result)
+        return rows
+
+
+def _wait_readable(channel, timeout: float):
+    """Block until the channel has data or timeout passes"""
+    try:
+        select.select([channel], [], [], timeout)
+    except (TypeError, ValueError, OSError):
+        time.sleep(min(timeout, 0.025))  # telnet/serial connections: poll like netmiko
+
+
+def _strip_echo(text: str, command: str):
+    """
+    Remove the echoed command from the start of the output, as netmiko's strip_command does
+
+    The echo may be wrapped over several lines (or redrawn with backspaces) for long
+    commands, and some devices do not echo at all.
+
+    Returns:
+        (decided, text): decided is False while text could still be the start of the
+        echo, then the text after the echo (or all of it when there is no echo)
+    """
+    cmd = command.strip()
+    matched = 0
+    for position, char in enumerate(text):
+        if matched == len(cmd):
+            end = text.find('\n', position)
+            if end < 0:
+                return False, text  # rest of the echo line not received yet
+            return True, text[end + 1:]
+        if char == cmd[matched]:
+            matched += 1
+        elif char == '\x08':
+            matched = max(0, matched - 1)  # cursor back over the echo, redrawn next
+        elif char not in '\r\n':
+            return True, text  # not the echo: output starts right away
+    return False, text
+
+
+def _drain(connection, channel, prompt_pattern, timeout: float = DRAIN_TIMEOUT):
+    """Read and discard the rest of a timed-out command's output, up to its prompt"""
+    tail = ''
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = connection.read_channel()
+        if not data:
+            _wait_readable(channel, 0.05)
+            continue
+        tail = (tail + data)[-4096:]
+        if prompt_pattern.search(tail.rsplit('\n', 1)[-1]):
+            return
+
+
+def stream_command(connection, command: str, on_text: Callable[[str], None],
+                   read_timeout: float = 30, raw_limit: int = RAW_OUTPUT_LIMIT) -> str:
+    """
+    Run a command on a netmiko connection, handing its output to on_text as it arrives
+
+    Args:
+        connection: Connected netmiko connection (paging already disabled)
+        command: Command to send
+        on_text: Called with each run of complete, '\\n'-terminated output lines
+                 (command echo and the trailing prompt are not included)
+        read_timeout: Seconds without any new output before giving up
+        raw_limit: Characters of output to keep and return, for raw views
+
+    Returns:
+        The output, cut off after raw_limit characters
+
+    Raises:
+        TimeoutError: No output and no prompt for read_timeout seconds (what is left
+                      of the output is read up to the prompt first, so the next
+                      command on the connection does not receive it)
+    """
+    prompt_pattern = re.compile(re.escape(connection.find_prompt().strip()))
+    channel = getattr(connection, 'remote_conn', None)
+    connection.write_channel(connection.normalize_cmd(command))
+
+    kept = []
+    kept_size = 0
+    dropped = 0
+    partial = ''
+    echo_stripped = False
+    last_data = time.monotonic()
+
+    while True:
+        data = connection.read_channel()
+        if not data:
+            if time.monotonic() - last_data > read_timeout:
+                _drain(connection, channel, prompt_pattern)
+                raise TimeoutError(f"No prompt after '{command}' ({read_timeout}s without output)")
+            _wait_readable(channel, 0.05)
+            continue
+        last_data = time.monotonic()
+
+        text = (partial + data).replace('\r\n', '\n')
+        if not echo_stripped:
+            echo_stripped, text = _strip_echo(text, command)
+            if not echo_stripped:
+                partial = text
+                continue
+
+        cut = text.rfind('\n')
+        if cut < 0:
+            partial = text
+        else:
+            complete, partial = text[:cut + 1], text[cut + 1:]
+            if complete:
+                keep = complete[:max(0, raw_limit - kept_size)]
+                if keep:
+                    kept.append(keep)
+                    kept_size += len(keep)
+                dropped += len(complete) - len(keep)
+                on_text(complete)
+
+        # The prompt comes back on an unterminated line once the command is done
+        if prompt_pattern.search(partial):
+            break
+
+    output = ''.join(kept)
+    if dropped:
+        output += f"\n... [{dropped} more characters parsed but not kept]\n"
+    return output
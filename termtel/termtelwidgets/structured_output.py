@@ -0,0 +1,272 @@
+"""
+Structured (JSON) command output
+Platforms that can answer in JSON (Arista/NX-OS '| json', Junos '| display json',
+Linux 'ip -j') get a 'structured' command variant in platforms.json. Its field map
+turns the decoded document into a ParsedTable with the same column names the TextFSM
+template would produce, so the normalizers run unchanged.
+
+Path syntax (dot separated):
+    name        dict key
+    3           list index
+    *           every value of a dict / item of a list
+    name[]      the list under name (NX-OS gives a bare dict when there is one row)
+    $N          in a field path: key (or list index) matched by the Nth iterating
+                step of the records path; $N.path reads path from that item instead
+A field path with an iterating step yields a list value (multi-path next hops).
+"""
+
+import json
+from typing import Dict, Optional, Tuple
+
+from termtel.termtelwidgets.normalized_records import ParsedTable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+_KEY, _INDEX, _EACH, _AS_LIST = range(4)
+
+
+def _compile_path(path: str) -> Tuple[tuple, ...]:
+    """'vrfs.*.routes.*' -> ((_KEY, 'vrfs'), (_EACH, None), (_KEY, 'routes'), (_EACH, None))"""
+    steps = []
+    for segment in path.split('.') if path else ():
+        if segment == '*':
+            steps.append((_EACH, None))
+        elif segment.endswith('[]'):
+            steps.append((_AS_LIST, segment[:-2]))
+        elif segment.isdigit():
+            steps.append((_INDEX, int(segment)))
+        else:
+            steps.append((_KEY, segment))
+    return tuple(steps)
+
+
+def _key_step(key, next_step, bind):
+    def step(node, bindings, out):
+        if type(node) is dict:
+            value = node.get(key)
+            if value is not None:
+                next_step(value, bindings, out)
+    return step
+
+
+def _index_step(index, next_step, bind):
+    def step(node, bindings, out):
+        if type(node) is list and index < len(node):
+            next_step(node[index], bindings, out)
+    return step
+
+
+def _each_step(_, next_step, bind):
+    def step(node, bindings, out):
+        if type(node) is dict:
+            items = node.items()
+        elif type(node) is list:
+            items = enumerate(node)
+        else:
+            return
+        if bind:
+            for key, item in items:
+                next_step(item, bindings + ((key, item),), out)
+        else:
+            for _, item in items:
+                next_step(item, bindings, out)
+    return step
+
+
+def _as_list_step(key, next_step, bind):
+    each = _each_step(None, next_step, bind)
+
+    def step(node, bindings, out):
+        if type(node) is dict:
+            value = node.get(key)
+            each([value] if type(value) is dict else value, bindings, out)
+    return step
+
+
+_STEP_BUILDERS = {_KEY: _key_step, _INDEX: _index_step, _EACH: _each_step, _AS_LIST: _as_list_step}
+
+
+def _compile_walk(steps, sink, bind: bool):
+    """
+    Chain the steps into one function walk(node, bindings, out) that calls
+    sink(value, bindings, out) for every value the path reaches
+    (bind: record (key, item) in bindings at each iterating step)
+    """
+    walk = sink
+    for kind, arg in reversed(steps):
+        walk = _STEP_BUILDERS[kind](arg, walk, bind)
+    return walk
+
+
+def _record_sink(node, bindings, out):
+    out.append((node, bindings))
+
+
+def _text_sink(node, bindings, out):
+    out.append(_text(node))
+
+
+def _text(value) -> str:
+    if value is None:
+        return ''
+    if type(value) is str:
+        return value
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _compile_field(path: str):
+    """Getter (item, bindings) -> str, or list of str when the path iterates"""
+    binding = None
+    if path.startswith('$'):
+        head, _, path = path[1:].partition('.')
+        binding = int(head)
+        if not path:
+            return lambda item, bindings: _text(bindings[binding][0]) if binding < len(bindings) else ''
+
+    steps = _compile_path(path)
+
+    # Plain key: the common case, one dict lookup per row
+    if binding is None and len(steps) == 1 and steps[0][0] == _KEY:
+        key = steps[0][1]
+        return lambda item, bindings: _text(item.get(key)) if type(item) is dict else ''
+
+    if any(kind in (_EACH, _AS_LIST) for kind, _ in steps):
+        walk = _compile_walk(steps, _text_sink, bind=False)
+
+        def list_getter(item, bindings):
+            if binding is not None:
+                if binding >= len(bindings):
+                    return []
+                item = bindings[binding][1]
+            values = []
+            walk(item, (), values)
+            return values
+
+        return list_getter
+
+    def getter(item, bindings):
+        if binding is not None:
+            if binding >= len(bindings):
+                return ''
+            item = bindings[binding][1]
+        for kind, arg in steps:
+            if kind == _KEY:
+                item = item.get(arg) if type(item) is dict else None
+            else:
+                item = item[arg] if type(item) is list and arg < len(item) else None
+            if item is None:
+                return ''
+        return _text(item)
+
+    return getter
+
+
+class StructuredPlan:
+    """Compiled records path and field getters for one structured command"""
+
+    def __init__(self, records: str, fields: Dict[str, str]):
+        self.walk_records = _compile_walk(_compile_path(records), _record_sink, bind=True)
+        self.header = tuple(fields)
+        self.getters = tuple(_compile_field(path) for path in fields.values())
+
+    def extract(self, document) -> ParsedTable:
+        records = []
+        self.walk_records(document, (), records)
+        getters = self.getters
+        rows = [[getter(item, bindings) for getter in getters] for item, bindings in records]
+        return ParsedTable(self.header, rows)
+
+
+# (records path, field map items) -> StructuredPlan
+_plans: Dict[tuple, StructuredPlan] = {}
+
+
+def get_structured_plan(records: str, fields: Dict[str, str]) -> StructuredPlan:
+    """Compiled plan for a records path and field map (built once, then cached)"""
+    key = (records, tuple(fields.items()))
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _plans[key] = StructuredPlan(records, fields)
+    return plan
+
+
+def looks_structured(output: str) -> bool:
+    """True if the output starts like a JSON document (not an '% Invalid input' error)"""
+    start = output.lstrip()[:1]
+    return start in ('{', '[')
+
+
+def decode_json(output: str):
+    """Decode JSON output, skipping anything the device printed before the document"""
+    start = min((i for i in (output.find('{'), output.find('[')) if i >= 0), default=0)
+    if ORJSON_AVAILABLE:
+        return orjson.loads(output[start:] if start else output)
+    return json.loads(output[start:] if start else output)
+
+
+def parse_structured_output(output: str, structured) -> Optional[ParsedTable]:
+    """
+    Turn structured command output into template-style rows
+
+    Args:
+        output: Command output
+        structured: StructuredCommand (records path and field map)
+
+    Returns:
+        ParsedTable, or None if the output does not decode
+    """
+    plan = get_structured_plan(structured.records, structured.fields)
+    try:
+        return plan.extract(decode_json(output))
+    except ValueError as e:
+        print(f" Structured output did not decode: {e}")
+        return None
+
+
+class StructuredCommandSelector:
+    """
+    Per-connection choice between a command's structured variant and its text command
+    A variant whose output is not JSON (older software, '% Invalid input') is not tried
+    again; the text command and its template are used from then on.
+    """
+
+    def __init__(self, platform_config, enabled: bool = True):
+        """
+        Args:
+            platform_config: PlatformConfigManager
+            enabled: False always uses the text commands
+        """
+        self.platform_config = platform_config
+        self.enabled = enabled
+        self._unsupported = set()  # (platform, command_type)
+        self._variants: Dict[str, object] = {}  # structured command sent -> StructuredCommand
+
+    def command_for(self, platform: str, command_type: str, **kwargs) -> Optional[str]:
+        """Structured command to send for a command type, None to use the text command"""
+        if not self.enabled or (platform, command_type) in self._unsupported:
+            return None
+        variant = self.platform_config.get_structured_command(platform, command_type, **kwargs)
+        if variant is None:
+            return None
+        command, structured = variant
+        self._variants[command] = structured
+        return command
+
+    def accept(self, platform: str, command_type: str, output: str) -> bool:
+        """Check a structured command's output, False (and stop using the variant) if it is not JSON"""
+        if looks_structured(output):
+            return True
+        print(f" No structured output for {platform} {command_type}, using the text command")
+        self._unsupported.add((platform, command_type))
+        return False
+
+    def variant_for(self, command: str):
+        """StructuredCommand for a command this selector handed out, None for text commands"""
+        return self._variants.get(command)
@@ -3,12 +3,14 @@ Telemetry Widget API - Programmatic Connection Interface
 Provides clean API for external applications to control telemetry connections
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 from typing import Optional, Dict, Any, List
 from PyQt6.QtCore import QObject, pyqtSignal
 import json
 import time
 
+from termtel.termtelwidgets.telemetry_scheduler import TelemetryScheduler, get_shared_scheduler
+
 
 @dataclass
 class DeviceConfig:
@@ -24,6 +26,7 @@ class DeviceConfig:
     auth_timeout: int = 10
     fast_cli: bool = False
     verbose: bool = False
+    poll_interval: int = 30  # seconds between scheduled collection cycles
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -70,6 +73,9 @@ class DeviceConfig:
         if not 5 <= self.auth_timeout <= 60:
             return False, f"Invalid auth timeout: {self.auth_timeout} (must be 5-60 seconds)"
 
+        if not 5 <= self.poll_interval <= 3600:
+            return False, f"Invalid poll interval: {self.poll_interval} (must be 5-3600 seconds)"
+
         return True, "Valid"
 
 
@@ -104,8 +110,8 @@ class TelemetrySnapshot:
     system_logs: Optional[List[str]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary (tables are already record_dict lists, so not deep-copied)"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 class TelemetryWidgetAPI(QObject):
@@ -120,15 +126,17 @@ class TelemetryWidgetAPI(QObject):
     device_discovered = pyqtSignal(str, dict)              # device_id, device_info_dict
     api_error = pyqtSignal(str, str, str)                  # device_id, error_type, message
 
-    def __init__(self, telemetry_widget):
+    def __init__(self, telemetry_widget, scheduler: Optional[TelemetryScheduler] = None):
         """
         Initialize API wrapper around TelemetryWidget
 
         Args:
             telemetry_widget: TelemetryWidget instance to control
+            scheduler: TelemetryScheduler (the process-wide one if not given)
         """
         super().__init__()
         self.widget = telemetry_widget
+        self.scheduler = scheduler or get_shared_scheduler()
         self.device_configs = {}  # device_id -> DeviceConfig
         self.connection_statuses = {}  # device_id -> ConnectionStatus
         self.telemetry_snapshots = {}  # device_id -> TelemetrySnapshot
@@ -182,6 +190,11 @@ class TelemetryWidgetAPI(QObject):
             # Convert to credentials format expected by widget
             credentials = self._config_to_credentials(device_config)
 
+            # Register the device with the shared scheduler instead of a per-device worker thread
+            controller = getattr(self.widget, 'controller', None)
+            if controller is not None and hasattr(controller, 'use_scheduler'):
+                controller.use_scheduler(self.scheduler, device_id, device_config.poll_interval)
+
             # Initiate connection via widget
             success = self.widget.connect_to_device_programmatic(
                 device_config.hostname,
@@ -310,6 +323,11 @@ class TelemetryWidgetAPI(QObject):
             tuple: (success, message)
         """
         try:
+            if device_id is not None and self.scheduler.is_registered(device_id):
+                self.scheduler.set_device_interval(device_id, interval_seconds)
+                self.scheduler.set_polling_enabled(device_id, True)
+                return True, f"Auto-refresh started ({interval_seconds}s interval)"
+
             # For single-device widget, start auto-refresh
             self.widget._toggle_auto_refresh()
             return True, f"Auto-refresh started ({interval_seconds}s interval)"
@@ -353,11 +371,19 @@ class TelemetryWidgetAPI(QObject):
             TelemetrySnapshot or None if not available
         """
         if device_id is None:
-            if self.telemetry_snapshots:
-                return list(self.telemetry_snapshots.values())[0]
-            return None
-
-        return self.telemetry_snapshots.get(device_id)
+            if not self.telemetry_snapshots:
+                return None
+            snapshot = list(self.telemetry_snapshots.values())[0]
+        else:
+            snapshot = self.telemetry_snapshots.get(device_id)
+
+        if snapshot is not None and hasattr(self.widget, 'get_telemetry_snapshot'):
+            # Tables are converted to dicts here, on request, not on every update
+            tables = self.widget.get_telemetry_snapshot()
+            snapshot.neighbors = tables.get('neighbors')
+            snapshot.arp_table = tables.get('arp_table')
+            snapshot.route_table = tables.get('route_table')
+        return snapshot
 
     def get_all_telemetry_snapshots(self) -> Dict[str, TelemetrySnapshot]:
         """Get all telemetry snapshots"""
@@ -458,6 +484,7 @@ class TelemetryWidgetAPI(QObject):
             "telemetry_snapshots_count": len(self.telemetry_snapshots),
             "telemetry_snapshots_keys": list(self.telemetry_snapshots.keys()),
             "widget_connection_status": getattr(self.widget, 'connection_status', 'unknown'),
+            "scheduler": self.scheduler.get_stats(),
         }
 
     # ===== PRIVATE HELPER METHODS =====
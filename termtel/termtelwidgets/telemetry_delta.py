@@ -0,0 +1,144 @@
+"""
+Per-table change detection for normalized telemetry
+Keeps the previous normalized snapshot per device and table and turns each new
+collection into an added/removed/changed delta, so widgets can patch rows in
+place instead of rebuilding tables that almost never change
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Callable, Tuple, Hashable
+
+
+def route_key(route) -> Tuple[str, str]:
+    """Natural key of a route: prefix + VRF"""
+    return route.network, route.vrf
+
+
+def arp_key(entry) -> Tuple[str, str]:
+    """Natural key of an ARP entry: IP + interface"""
+    return entry.ip_address, entry.interface
+
+
+def neighbor_key(neighbor) -> Tuple[str, str]:
+    """Natural key of a neighbor: local port + remote port"""
+    return neighbor.local_interface, neighbor.neighbor_interface
+
+
+# Table name -> natural key function
+TABLE_KEY_FUNCTIONS: Dict[str, Callable[[Any], Hashable]] = {
+    'routes': route_key,
+    'arp': arp_key,
+    'neighbors': neighbor_key,
+}
+
+
+def keyed_records(records: List[Any], key_func: Callable[[Any], Hashable]) -> List[Tuple[Hashable, Any]]:
+    """
+    Pair each record with a unique key
+
+    Natural keys are not always unique (e.g., one entry per ECMP path), so repeated
+    keys get an occurrence index: (natural_key, 0), (natural_key, 1), ...
+
+    Args:
+        records: Normalized records in table order
+        key_func: Natural key function for the table
+
+    Returns:
+        List of (key, record) in the same order as records
+    """
+    seen: Dict[Hashable, int] = {}
+    keyed = []
+    for record in records:
+        natural = key_func(record)
+        occurrence = seen.get(natural, 0)
+        seen[natural] = occurrence + 1
+        keyed.append(((natural, occurrence), record))
+    return keyed
+
+
+@dataclass
+class TableDelta:
+    """Changes to one normalized table between two collection cycles"""
+    device_id: str
+    table: str
+    records: List[Any]  # Full current table, in collection order
+    keys: List[Hashable]  # Unique key of each record, aligned with records
+    added: List[Tuple[Hashable, Any]] = field(default_factory=list)
+    removed: List[Tuple[Hashable, Any]] = field(default_factory=list)
+    changed: List[Tuple[Hashable, Any]] = field(default_factory=list)  # (key, new record)
+    full: bool = False  # No previous snapshot: consumers should rebuild
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed since the previous cycle"""
+        return not (self.full or self.added or self.removed or self.changed)
+
+    @property
+    def change_count(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+
+class TelemetrySnapshotStore:
+    """
+    Previous normalized snapshot per (device, table)
+    Thread-safe: deltas are computed on worker/parse threads
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[Tuple[str, str], Dict[Hashable, Any]] = {}
+        self._lock = threading.Lock()
+
+    def diff(self, device_id: str, table: str, records: List[Any]) -> TableDelta:
+        """
+        Compare records with the previous snapshot and store them as the new one
+
+        Args:
+            device_id: Device identifier (e.g., 'ip:port')
+            table: Table name, one of TABLE_KEY_FUNCTIONS
+            records: Normalized records from this cycle
+
+        Returns:
+            TableDelta against the previous snapshot
+        """
+        keyed = keyed_records(records, TABLE_KEY_FUNCTIONS[table])
+        current = dict(keyed)
+        delta = TableDelta(
+            device_id=device_id,
+            table=table,
+            records=records,
+            keys=[key for key, _ in keyed]
+        )
+
+        with self._lock:
+            previous = self._snapshots.get((device_id, table))
+            self._snapshots[(device_id, table)] = current
+
+        if previous is None:
+            delta.full = True
+            delta.added = keyed
+            return delta
+
+        for key, record in keyed:
+            old = previous.get(key)
+            if old is None:
+                delta.added.append((key, record))
+            elif old != record:
+                delta.changed.append((key, record))
+
+        delta.removed = [(key, record) for key, record in previous.items() if key not in current]
+        return delta
+
+    def has(self, device_id: str, table: str) -> bool:
+        """Check if a table has a snapshot (i.e. the next diff is not a full one)"""
+        with self._lock:
+            return (device_id, table) in self._snapshots
+
+    def reset(self, device_id: str = None):
+        """Forget snapshots for a device (or all devices), the next diff is a full one"""
+        with self._lock:
+            if device_id is None:
+                self._snapshots.clear()
+            else:
+                for key in [k for k in self._snapshots if k[0] == device_id]:
+                    del self._snapshots[key]
@@ -0,0 +1,291 @@
+"""
+Central telemetry scheduler
+Multiplexes many monitored devices onto a bounded thread pool instead of one
+QThread + event loop + QTimer per device
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any
+
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
+
+
+@dataclass
+class ScheduledDevice:
+    """Scheduling state for one registered device"""
+    device_id: str
+    collector: Any  # object with run_scheduled_cycle() / stop_scheduled()
+    platform: str = ""
+    interval_seconds: float = 30.0
+    polling_enabled: bool = True
+    next_due: float = 0.0
+    running: bool = False
+    stop_requested: bool = False  # unregistered mid-cycle, stop the collector when the cycle ends
+    immediate_requested: bool = False
+    cycles_completed: int = 0
+    cycles_skipped: int = 0
+    last_duration: float = 0.0
+    last_error: str = ""
+
+
+class TelemetryScheduler(QObject):
+    """
+    Runs collection cycles for registered devices on a shared worker pool
+
+    - per-device intervals, first cycle jittered so registrations do not fire together
+    - max_workers bounds the total number of cycles in flight
+    - platform_limits bounds cycles in flight per platform
+    - backpressure: a device whose previous cycle is still running skips its slot
+    """
+
+    device_cycle_started = pyqtSignal(str)  # device_id
+    device_cycle_finished = pyqtSignal(str, float)  # device_id, duration_seconds
+    device_cycle_skipped = pyqtSignal(str, str)  # device_id, reason
+    device_cycle_failed = pyqtSignal(str, str)  # device_id, error_message
+
+    def __init__(self, max_workers: int = 16, default_platform_limit: Optional[int] = None,
+                 start_jitter_seconds: float = 5.0, tick_ms: int = 250, parent=None):
+        super().__init__(parent)
+        self.max_workers = max_workers
+        self.default_platform_limit = default_platform_limit or max_workers
+        self.platform_limits: Dict[str, int] = {}
+        self.start_jitter_seconds = start_jitter_seconds
+
+        self._devices: Dict[str, ScheduledDevice] = {}
+        self._platform_running: Dict[str, int] = {}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="telemetry-poll")
+
+        self._tick_timer = QTimer(self)
+        self._tick_timer.timeout.connect(self._dispatch_due_devices)
+        self._tick_timer.start(tick_ms)
+
+    # ===== REGISTRATION =====
+
+    def register_device(self, device_id: str, collector, platform: str = "",
+                        interval_seconds: float = 30.0, polling_enabled: bool = True):
+        """
+        Register a device for scheduled collection
+
+        The first cycle runs within start_jitter_seconds of registration; later cycles
+        run every interval_seconds while polling is enabled.
+
+        Args:
+            device_id: Unique device identifier
+            collector: Object providing run_scheduled_cycle() and stop_scheduled()
+            platform: Platform name used for per-platform concurrency limits
+            interval_seconds: Polling interval for this device
+            polling_enabled: Whether to keep polling after the first cycle
+        """
+        jitter = random.uniform(0, min(self.start_jitter_seconds, interval_seconds))
+        with self._lock:
+            replaced = self._devices.get(device_id)
+            stop_replaced = replaced is not None and self._request_stop(replaced)
+            if replaced:
+                print(f" Scheduler: replacing registration for {device_id}")
+            self._devices[device_id] = ScheduledDevice(
+                device_id=device_id,
+                collector=collector,
+                platform=platform,
+                interval_seconds=interval_seconds,
+                polling_enabled=polling_enabled,
+                next_due=time.monotonic() + jitter,
+            )
+        if stop_replaced:
+            self._executor.submit(self._stop_collector, replaced)
+        print(f" Scheduler: registered {device_id} ({platform}, every {interval_seconds}s, "
+              f"first cycle in {jitter:.1f}s)")
+
+    def unregister_device(self, device_id: str):
+        """
+        Remove a device and release its collector on the pool
+
+        A collector whose cycle is still running is stopped when that cycle ends,
+        never concurrently with it.
+        """
+        with self._lock:
+            device = self._devices.pop(device_id, None)
+            stop_now = device is not None and self._request_stop(device)
+
+        if device:
+            if stop_now:
+                self._executor.submit(self._stop_collector, device)
+            print(f" Scheduler: unregistered {device_id}")
+
+    def set_device_interval(self, device_id: str, interval_seconds: float):
+        """Change a device's polling interval, effective from its next cycle"""
+        with self._lock:
+            device = self._devices.get(device_id)
+            if device:
+                device.interval_seconds = interval_seconds
+                device.next_due = min(device.next_due, time.monotonic() + interval_seconds)
+
+    def set_polling_enabled(self, device_id: str, enabled: bool):
+        """Pause or resume periodic cycles for a device"""
+        with self._lock:
+            device = self._devices.get(device_id)
+            if device:
+                device.polling_enabled = enabled
+                if enabled:
+                    device.next_due = time.monotonic() + device.interval_seconds
+
+    def request_collection(self, device_id: str):
+        """Run a cycle for the device as soon as capacity allows"""
+        with self._lock:
+            device = self._devices.get(device_id)
+            if device:
+                device.immediate_requested = True
+
+    def set_platform_limit(self, platform: str, max_concurrent: int):
+        """Limit how many cycles may run at once for a platform"""
+        self.platform_limits[platform] = max_concurrent
+
+    def is_registered(self, device_id: str) -> bool:
+        """Check if a device is registered"""
+        return device_id in self._devices
+
+    # ===== DISPATCH =====
+
+    def _dispatch_due_devices(self):
+        """Timer tick: submit every due device that fits within the concurrency limits"""
+        now = time.monotonic()
+        to_submit: List[ScheduledDevice] = []
+        skipped: List[str] = []
+
+        with self._lock:
+            due = [d for d in self._devices.values()
+                   if d.immediate_requested or (d.next_due <= now and (d.polling_enabled or d.cycles_completed == 0))]
+            due.sort(key=lambda d: (not d.immediate_requested, d.next_due))
+
+            for device in due:
+                if device.running:
+                    # Backpressure: previous cycle still running, drop this slot
+                    if not device.immediate_requested:
+                        device.cycles_skipped += 1
+                        device.next_due = now + device.interval_seconds
+                        skipped.append(device.device_id)
+                    continue
+
+                if self._in_flight >= self.max_workers:
+                    break  # Pool saturated, remaining devices stay due for the next tick
+
+                limit = self.platform_limits.get(device.platform, self.default_platform_limit)
+                if self._platform_running.get(device.platform, 0) >= limit:
+                    continue  # Deferred until a cycle for this platform finishes
+
+                device.running = True
+                device.immediate_requested = False
+                device.next_due = now + device.interval_seconds
+                self._in_flight += 1
+                self._platform_running[device.platform] = self._platform_running.get(device.platform, 0) + 1
+                to_submit.append(device)
+
+        for device_id in skipped:
+            self.device_cycle_skipped.emit(device_id, "previous cycle still running")
+
+        for device in to_submit:
+            self.device_cycle_started.emit(device.device_id)
+            self._executor.submit(self._run_device_cycle, device)
+
+    def _run_device_cycle(self, device: ScheduledDevice):
+        """Pool thread: run one collection cycle for a device"""
+        start = time.monotonic()
+        error = ""
+        try:
+            device.collector.run_scheduled_cycle()
+        except Exception as e:
+            error = str(e)
+            print(f" Scheduler: cycle failed for {device.device_id}: {e}")
+
+        duration = time.monotonic() - start
+        with self._lock:
+            device.running = False
+            stop = device.stop_requested
+            device.last_duration = duration
+            device.last_error = error
+            device.cycles_completed += 1
+            self._in_flight -= 1
+            self._platform_running[device.platform] -= 1
+
+        if stop:
+            self._stop_collector(device)
+
+        if error:
+            self.device_cycle_failed.emit(device.device_id, error)
+        else:
+            self.device_cycle_finished.emit(device.device_id, duration)
+
+    @staticmethod
+    def _request_stop(device: ScheduledDevice) -> bool:
+        """
+        Mark a removed device for stopping (caller holds the lock)
+
+        Returns:
+            True if the collector is idle and can be stopped now, False if its
+            running cycle stops it on completion
+        """
+        device.stop_requested = True
+        return not device.running
+
+    def _stop_collector(self, device: ScheduledDevice):
+        """Pool thread: release a collector's resources"""
+        try:
+            device.collector.stop_scheduled()
+        except Exception as e:
+            print(f" Scheduler: error stopping {device.device_id}: {e}")
+
+    # ===== STATUS / SHUTDOWN =====
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics"""
+        with self._lock:
+            return {
+                'registered_devices': len(self._devices),
+                'in_flight': self._in_flight,
+                'max_workers': self.max_workers,
+                'platform_running': dict(self._platform_running),
+                'devices': {
+                    d.device_id: {
+                        'platform': d.platform,
+                        'interval_seconds': d.interval_seconds,
+                        'polling_enabled': d.polling_enabled,
+                        'running': d.running,
+                        'cycles_completed': d.cycles_completed,
+                        'cycles_skipped': d.cycles_skipped,
+                        'last_duration': d.last_duration,
+                        'last_error': d.last_error,
+                    }
+                    for d in self._devices.values()
+                }
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop dispatching and release every collector"""
+        self._tick_timer.stop()
+        with self._lock:
+            idle = [d for d in self._devices.values() if self._request_stop(d)]
+            self._devices.clear()
+
+        for device in idle:
+            self._executor.submit(self._stop_collector, device)
+        self._executor.shutdown(wait=wait)
+
+
+# Shared instance, created on first use (its tick timer needs the Qt application)
+_shared_scheduler: Optional[TelemetryScheduler] = None
+
+
+def get_shared_scheduler() -> TelemetryScheduler:
+    """Scheduler every telemetry controller in the process registers with"""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        _shared_scheduler = TelemetryScheduler()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(lambda: _shared_scheduler.shutdown(wait=False))
+    return _shared_scheduler
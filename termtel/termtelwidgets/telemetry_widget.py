@@ -15,7 +15,9 @@ from termtel.termtelwidgets.enhanced_cpu_widget import PlatformAgnosticCPUWidget
 from termtel.termtelwidgets.enhanced_log_widget import SimplifiedLogWidget
 # Import all telemetry components
 from termtel.termtelwidgets.normalized_widgets import (EnhancedNeighborWidget, ConnectionStatusWidget, FixedRouteWidget)
+from termtel.termtelwidgets.normalized_records import records_to_dicts
 from termtel.termtelwidgets.threaded_telemetry import ThreadedTelemetryController
+from termtel.termtelwidgets.telemetry_scheduler import get_shared_scheduler
 from termtel.termtelwidgets.netmiko_controller import EnhancedPlatformAwareTelemetryController
 
 # Import the Platform Configuration UI from separate file
@@ -236,7 +238,8 @@ class TelemetryWidget(QWidget):
         """Initialize telemetry controller"""
         try:
             original_controller = EnhancedPlatformAwareTelemetryController(self.theme_library)
-            self.controller = ThreadedTelemetryController(original_controller)
+            # Collection cycles run on the process-wide scheduler pool, not a thread per device
+            self.controller = ThreadedTelemetryController(original_controller, scheduler=get_shared_scheduler())
             print(" Telemetry controller initialized")
         except ImportError:
             print("Error: Enhanced controller not available")
@@ -916,8 +919,11 @@ class TelemetryWidget(QWidget):
     def _reload_platform_configurations(self):
         """Reload platform configurations"""
         try:
-            from platform_config_manager import PlatformConfigManager
-            self.controller.platform_config = PlatformConfigManager('config/platforms')
+            # Reloaded in place: the normalizer and connection manager share this instance
+            if not self.controller.platform_config.reload():
+                QMessageBox.warning(self, "Reload Failed",
+                                    "Could not reload platforms.json, keeping the current configuration.")
+                return
             self._update_platform_info()
             self.widget_status_changed.emit("Platform configurations reloaded")
         except Exception as e:
@@ -954,14 +960,23 @@ class TelemetryWidget(QWidget):
 
     # ===== UTILITY METHODS =====
 
-    def _create_telemetry_snapshot(self):
-        """Create current telemetry data snapshot"""
+    def _create_telemetry_snapshot(self, include_tables: bool = False):
+        """
+        Create current telemetry data snapshot
+
+        Args:
+            include_tables: Add the neighbor/ARP/route records the widgets show, as
+                            plain dicts (built on request, not on every update)
+        """
         snapshot = {
             'timestamp': time.time(),
             'connection_status': self.connection_status,
             'last_update': self.last_data_update,
-            # TODO: Add actual telemetry data
         }
+        if include_tables:
+            snapshot['neighbors'] = records_to_dicts(getattr(self.neighbor_widget, '_current_data', None))
+            snapshot['arp_table'] = records_to_dicts(getattr(self.arp_widget, '_current_data', None))
+            snapshot['route_table'] = records_to_dicts(getattr(self.route_widget, '_current_data', None))
         return snapshot
 
     # ===== PUBLIC API METHODS FOR EMBEDDING =====
@@ -986,5 +1001,5 @@ class TelemetryWidget(QWidget):
         self._apply_theme_safe(theme_name)
 
     def get_telemetry_snapshot(self):
-        """Get current telemetry data snapshot"""
-        return self._create_telemetry_snapshot()
\ No newline at end of file
+        """Get current telemetry data snapshot, including the displayed tables"""
+        return self._create_telemetry_snapshot(include_tables=True)
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""
+Process-wide cache of compiled TextFSM templates
+Compiling a template builds the whole regex state machine, so it is done once per
+template version and every parse works on a cheap clone of the compiled FSM
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from io import StringIO
+from typing import Dict, Tuple, Any
+
+try:
+    import textfsm
+
+    TEXTFSM_AVAILABLE = True
+except ImportError:
+    TEXTFSM_AVAILABLE = False
+
+
+def template_content_hash(template_content: str) -> str:
+    """Stable hash of template text, used as the version part of the cache key"""
+    return hashlib.sha1(template_content.encode('utf-8')).hexdigest()
+
+
+def clone_fsm(fsm):
+    """
+    Clone a compiled TextFSM object without re-parsing the template
+
+    States and rules (and their compiled regexes) are never mutated while parsing,
+    so they are shared with the original. Values and their options carry per-parse
+    state (current value, Filldown/List buffers), so those are copied.
+
+    Args:
+        fsm: Compiled textfsm.TextFSM instance
+
+    Returns:
+        Independent TextFSM instance reset to the Start state
+    """
+    clone = copy.copy(fsm)
+    clone.values = []
+    for value in fsm.values:
+        value_copy = copy.copy(value)
+        value_copy.fsm = clone
+        value_copy.options = []
+        for option in value.options:
+            option_copy = copy.copy(option)
+            option_copy.value = value_copy
+            value_copy.options.append(option_copy)
+        clone.values.append(value_copy)
+
+    clone.Reset()
+    return clone
+
+
+class KeyedLocks:
+    """
+    One lock per key, created on demand
+
+    Used to serialize the first load of a template so that concurrent workers
+    wait for a single load instead of all doing the same work.
+    """
+
+    def __init__(self):
+        self._locks: Dict[Any, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def get(self, key) -> threading.Lock:
+        """Get the lock for a key"""
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+
+class CompiledTemplateCache:
+    """
+    LRU cache of compiled TextFSM templates keyed by (template name, content hash)
+
+    A template edited on disk gets a new content hash and therefore a new entry;
+    invalidate() drops every compiled version of a template and bumps its
+    generation so content caches know to reload the file.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._compiled: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._compile_locks = KeyedLocks()
+        self.hits = 0
+        self.misses = 0
+
+    def get_fsm(self, template_name: str, template_content: str):
+        """
+        Get a ready-to-use FSM for the given template text
+
+        Args:
+            template_name: Template filename (e.g., 'cisco_ios_show_version.textfsm')
+            template_content: Template text
+
+        Returns:
+            A fresh clone of the compiled template, safe to ParseText() once
+
+        Raises:
+            textfsm.TextFSMTemplateError: If the template does not compile
+        """
+        key = (template_name, template_content_hash(template_content))
+
+        compiled = self._lookup(key)
+        if compiled is not None:
+            return clone_fsm(compiled)
+
+        # Only one thread compiles a given template version, the rest wait for it
+        with self._compile_locks.get(key):
+            compiled = self._lookup(key)
+            if compiled is None:
+                compiled = textfsm.TextFSM(StringIO(template_content))
+                print(f" Compiled template: {template_name}")
+
+                with self._lock:
+                    self.misses += 1
+                    self._compiled[key] = compiled
+                    while len(self._compiled) > self.max_size:
+                        self._compiled.popitem(last=False)
+
+        return clone_fsm(compiled)
+
+    def _lookup(self, key: Tuple[str, str]):
+        """Return the compiled template for a key and count the hit, or None"""
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._compiled.move_to_end(key)
+                self.hits += 1
+            return compiled
+
+    def invalidate(self, template_name: str):
+        """Drop all compiled versions of a template (e.g., after it was saved)"""
+        with self._lock:
+            for key in [k for k in self._compiled if k[0] == template_name]:
+                del self._compiled[key]
+            self._generations[template_name] = self._generations.get(template_name, 0) + 1
+        print(f" Template cache invalidated: {template_name}")
+
+    def generation(self, template_name: str) -> int:
+        """Current generation of a template, bumped on every invalidate()"""
+        return self._generations.get(template_name, 0)
+
+    def clear(self):
+        """Drop every compiled template"""
+        with self._lock:
+            self._compiled.clear()
+
+    def get_cache_info(self) -> Dict[str, Any]:
+        """Get information about the compiled template cache"""
+        with self._lock:
+            return {
+                'compiled_templates': [name for name, _ in self._compiled],
+                'cache_size': len(self._compiled),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# Global instance
+compiled_template_cache = CompiledTemplateCache()
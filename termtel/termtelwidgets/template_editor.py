@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional, Any
 
 from termtel.termtelwidgets.textfsm_highlighter import TextFSMSyntaxHighlighter
+from termtel.termtelwidgets.template_cache import compiled_template_cache
 
 @dataclass
 class WidgetFieldRequirement:
@@ -1562,6 +1563,9 @@ class WidgetTemplateEditor(QDialog):
             with open(template_path, 'w') as f:
                 f.write(content)
 
+            # Drop the compiled copy so the next poll picks up the new version
+            compiled_template_cache.invalidate(template_filename)
+
             self.current_template_content = content
             self.has_unsaved_changes = False
             self.save_btn.setEnabled(False)
@@ -5,15 +5,20 @@ ENHANCED: Added full SSH key authentication support to worker thread
 """
 
 from PyQt6.QtCore import QThread, QObject, pyqtSignal, QTimer
-from netmiko import ConnectHandler, NetmikoTimeoutException, NetmikoAuthenticationException
+from netmiko import NetmikoTimeoutException, NetmikoAuthenticationException
 import time
 import threading
 import os
 from dataclasses import dataclass
 from typing import Optional, List, Dict
 from pathlib import Path
-from termtel.termtelwidgets.netmiko_controller import DeviceInfo, LocalTemplateParser, \
-    RawCommandOutput, NormalizedSystemMetrics
+from concurrent.futures import wait
+from termtel.termtelwidgets.netmiko_controller import DeviceInfo, shared_template_parser, \
+    RawCommandOutput, NormalizedSystemMetrics, get_parse_executor, connect_brokered, disconnect_brokered
+from termtel.termtelwidgets.normalized_records import ParsedTable
+from termtel.termtelwidgets.streaming_parser import stream_command
+from termtel.termtelwidgets.structured_output import StructuredCommandSelector, parse_structured_output
+from termtel.termtelwidgets.telemetry_delta import TelemetrySnapshotStore, TABLE_KEY_FUNCTIONS
 
 
 @dataclass
@@ -45,17 +50,37 @@ class TelemetryWorkerThread(QThread):
     data_collected = pyqtSignal(str, object, object, object)  # data_type, raw_output, parsed_data, normalized_data
     collection_cycle_complete = pyqtSignal()
     collection_error = pyqtSignal(str, str)  # data_type, error_message
+    table_delta_ready = pyqtSignal(str, object)  # data_type, TableDelta
+    rows_streamed = pyqtSignal(str, list, bool)  # data_type, normalized records, first batch
+
+    # Tables whose first collection is parsed while the command runs, so their widgets
+    # fill in batches instead of waiting for the whole output (later cycles send deltas)
+    STREAMED_TABLES = ('arp', 'routes')
+    STREAM_BATCH_INTERVAL = 0.25  # seconds between streamed batches
 
     # Status signals
     status_update = pyqtSignal(str)  # status message
 
-    def __init__(self, connection_config: ConnectionConfig, platform_config, field_normalizer):
+    def __init__(self, connection_config: ConnectionConfig, platform_config, field_normalizer,
+                 pipelined: bool = True, streaming: bool = True, structured: bool = True):
         super().__init__()
 
         self.connection_config = connection_config
         self.platform_config = platform_config
         self.field_normalizer = field_normalizer
 
+        # Pipelined mode parses/normalizes on the shared parse pool while the next
+        # command runs; sequential mode does everything inline on this thread
+        self.pipelined = pipelined
+        self.streaming = streaming
+
+        # JSON variants of commands (platforms.json 'structured') replace template parsing
+        self.structured_commands = StructuredCommandSelector(platform_config, enabled=structured)
+
+        # Previous normalized tables, diffed off the UI thread
+        self.snapshots = TelemetrySnapshotStore()
+        self.device_id = f"{connection_config.ip_address}:{connection_config.port}"
+
         # Worker thread owns these
         self.connection = None
         self.device_info = None
@@ -241,8 +266,9 @@ class TelemetryWorkerThread(QThread):
             else:
                 print(f"  Auth method: Password")
 
-            # Create connection in THIS thread
-            self.connection = ConnectHandler(**connection_params)
+            # Create connection in THIS thread, reusing a terminal tab's login when there is one
+            self.connection = connect_brokered(connection_params, self.connection_config.ip_address,
+                                               self.connection_config.port, self.connection_config.username)
 
             # Test connection
             test_command = self._get_test_command(device_type)
@@ -385,18 +411,16 @@ class TelemetryWorkerThread(QThread):
         try:
             print(" Attempting to parse system info...")
 
-            template_info = self.platform_config.get_template_info(
+            parser_key = self.platform_config.get_parser_key(
                 self.connection_config.platform, 'system_info'
             )
 
-            if template_info:
-                template_platform, template_file = template_info
-                template_command = template_file.replace('.textfsm', '').replace(f'{template_platform}_', '')
+            if parser_key:
+                template_platform, template_command = parser_key
 
                 print(f" Using template: {template_platform} / {template_command}")
 
-                parser = LocalTemplateParser()
-                parsed_data = parser.parse(template_platform, template_command, output)
+                parsed_data = shared_template_parser.parse(template_platform, template_command, output)
 
                 print(f" Template parsing result: {parsed_data}")
                 return parsed_data
@@ -428,26 +452,53 @@ class TelemetryWorkerThread(QThread):
             ("logs", "logs", {}),
         ]
 
+        pending = []
         for data_type, command_type, kwargs in telemetry_tasks:
             if self.should_stop:
                 break
 
             try:
-                self._collect_single_telemetry(data_type, command_type, kwargs)
+                if (self.streaming and data_type in self.STREAMED_TABLES
+                        and not self.snapshots.has(self.device_id, data_type)
+                        and self._stream_telemetry_command(data_type, command_type, kwargs)):
+                    continue
+
+                executed = self._execute_telemetry_command(data_type, command_type, kwargs)
+                if not executed:
+                    continue
+
+                command, output = executed
+                if self.pipelined:
+                    # Parse this output on the pool while the next command is on the wire
+                    pending.append(get_parse_executor().submit(
+                        self._process_telemetry_output, data_type, command_type, command, output
+                    ))
+                else:
+                    self._process_telemetry_output(data_type, command_type, command, output)
 
-                # Small delay between commands
-                self.msleep(200)
+                    # Small delay between commands
+                    self.msleep(200)
 
             except Exception as e:
                 print(f" Error collecting {data_type}: {e}")
                 self.collection_error.emit(data_type, str(e))
 
+        # Cycle is complete only once every parse stage has emitted its data
+        wait(pending)
+
         self.status_update.emit("Collection complete")
         self.collection_cycle_complete.emit()
         print(f" Worker telemetry collection cycle complete")
 
     def _collect_single_telemetry(self, data_type: str, command_type: str, kwargs: Dict):
         """Collect single telemetry data type - FIXED VERSION"""
+        executed = self._execute_telemetry_command(data_type, command_type, kwargs)
+        if executed:
+            command, output = executed
+            self._process_telemetry_output(data_type, command_type, command, output)
+
+    def _execute_telemetry_command(self, data_type: str, command_type: str, kwargs: Dict) -> Optional[tuple]:
+        """Execute stage: run the command on the worker's connection, returns (command, output) or None"""
 
         # === ENHANCED DEBUG FOR LOGS ===
         if data_type == "logs":
@@ -470,7 +521,17 @@ class TelemetryWorkerThread(QThread):
             print(f" No command configured for {command_type}")
             if data_type == "logs":
                 print(f" LOGS: Command lookup failed - '{command}'")
-            return
+            return None
+
+        # Structured variant first: decoded JSON instead of template parsing
+        structured_command = self.structured_commands.command_for(
+            self.connection_config.platform, command_type, **kwargs
+        )
+        if structured_command:
+            print(f" Worker executing (structured): {structured_command}")
+            output = self.connection.send_command(structured_command, read_timeout=30)
+            if self.structured_commands.accept(self.connection_config.platform, command_type, output):
+                return structured_command, output
 
         # Execute command using worker's connection
         print(f" Worker executing: {command}")
@@ -487,25 +548,38 @@ class TelemetryWorkerThread(QThread):
             print(f" First 200 chars: {output[:200]}")
             print(f" === END _collect_single_telemetry LOGS DEBUG ===\n")
 
-        # Parse output
-        if command_type == 'logs':
-            print(f" Logs: Skipping template parsing, using raw output")
-            parsed_data = None  # Skip parsing for logs
-            normalized_data = None  # Skip normalization for logs
-        else:
-            # Parse output for other data types
-            parsed_data = self._parse_output(command_type, output)
-
-            # FIXED: Create proper normalized data for CPU/memory
-            normalized_data = None
-            if parsed_data:
-                if command_type == 'cpu_utilization':
-                    normalized_data = self._create_system_metrics_from_cpu(parsed_data)
-                elif command_type == 'memory_utilization':
-                    normalized_data = self._create_system_metrics_from_memory(parsed_data)
-                else:
-                    normalized_data = self._normalize_data(command_type, parsed_data)
+        return command, output
+
+    def _process_telemetry_output(self, data_type: str, command_type: str, command: str, output: str):
+        """Parse/normalize stage: runs inline or on the parse pool, emits the result to the main thread"""
+        try:
+            # Parse output
+            if command_type == 'logs':
+                print(f" Logs: Skipping template parsing, using raw output")
+                parsed_data = None  # Skip parsing for logs
+                normalized_data = None  # Skip normalization for logs
+            else:
+                # Parse output for other data types
+                parsed_data = self._parse_output(command_type, output, command)
+
+                # FIXED: Create proper normalized data for CPU/memory
+                normalized_data = None
+                if parsed_data:
+                    if command_type == 'cpu_utilization':
+                        normalized_data = self._create_system_metrics_from_cpu(parsed_data)
+                    elif command_type == 'memory_utilization':
+                        normalized_data = self._create_system_metrics_from_memory(parsed_data)
+                    else:
+                        normalized_data = self._normalize_data(command_type, parsed_data)
+
+            self._emit_telemetry(data_type, command, output, parsed_data, normalized_data)
 
+        except Exception as e:
+            print(f" Error processing {data_type}: {e}")
+            self.collection_error.emit(data_type, str(e))
+
+    def _emit_telemetry(self, data_type: str, command: str, output: str, parsed_data, normalized_data):
+        """Send one command's results to the main thread (and its delta for table widgets)"""
         # Create raw output object
         raw_output = RawCommandOutput(
             command=command,
@@ -518,8 +592,82 @@ class TelemetryWorkerThread(QThread):
 
         # Emit to main thread
         self.data_collected.emit(data_type, raw_output, parsed_data, normalized_data)
+        if data_type in TABLE_KEY_FUNCTIONS and normalized_data:
+            self.table_delta_ready.emit(
+                data_type, self.snapshots.diff(self.device_id, data_type, normalized_data)
+            )
         print(f" Worker completed {data_type}")
 
+    def _stream_telemetry_command(self, data_type: str, command_type: str, kwargs: Dict) -> bool:
+        """
+        Execute a table command and parse its output as it arrives, emitting normalized
+        batches (rows_streamed) before the full result
+
+        Returns:
+            False if the command/template is not available for streaming (use the normal path)
+        """
+        command = self.platform_config.format_command(
+            self.connection_config.platform, command_type, **kwargs
+        )
+        parser_key = self.platform_config.get_parser_key(self.connection_config.platform, command_type)
+        if command.startswith("#") or not parser_key:
+            return False
+        if self.structured_commands.command_for(self.connection_config.platform, command_type, **kwargs):
+            return False  # the JSON variant is parsed faster in one piece
+
+        parser = shared_template_parser.open_stream(*parser_key)
+        if parser is None:
+            return False
+
+        rows = []
+        records = []
+        normalized_upto = 0
+        last_batch = time.monotonic()
+        failure = None
+
+        def normalize_pending():
+            nonlocal normalized_upto
+            batch = rows[normalized_upto:]
+            normalized_upto = len(rows)
+            if not batch:
+                return []
+            return self._normalize_data(command_type, ParsedTable(parser.header, batch)) or []
+
+        def on_text(text):
+            nonlocal last_batch, failure
+            if failure is not None:
+                return
+            try:
+                rows.extend(parser.feed(text))
+            except Exception as e:
+                # Keep reading so the raw output still reaches the widget
+                failure = e
+                return
+            if time.monotonic() - last_batch >= self.STREAM_BATCH_INTERVAL and len(rows) > normalized_upto:
+                batch = normalize_pending()
+                if batch:
+                    self.rows_streamed.emit(data_type, batch, not records)
+                    records.extend(batch)
+                last_batch = time.monotonic()
+
+        print(f" Worker streaming: {command}")
+        output = stream_command(self.connection, command, on_text, read_timeout=30)
+
+        if failure is None:
+            try:
+                rows.extend(parser.finish())
+            except Exception as e:
+                failure = e
+        if failure is not None:
+            print(f" Streaming parse failed for {data_type}: {failure}")
+            self._emit_telemetry(data_type, command, output, None, None)
+            return True
+
+        records.extend(normalize_pending())
+        print(f" Streamed {len(rows)} {data_type} rows ({len(records)} normalized)")
+        self._emit_telemetry(data_type, command, output, ParsedTable(parser.header, rows), records)
+        return True
+
     def _create_system_metrics_from_cpu(self, parsed_data):
         """Create NormalizedSystemMetrics from CPU data"""
         if not parsed_data:
@@ -634,21 +782,22 @@ class TelemetryWorkerThread(QThread):
             print(f" Error creating memory metrics: {e}")
             return None
 
-    def _parse_output(self, command_type: str, output: str):
-        """Parse command output using templates"""
+    def _parse_output(self, command_type: str, output: str, command: str = ""):
+        """Parse command output using templates (or its field map, for a structured command)"""
         try:
-            template_info = self.platform_config.get_template_info(
+            structured = self.structured_commands.variant_for(command)
+            if structured is not None:
+                return parse_structured_output(output, structured)
+
+            parser_key = self.platform_config.get_parser_key(
                 self.connection_config.platform, command_type
             )
 
-            if not template_info:
+            if not parser_key:
                 return None
 
-            template_platform, template_file = template_info
-            template_command = template_file.replace('.textfsm', '').replace(f'{template_platform}_', '')
-
-            parser = LocalTemplateParser()
-            return parser.parse(template_platform, template_command, output)
+            template_platform, template_command = parser_key
+            return shared_template_parser.parse(template_platform, template_command, output)
 
         except Exception as e:
             print(f" Worker parsing error: {e}")
@@ -708,7 +857,7 @@ class TelemetryWorkerThread(QThread):
 
         if self.connection:
             try:
-                self.connection.disconnect()
+                disconnect_brokered(self.connection)
                 print(f" Worker connection cleaned up")
             except:
                 pass
@@ -740,6 +889,28 @@ class TelemetryWorkerThread(QThread):
         self.auto_collect = False
         self.quit()
 
+    # Scheduler collector interface (worker is driven by TelemetryScheduler instead of run())
+    def run_scheduled_cycle(self):
+        """Connect on first use, then collect one cycle on the calling pool thread"""
+        if self.should_stop:
+            return
+
+        if not self.is_connected:
+            if not self._establish_connection():
+                raise ConnectionError(f"Could not connect to {self.connection_config.ip_address}")
+            if self.should_stop:
+                # Stopped while the login was in progress: nothing else owns this session
+                self._cleanup_connection()
+                return
+
+        self._collect_telemetry_cycle()
+
+    def stop_scheduled(self):
+        """Release the connection of a scheduler-driven worker"""
+        self.should_stop = True
+        self.auto_collect = False
+        self._cleanup_connection()
+
 
 class ThreadedTelemetryController(QObject):
     """
@@ -764,10 +935,18 @@ class ThreadedTelemetryController(QObject):
     normalized_system_ready = pyqtSignal(object)
     normalized_system_metrics_ready = pyqtSignal(object)
 
+    neighbors_delta_ready = pyqtSignal(object)  # TableDelta
+    arp_delta_ready = pyqtSignal(object)  # TableDelta
+    routes_delta_ready = pyqtSignal(object)  # TableDelta
+
+    # Batches of a table's first collection, while the command is still running
+    arp_rows_streamed = pyqtSignal(list, bool)  # records, first batch
+    routes_rows_streamed = pyqtSignal(list, bool)  # records, first batch
+
     device_info_updated = pyqtSignal(object)
     theme_changed = pyqtSignal(str)
 
-    def __init__(self, original_controller):
+    def __init__(self, original_controller, scheduler=None):
         super().__init__()
         self.connection_hostname = ""
         self.connection_ip = ""
@@ -776,6 +955,12 @@ class ThreadedTelemetryController(QObject):
         self.is_connected = False
         self.device_info = None
 
+        # Optional TelemetryScheduler: when set, the worker is driven by the shared
+        # pool instead of running its own thread and timer
+        self.scheduler = scheduler
+        self.scheduled_device_id = None
+        self.poll_interval = 30
+
         # Replace the timer behavior
         self.data_collection_timer = QTimer()
         self.data_collection_timer.timeout.connect(self.collect_telemetry_data)
@@ -789,6 +974,7 @@ class ThreadedTelemetryController(QObject):
         self.connection_ip = ip_address
 
         # Stop any existing worker
+        self._stop_scheduled_device()
         if self.worker_thread and self.worker_thread.isRunning():
             print(" Stopping existing worker...")
             self.worker_thread.stop_worker()
@@ -819,11 +1005,38 @@ class ThreadedTelemetryController(QObject):
         self.worker_thread.connection_established.connect(self._on_connection_established)
         self.worker_thread.connection_failed.connect(self._on_connection_failed)
         self.worker_thread.data_collected.connect(self._on_data_collected)
+        self.worker_thread.table_delta_ready.connect(self._on_table_delta)
+        self.worker_thread.rows_streamed.connect(self._on_rows_streamed)
+
+        if self.scheduler:
+            # Shared pool: connection and collection cycles run as scheduler jobs
+            self.scheduled_device_id = self.scheduled_device_id or f"{hostname}_{ip_address}"
+            self.scheduler.register_device(
+                self.scheduled_device_id,
+                self.worker_thread,
+                platform=platform,
+                interval_seconds=self.poll_interval,
+                polling_enabled=self.worker_thread.auto_collect
+            )
+            return True
 
         # Start worker thread
         self.worker_thread.start()
         return True
 
+    def use_scheduler(self, scheduler, device_id: Optional[str] = None, interval_seconds: int = 30):
+        """Drive subsequent connections through a TelemetryScheduler"""
+        self.scheduler = scheduler
+        self.scheduled_device_id = device_id
+        self.poll_interval = interval_seconds
+
+    def _stop_scheduled_device(self):
+        """Unregister the current worker from the scheduler, if it was scheduled"""
+        if self.scheduler and self.worker_thread:
+            self.worker_thread.should_stop = True  # a running cycle ends after its current command
+        if self.scheduler and self.scheduled_device_id and self.scheduler.is_registered(self.scheduled_device_id):
+            self.scheduler.unregister_device(self.scheduled_device_id)
+
     def _on_connection_established(self, device_info):
         """Handle successful connection from worker"""
         print(f" Worker connection established")
@@ -889,6 +1102,22 @@ class ThreadedTelemetryController(QObject):
         elif data_type == "logs":
             self.raw_log_output.emit(raw_output)
 
+    def _on_table_delta(self, data_type: str, delta):
+        """Forward a table delta from the worker"""
+        if data_type == "neighbors":
+            self.neighbors_delta_ready.emit(delta)
+        elif data_type == "arp":
+            self.arp_delta_ready.emit(delta)
+        elif data_type == "routes":
+            self.routes_delta_ready.emit(delta)
+
+    def _on_rows_streamed(self, data_type: str, records: list, first_batch: bool):
+        """Forward a streamed batch from the worker"""
+        if data_type == "arp":
+            self.arp_rows_streamed.emit(records, first_batch)
+        elif data_type == "routes":
+            self.routes_rows_streamed.emit(records, first_batch)
+
     def _on_collection_complete(self):
         """Handle completion of collection cycle"""
         print(f" Worker collection cycle complete")
@@ -899,7 +1128,10 @@ class ThreadedTelemetryController(QObject):
 
     def collect_telemetry_data(self):
         """Request telemetry collection from worker"""
-        if self.worker_thread and self.worker_thread.is_connected:
+        if self.scheduler and self.scheduled_device_id and self.scheduler.is_registered(self.scheduled_device_id):
+            print(f" Requesting immediate collection from scheduler")
+            self.scheduler.request_collection(self.scheduled_device_id)
+        elif self.worker_thread and self.worker_thread.is_connected:
             print(f" Requesting immediate collection from worker")
             self.worker_thread.request_immediate_collection()
         else:
@@ -907,6 +1139,7 @@ class ThreadedTelemetryController(QObject):
 
     def disconnect_from_device(self):
         """Disconnect from device"""
+        self._stop_scheduled_device()
         if self.worker_thread and self.worker_thread.isRunning():
             print(f" Disconnecting worker thread")
             self.worker_thread.stop_worker()
@@ -916,14 +1149,25 @@ class ThreadedTelemetryController(QObject):
         if self.device_info:
             self.connection_status_changed.emit(self.device_info.ip_address, "disconnected")
 
+    def cleanup(self):
+        """Release the worker (and its scheduler registration) when the widget closes"""
+        self.disconnect_from_device()
+
     def start_auto_refresh(self, interval_seconds: int = 30):
         """Start auto-refresh using worker thread"""
-        if self.worker_thread:
+        if self.scheduler and self.scheduled_device_id and self.scheduler.is_registered(self.scheduled_device_id):
+            self.worker_thread.auto_collect = True
+            self.scheduler.set_device_interval(self.scheduled_device_id, interval_seconds)
+            self.scheduler.set_polling_enabled(self.scheduled_device_id, True)
+        elif self.worker_thread:
             self.worker_thread.start_auto_collection(interval_seconds)
 
     def stop_auto_refresh(self):
         """Stop auto-refresh"""
-        if self.worker_thread:
+        if self.scheduler and self.scheduled_device_id and self.scheduler.is_registered(self.scheduled_device_id):
+            self.worker_thread.auto_collect = False
+            self.scheduler.set_polling_enabled(self.scheduled_device_id, False)
+        elif self.worker_thread:
             self.worker_thread.stop_auto_collection()
 
     def __getattr__(self, name):
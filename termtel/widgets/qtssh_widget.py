@@ -86,8 +86,8 @@ class Ui_Terminal(QWidget):
         self.page = self.view.page()
         self.view.resizeEvent = self.handle_resize_event
         self.view.loadFinished.connect(self.handle_load_finished)
-        self.backend.send_output.connect(
-            lambda data: self.view.page().runJavaScript(f"window.handle_output({json.dumps(data)})"))
+        # Output reaches xterm.js through the web channel (backend.output_batch), with
+        # write-callback acknowledgements pacing the SSH reader
 
         base_dir = os.path.dirname(os.path.abspath(__file__))
         if self.mode == "standalone":
@@ -148,50 +148,8 @@ class Ui_Terminal(QWidget):
         new_size = QSize(current_size.width(), current_size.height() + 1)
         self.view.resize(new_size)
         print("loaded..")
-
-        # Wait for xterm.js to initialize before writing initial buffer
-        self.view.page().runJavaScript(
-            "typeof term !== 'undefined'",
-            lambda result: self.check_terminal_ready()
-        )
-
-    def check_terminal_ready(self):
-        """
-        Check if the terminal is ready, retry if not.
-        """
-        try:
-            self.view.page().runJavaScript(
-                "typeof term !== 'undefined' && term !== null",
-                self.handle_terminal_check
-            )
-        except Exception as e:
-            print(f"Error checking terminal readiness: {e}")
-
-    def handle_terminal_check(self, is_ready):
-        """
-        Handle the terminal readiness check result.
-        """
-        if is_ready:
-            self.write_initial_buffer()
-        else:
-            # Retry after a short delay
-            QTimer.singleShot(100, self.check_terminal_ready)
-
-    def write_initial_buffer(self):
-        """
-        Write the initial buffer to the terminal once it's ready.
-        """
-        try:
-            if hasattr(self, 'initial_buffer'):
-                print("Writing initial buffer to terminal...")
-                # Escape special characters to prevent JS injection
-                banner = json.dumps(self.initial_buffer)
-                self.view.page().runJavaScript(
-                    f"if (term) {{ term.write({banner}); }}",
-                    lambda result: print("Initial buffer written to terminal")
-                )
-        except Exception as e:
-            print(f"Error writing initial buffer: {e}")
+        # No initial buffer replay needed: the backend holds all output (banner included)
+        # until the page attaches to the output stream
     # def handle_load_finished(self):
     #     """
     #     Handles actions after the web page load has finished.
@@ -259,8 +217,8 @@ class Ui_Terminal(QWidget):
             # Disconnect backend if it exists
             if hasattr(self, 'backend'):
                 try:
-                    # Try to close the SSH connection if possible
-                    # self.backend.send_input("exit\n")
+                    # Stop the reader thread (bounded wait) and close the SSH connection
+                    self.backend.close()
                     self.backend.disconnect()
                 except Exception as e:
                     print(f"Backend cleanup error: {e}")
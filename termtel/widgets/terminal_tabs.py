@@ -592,6 +592,13 @@ class TerminalTabWidget(QTabWidget):
     def cleanup_all(self):
         """Clean up all terminals on application exit."""
         try:
+            # Signal every shell reader first so they wind down in parallel; each
+            # close_tab then only waits for a thread that is already exiting
+            for terminal in self.findChildren(Ui_Terminal):
+                backend = getattr(terminal, 'backend', None)
+                if backend is not None and hasattr(backend, 'request_stop'):
+                    backend.request_stop()
+
             self.close_all_tabs()
             self.sessions.clear()
         except Exception as e: